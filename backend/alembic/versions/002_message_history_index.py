@@ -0,0 +1,23 @@
+"""Add composite index for message history pagination
+
+Revision ID: 002_message_history_index
+Revises: 001_initial
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '002_message_history_index'
+down_revision = '001_initial'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_messages_meeting_id_timestamp', 'messages', ['meeting_id', 'timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_messages_meeting_id_timestamp', table_name='messages')
@@ -0,0 +1,44 @@
+"""Add crew job queue table
+
+Revision ID: 003_crew_jobs
+Revises: 002_message_history_index
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '003_crew_jobs'
+down_revision = '002_message_history_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('crew_jobs',
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('meeting_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('employee_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('worker_id', sa.String(length=100), nullable=True),
+    sa.Column('message_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.ForeignKeyConstraint(['message_id'], ['messages.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_crew_jobs_id'), 'crew_jobs', ['id'], unique=False)
+    op.create_index('ix_crew_jobs_status_created_at', 'crew_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_crew_jobs_status_created_at', table_name='crew_jobs')
+    op.drop_index(op.f('ix_crew_jobs_id'), table_name='crew_jobs')
+    op.drop_table('crew_jobs')
@@ -0,0 +1,83 @@
+"""Replace meetings.employee_ids with a meeting_participants table
+
+Revision ID: 004_meeting_participants
+Revises: 003_crew_jobs
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+import uuid
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '004_meeting_participants'
+down_revision = '003_crew_jobs'
+branch_labels = None
+depends_on = None
+
+meetings = sa.table('meetings',
+    sa.column('id', postgresql.UUID(as_uuid=True)),
+    sa.column('employee_ids', sa.JSON())
+)
+employees = sa.table('employees',
+    sa.column('id', postgresql.UUID(as_uuid=True))
+)
+meeting_participants = sa.table('meeting_participants',
+    sa.column('meeting_id', postgresql.UUID(as_uuid=True)),
+    sa.column('employee_id', postgresql.UUID(as_uuid=True)),
+    sa.column('position', sa.Integer())
+)
+
+
+def upgrade() -> None:
+    op.create_table('meeting_participants',
+    sa.Column('meeting_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('employee_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.PrimaryKeyConstraint('meeting_id', 'employee_id')
+    )
+    op.create_index('ix_meeting_participants_employee_id', 'meeting_participants', ['employee_id'], unique=False)
+
+    # Backfill from the JSON column, skipping IDs that never matched an employee
+    conn = op.get_bind()
+    existing = {row.id for row in conn.execute(sa.select(employees.c.id))}
+    rows = []
+    for meeting in conn.execute(sa.select(meetings.c.id, meetings.c.employee_ids)):
+        seen = set()
+        for emp_id in meeting.employee_ids or []:
+            try:
+                emp_uuid = uuid.UUID(str(emp_id))
+            except ValueError:
+                continue
+            if emp_uuid in existing and emp_uuid not in seen:
+                seen.add(emp_uuid)
+                rows.append({'meeting_id': meeting.id, 'employee_id': emp_uuid, 'position': len(seen) - 1})
+    if rows:
+        op.bulk_insert(meeting_participants, rows)
+
+    op.drop_column('meetings', 'employee_ids')
+
+
+def downgrade() -> None:
+    op.add_column('meetings', sa.Column('employee_ids', sa.JSON(), nullable=True))
+
+    conn = op.get_bind()
+    employee_ids = {}
+    for row in conn.execute(
+        sa.select(meeting_participants.c.meeting_id, meeting_participants.c.employee_id)
+        .order_by(meeting_participants.c.meeting_id, meeting_participants.c.position)
+    ):
+        employee_ids.setdefault(row.meeting_id, []).append(str(row.employee_id))
+    for meeting in conn.execute(sa.select(meetings.c.id)):
+        conn.execute(
+            meetings.update().where(meetings.c.id == meeting.id)
+            .values(employee_ids=employee_ids.get(meeting.id, []))
+        )
+
+    op.alter_column('meetings', 'employee_ids', nullable=False)
+    op.drop_index('ix_meeting_participants_employee_id', table_name='meeting_participants')
+    op.drop_table('meeting_participants')
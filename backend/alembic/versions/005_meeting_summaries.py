@@ -0,0 +1,33 @@
+"""Add rolling meeting summaries table
+
+Revision ID: 005_meeting_summaries
+Revises: 004_meeting_participants
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '005_meeting_summaries'
+down_revision = '004_meeting_participants'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('meeting_summaries',
+    sa.Column('meeting_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('last_message_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('message_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['meeting_id'], ['meetings.id'], ),
+    sa.ForeignKeyConstraint(['last_message_id'], ['messages.id'], ),
+    sa.PrimaryKeyConstraint('meeting_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('meeting_summaries')
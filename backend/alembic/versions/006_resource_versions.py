@@ -0,0 +1,28 @@
+"""Add resource version counters for conditional GETs
+
+Revision ID: 006_resource_versions
+Revises: 005_meeting_summaries
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006_resource_versions'
+down_revision = '005_meeting_summaries'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('resource_versions',
+    sa.Column('key', sa.String(length=100), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('resource_versions')
@@ -0,0 +1,27 @@
+"""Add crew job lease heartbeats and retry times
+
+Revision ID: 007_crew_job_leases
+Revises: 006_resource_versions
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_crew_job_leases'
+down_revision = '006_resource_versions'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('crew_jobs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('crew_jobs', sa.Column('available_at', sa.DateTime(timezone=True), nullable=True))
+    # Running jobs claimed before this migration hold their lease from when they started
+    op.execute("UPDATE crew_jobs SET heartbeat_at = started_at WHERE status = 'running'")
+
+
+def downgrade() -> None:
+    op.drop_column('crew_jobs', 'available_at')
+    op.drop_column('crew_jobs', 'heartbeat_at')
@@ -0,0 +1,82 @@
+"""
+Conditional GET support (ETag / Last-Modified) backed by resource version counters.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.repositories import VersionRepository
+from app.responses import ORJSONResponse
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison against an If-None-Match list, as GET requires."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+async def conditional_json(
+    request: Request, keys: List[str], db: AsyncSession, load: Callable[[], Awaitable[Any]],
+    check: Optional[Callable[[], Awaitable[Any]]] = None
+) -> Response:
+    """
+    Answer 304 if the client's copy of the collections is current; otherwise load and send it as JSON.
+
+    `check` runs first and should raise (e.g. a 404) if the resource the
+    collections belong to does not exist, which no version can tell apart from
+    one that is merely unchanged. The version is read before `load` runs, so a
+    write racing with the load can only make the tag older than the body, which
+    costs a refetch later rather than serving stale data. The query string is
+    part of the tag, so each page of a paginated list is tagged separately.
+    """
+    if check is not None:
+        await check()
+    headers, fresh = await _validators(request, keys, db)
+    if fresh:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(await load(), headers=headers)
+
+
+async def _validators(request: Request, keys: List[str], db: AsyncSession) -> Tuple[Dict[str, str], bool]:
+    """Build the ETag/Last-Modified headers for the collections and check the request's preconditions against them."""
+    versions = await VersionRepository(db).get_many(keys)
+
+    tag_source = "|".join(f"{version.key}={version.version}" for version in versions) + "?" + request.url.query
+    headers = {
+        "ETag": f'W/"{hashlib.sha1(tag_source.encode()).hexdigest()[:20]}"',
+        # Let clients keep the body but revalidate before every reuse
+        "Cache-Control": "no-cache"
+    }
+
+    timestamps = [version.updated_at for version in versions if version.updated_at]
+    last_modified = max(
+        (ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc) for ts in timestamps), default=None
+    )
+    # HTTP dates have one-second resolution: only advertise a second once it is over, so no later
+    # write can share it and be mistaken for unmodified
+    if last_modified and last_modified.replace(microsecond=0) < datetime.now(timezone.utc).replace(microsecond=0):
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    else:
+        last_modified = None
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-Modified-Since is ignored when If-None-Match is present
+        fresh = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        fresh = False
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and last_modified:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                since = None
+            fresh = since is not None and since.tzinfo is not None and last_modified.replace(microsecond=0) <= since
+
+    return headers, fresh
@@ -0,0 +1,161 @@
+"""
+Read-through cache for rarely changing repository rows.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.config import settings
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class MemoryCacheBackend:
+    """In-process LRU store with per-entry expiry."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        now = time.monotonic()
+        values = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry and entry[0] > now:
+                    self._entries.move_to_end(key)
+                    values.append(entry[1])
+                else:
+                    if entry:
+                        del self._entries[key]
+                    values.append(None)
+        return values
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    async def delete(self, keys: List[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    async def close(self) -> None:
+        pass
+
+
+class RedisCacheBackend:
+    """
+    Shared store so invalidations reach every worker process.
+
+    Accepts any client with the redis.asyncio interface, which lets tests and
+    local runs pass a fake in place of a real server.
+    """
+
+    def __init__(self, url: str, client=None, prefix: str = "aiboss:"):
+        if client is None:
+            try:
+                import redis.asyncio as redis
+            except ImportError:
+                raise ValueError("Redis library not installed. Please install with: pip install redis")
+            client = redis.from_url(url, decode_responses=True)
+        self._client = client
+        self._prefix = prefix
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        return await self._client.mget([self._prefix + key for key in keys])
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await self._client.set(self._prefix + key, value, px=int(ttl * 1000))
+
+    async def delete(self, keys: List[str]) -> None:
+        await self._client.delete(*[self._prefix + key for key in keys])
+
+    async def close(self) -> None:
+        # redis-py 5 renamed close() to aclose()
+        close = getattr(self._client, "aclose", None) or self._client.close
+        await close()
+
+
+class RepositoryCache:
+    """
+    Caches Pydantic models by key in front of the repositories.
+
+    Repositories read through it and invalidate keys on every write, so a
+    cached row is at most `ttl` seconds stale for writes made outside the
+    repositories (or in other processes when using the memory backend).
+    """
+
+    def __init__(self, backend=None, ttl: float = 60):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def get(self, key: str, model: Type[ModelT]) -> Optional[ModelT]:
+        """Get one cached model, or None on a miss."""
+        return (await self.get_many([key], model)).get(key)
+
+    async def get_many(self, keys: Iterable[str], model: Type[ModelT]) -> Dict[str, ModelT]:
+        """Get cached models by key; missing keys are left out of the result."""
+        keys = list(keys)
+        if self.backend is None or not keys:
+            self.misses += len(keys)
+            return {}
+
+        found = {}
+        for key, value in zip(keys, await self.backend.get_many(keys)):
+            if value is not None:
+                found[key] = model.model_validate_json(value)
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    async def set(self, key: str, value: BaseModel) -> None:
+        if self.backend is not None:
+            await self.backend.set(key, value.model_dump_json(), self.ttl)
+
+    async def invalidate(self, *keys: str) -> None:
+        if self.backend is not None and keys:
+            self.invalidations += len(keys)
+            await self.backend.delete(list(keys))
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "invalidations": self.invalidations
+        }
+
+
+def create_repository_cache() -> RepositoryCache:
+    """Build the cache selected by CACHE_BACKEND ('memory', 'redis' or 'none')."""
+    if settings.CACHE_BACKEND == "memory":
+        backend = MemoryCacheBackend(settings.CACHE_MAX_ENTRIES)
+    elif settings.CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(settings.CACHE_REDIS_URL)
+    elif settings.CACHE_BACKEND == "none":
+        backend = None
+    else:
+        raise ValueError(f"Unsupported cache backend: {settings.CACHE_BACKEND}")
+    return RepositoryCache(backend, ttl=settings.CACHE_TTL)
+
+# Global instance
+repository_cache = create_repository_cache()
@@ -1,26 +1,136 @@
 """
 Database connection and session management.
 """
-from sqlalchemy import create_engine
+import threading
+import time
+import uuid
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
 from app.config import settings
+from app.database.instrumentation import instrument_engine
+from app.metrics import db_pool_checkout_wait_seconds, register_stats
+from app.tracing import tracer
 
-# Create the SQLAlchemy engine
-engine = create_engine(settings.DATABASE_URL)
 
-# Create a configured "Session" class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class PoolStats:
+    """Counters for how long requests wait to check out a connection."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        db_pool_checkout_wait_seconds.observe(seconds)
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 3)
+            }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait time."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_stats.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def _engine_options() -> dict:
+    """Build engine keyword arguments from the pool settings."""
+    options = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if make_url(settings.ASYNC_DATABASE_URL).get_backend_name() != "postgresql":
+        # SQLite keeps SQLAlchemy's default pool; sizing options do not apply
+        return options
+
+    connect_args = {}
+    if settings.DB_PGBOUNCER_MODE:
+        # PgBouncer in transaction mode owns pooling and cannot route server-side
+        # prepared statements, so hold no connections and cache no statements.
+        options["poolclass"] = NullPool
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+    else:
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE
+        )
+        # Startup parameters are rejected by PgBouncer, so only set this when connecting directly
+        if settings.DB_STATEMENT_TIMEOUT_MS:
+            connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+
+    options["connect_args"] = connect_args
+    return options
+
+
+# Create the async SQLAlchemy engine (asyncpg for Postgres, aiosqlite for SQLite)
+engine = create_async_engine(settings.ASYNC_DATABASE_URL, **_engine_options())
+if settings.DB_QUERY_INSTRUMENTATION or tracer.enabled:
+    instrument_engine(engine)
+
+# Create a configured "Session" class. Objects stay usable after commit so
+# repositories can convert them without another round trip.
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 # Create a Base class for declarative models
 Base = declarative_base()
 
-def get_db():
+async def get_db():
     """
     Dependency that provides a database session.
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def get_pool_status() -> dict:
+    """Current connection pool occupancy and checkout wait statistics."""
+    pool = engine.pool
+    status = {"pool_class": type(pool).__name__, "pgbouncer_mode": settings.DB_PGBOUNCER_MODE}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow()
+        )
+    status.update(pool_stats.snapshot())
+    return status
+
+
+register_stats("aiboss_db_pool", get_pool_status, {
+    "size": "Connections the pool keeps open",
+    "checked_out": "Connections in use",
+    "checked_in": "Idle pooled connections",
+    "overflow": "Connections open beyond the pool size"
+})
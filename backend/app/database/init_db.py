@@ -1,21 +1,24 @@
 """
 Database initialization and sample data.
 """
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database.database import engine, Base
 from app.database.models import Employee
+from app.database.repositories import EMPLOYEES_VERSION_KEY, VersionRepository
 from datetime import datetime
 
 
-def create_tables():
+async def create_tables():
     """Create all database tables."""
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def init_sample_data(db: Session):
+async def init_sample_data(db: AsyncSession):
     """Initialize the database with sample employees."""
     # Check if employees already exist
-    existing_employees = db.query(Employee).count()
+    existing_employees = (await db.execute(select(func.count()).select_from(Employee))).scalar_one()
     if existing_employees > 0:
         return
     
@@ -46,5 +49,6 @@ def init_sample_data(db: Session):
     for employee in sample_employees:
         db.add(employee)
     
-    db.commit()
+    await VersionRepository(db).bump(EMPLOYEES_VERSION_KEY)
+    await db.commit()
     print("Sample data initialized successfully!")
@@ -0,0 +1,206 @@
+"""
+Per-request SQL statement counting, slow query logging and statement spans.
+"""
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+from app.config import settings
+from app.metrics import route_template
+from app.tracing import tracer
+
+try:
+    from greenlet import getcurrent
+except ImportError:  # pragma: no cover - SQLAlchemy's asyncio support requires greenlet
+    getcurrent = None
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPOSITORIES_FILE = os.path.join(APP_DIR, "database", "repositories.py")
+
+
+class QueryStats:
+    """Statements issued while handling one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.slowest = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.total_time += seconds
+        if seconds > self.slowest:
+            self.slowest = seconds
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        """Render as a Server-Timing header value."""
+        return (
+            f'db;desc="{self.count} queries";dur={self.total_time * 1000:.2f}, '
+            f"db-slowest;dur={self.slowest * 1000:.2f}"
+        )
+
+
+class RouteQueryStats:
+    """Statement counters aggregated per route, plus the most recent slow queries."""
+
+    def __init__(self, recent_slow: int = 50):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, dict] = {}
+        self.slow_queries = 0
+        self.recent_slow = deque(maxlen=recent_slow)
+
+    def record_request(self, route: str, stats: QueryStats) -> None:
+        with self._lock:
+            entry = self._routes.setdefault(route, {
+                "requests": 0, "queries": 0, "db_time": 0.0, "max_queries": 0, "slowest": 0.0, "slowest_statement": None
+            })
+            entry["requests"] += 1
+            entry["queries"] += stats.count
+            entry["db_time"] += stats.total_time
+            entry["max_queries"] = max(entry["max_queries"], stats.count)
+            if stats.slowest > entry["slowest"]:
+                entry["slowest"] = stats.slowest
+                entry["slowest_statement"] = stats.slowest_statement
+
+    def record_slow(self, statement: str, seconds: float, call_site: str) -> None:
+        with self._lock:
+            self.slow_queries += 1
+            self.recent_slow.append({
+                "duration_ms": round(seconds * 1000, 2),
+                "call_site": call_site,
+                "statement": statement[:500]
+            })
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            routes = {
+                route: {
+                    "requests": entry["requests"],
+                    "avg_queries": round(entry["queries"] / entry["requests"], 2),
+                    "max_queries": entry["max_queries"],
+                    "avg_db_ms": round(entry["db_time"] / entry["requests"] * 1000, 3),
+                    "slowest_ms": round(entry["slowest"] * 1000, 3),
+                    "slowest_statement": (entry["slowest_statement"] or "")[:500] or None
+                }
+                for route, entry in sorted(self._routes.items())
+            }
+            return {
+                "slow_query_threshold_ms": settings.DB_SLOW_QUERY_MS,
+                "slow_queries": self.slow_queries,
+                "recent_slow_queries": list(self.recent_slow),
+                "routes": routes
+            }
+
+
+route_query_stats = RouteQueryStats()
+
+# Stats for the request being handled. SQLAlchemy runs statements in a greenlet
+# that inherits the calling task's context, so this is visible from the events.
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def _frames() -> Iterator:
+    """Yield stack frames innermost first, continuing into the greenlets SQLAlchemy switched away from."""
+    frame = sys._getframe(1)
+    current = getcurrent() if getcurrent else None
+    while True:
+        while frame is not None:
+            yield frame
+            frame = frame.f_back
+        current = current.parent if current is not None else None
+        if current is None:
+            return
+        frame = current.gr_frame
+
+
+def _call_site() -> str:
+    """Find the app code that issued the current statement, preferring the repository method."""
+    fallback = None
+    for frame in _frames():
+        filename = frame.f_code.co_filename
+        if filename == REPOSITORIES_FILE:
+            return f"app/database/repositories.py:{frame.f_lineno} in {frame.f_code.co_name}"
+        if fallback is None and filename.startswith(APP_DIR) and filename != __file__:
+            fallback = f"app/{os.path.relpath(filename, APP_DIR)}:{frame.f_lineno} in {frame.f_code.co_name}"
+    return fallback or "unknown"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+    if tracer.enabled:
+        conn.info.setdefault("query_spans", []).append(tracer.start_span(statement.split(None, 1)[0].upper(), {
+            "db.system": conn.dialect.name,
+            "db.statement": statement[:1000],
+            "code.function": _call_site()
+        }, kind="client"))
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    seconds = time.perf_counter() - conn.info["query_started_at"].pop()
+    if conn.info.get("query_spans"):
+        tracer.end_span(conn.info["query_spans"].pop())
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, seconds)
+
+    if settings.DB_SLOW_QUERY_MS and seconds * 1000 >= settings.DB_SLOW_QUERY_MS:
+        call_site = _call_site()
+        route_query_stats.record_slow(statement, seconds, call_site)
+        print(f"Slow query ({seconds * 1000:.1f} ms) at {call_site}: {' '.join(statement.split())[:300]}")
+
+
+def _handle_error(context) -> None:
+    # A failed statement never reaches after_cursor_execute
+    if context.connection is None:
+        return
+    started = context.connection.info.get("query_started_at")
+    if started:
+        started.pop()
+    spans = context.connection.info.get("query_spans")
+    if spans:
+        span = spans.pop()
+        span.record_exception(context.original_exception)
+        tracer.end_span(span)
+
+
+def instrument_engine(engine) -> None:
+    """Time, and when tracing is on trace, every statement the engine runs."""
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """Counts each request's statements, reports them in a Server-Timing header and aggregates them per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            route_query_stats.record_request(f"{scope['method']} {route_template(scope)}", stats)
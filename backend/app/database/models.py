@@ -1,8 +1,9 @@
 """
 SQLAlchemy database models.
 """
-from sqlalchemy import Column, String, DateTime, Boolean, Text, JSON, ForeignKey, Integer
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, String, DateTime, Boolean, Text, JSON, ForeignKey, Integer, BigInteger, Index, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -10,10 +11,15 @@ import uuid
 from app.database.database import Base
 
 
+def utcnow() -> datetime:
+    """Current UTC time with microseconds. SQLite's CURRENT_TIMESTAMP has whole seconds, too coarse to order messages by."""
+    return datetime.now(timezone.utc)
+
+
 class Employee(Base):
     __tablename__ = "employees"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     name = Column(String(100), nullable=False)
     role = Column(String(100), nullable=False)
     personality = Column(String(500), nullable=False)
@@ -31,28 +37,97 @@ class Employee(Base):
 class Meeting(Base):
     __tablename__ = "meetings"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
-    employee_ids = Column(JSON, nullable=False)  # Store as JSON array
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     is_active = Column(Boolean, default=True)
 
     # Relationships
     messages = relationship("Message", back_populates="meeting")
+    participants = relationship(
+        "MeetingParticipant",
+        order_by="MeetingParticipant.position",
+        cascade="all, delete-orphan",
+        lazy="selectin"  # loaded eagerly so async code never triggers a lazy load
+    )
+
+    @property
+    def employee_ids(self) -> list:
+        """Participant employee IDs in the order they were added."""
+        return [str(participant.employee_id) for participant in self.participants]
+
+
+class MeetingParticipant(Base):
+    __tablename__ = "meeting_participants"
+    __table_args__ = (
+        # The primary key serves lookups by meeting; this serves lookups by employee
+        Index("ix_meeting_participants_employee_id", "employee_id"),
+    )
+
+    meeting_id = Column(Uuid(as_uuid=True), ForeignKey("meetings.id"), primary_key=True)
+    employee_id = Column(Uuid(as_uuid=True), ForeignKey("employees.id"), primary_key=True)
+    position = Column(Integer, nullable=False, default=0)
 
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Backs keyset pagination of a meeting's history
+        Index("ix_messages_meeting_id_timestamp", "meeting_id", "timestamp"),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    meeting_id = Column(UUID(as_uuid=True), ForeignKey("meetings.id"), nullable=False)
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    meeting_id = Column(Uuid(as_uuid=True), ForeignKey("meetings.id"), nullable=False)
     content = Column(String(1000), nullable=False)
     sender_type = Column(String(20), nullable=False)  # 'user' or 'employee'
-    sender_id = Column(UUID(as_uuid=True), ForeignKey("employees.id"), nullable=True)
+    sender_id = Column(Uuid(as_uuid=True), ForeignKey("employees.id"), nullable=True)
     sender_name = Column(String(100), nullable=False)
-    timestamp = Column(DateTime(timezone=True), server_default=func.now())
+    timestamp = Column(DateTime(timezone=True), default=utcnow, server_default=func.now())
 
     # Relationships
     meeting = relationship("Meeting", back_populates="messages")
     sender = relationship("Employee", back_populates="messages")
+
+
+class MeetingSummary(Base):
+    __tablename__ = "meeting_summaries"
+
+    meeting_id = Column(Uuid(as_uuid=True), ForeignKey("meetings.id"), primary_key=True)
+    content = Column(Text, nullable=False)
+    # Newest message folded into the summary; anything after it is not covered yet
+    last_message_id = Column(Uuid(as_uuid=True), ForeignKey("messages.id"), nullable=False)
+    message_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class ResourceVersion(Base):
+    __tablename__ = "resource_versions"
+
+    # Collection key, e.g. 'employees', 'meetings' or 'messages:<meeting id>'
+    key = Column(String(100), primary_key=True)
+    # Bumped in the same transaction as every write to the collection
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class CrewJob(Base):
+    __tablename__ = "crew_jobs"
+    __table_args__ = (
+        # Workers claim the oldest claimable job first
+        Index("ix_crew_jobs_status_created_at", "status", "created_at"),
+    )
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    meeting_id = Column(Uuid(as_uuid=True), ForeignKey("meetings.id"), nullable=False)
+    employee_id = Column(Uuid(as_uuid=True), ForeignKey("employees.id"), nullable=False)
+    status = Column(String(20), nullable=False, default="queued")  # 'queued', 'running', 'succeeded' or 'failed'
+    attempts = Column(Integer, nullable=False, default=0)
+    worker_id = Column(String(100), nullable=True)
+    message_id = Column(Uuid(as_uuid=True), ForeignKey("messages.id"), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)  # renewed by the running worker to hold its lease
+    available_at = Column(DateTime(timezone=True), nullable=True)  # a queued job is not claimed before this
+    finished_at = Column(DateTime(timezone=True), nullable=True)
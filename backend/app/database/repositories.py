@@ -1,22 +1,93 @@
 """
 Database repository classes for data access.
 """
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 import uuid
 
-from app.database.models import Employee as DBEmployee, Meeting as DBMeeting, Message as DBMessage
+from app.database.cache import repository_cache
+from app.database.models import (
+    Employee as DBEmployee, Meeting as DBMeeting, MeetingParticipant as DBMeetingParticipant,
+    Message as DBMessage, MeetingSummary as DBMeetingSummary, CrewJob as DBCrewJob,
+    ResourceVersion as DBResourceVersion, utcnow
+)
 from app.models.employee import AIEmployee, AIEmployeeCreate
-from app.models.meeting import Meeting, MeetingCreate
-from app.models.message import Message, MessageCreate
+from app.models.meeting import Meeting, MeetingCreate, MeetingSummary
+from app.models.message import Message, MessageCreate, MessageBatchItem
+from app.models.job import Job
+from app.models.version import ResourceVersion
+from app.config import settings
+
+# Callbacks invoked with an employee ID after that employee is updated or deleted
+employee_change_listeners: List[Callable[[str], None]] = []
+
+
+def _notify_employee_changed(employee_id: str) -> None:
+    for listener in employee_change_listeners:
+        listener(str(employee_id))
+
+
+# Callbacks invoked with each message after it is committed
+message_created_listeners: List[Callable[[Message], None]] = []
+
+
+def _notify_messages_created(messages: List[Message]) -> None:
+    for message in messages:
+        for listener in message_created_listeners:
+            listener(message)
+
+
+def _to_uuid(value) -> Optional[uuid.UUID]:
+    """Parse an ID from the API; malformed IDs match nothing instead of erroring in the driver."""
+    if value is None or isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        return None
+
+
+def _employee_key(employee_id) -> str:
+    return f"employee:{_to_uuid(employee_id)}"
+
+
+def _meeting_key(meeting_id) -> str:
+    return f"meeting:{_to_uuid(meeting_id)}"
+
+
+# Resource version keys for conditional GETs
+EMPLOYEES_VERSION_KEY = "employees"
+MEETINGS_VERSION_KEY = "meetings"
+
+
+def messages_version_key(meeting_id) -> str:
+    return f"messages:{_to_uuid(meeting_id)}"
+
+
+# Column projections for read paths that encode rows straight to JSON. Their keys match
+# the Pydantic response models, and UUIDs/datetimes are left for the JSON encoder.
+EMPLOYEE_COLUMNS = (
+    DBEmployee.id, DBEmployee.name, DBEmployee.role, DBEmployee.personality, DBEmployee.expertise,
+    DBEmployee.llm_provider, DBEmployee.llm_model, DBEmployee.system_prompt, DBEmployee.created_at,
+    DBEmployee.is_active
+)
+MEETING_COLUMNS = (DBMeeting.id, DBMeeting.title, DBMeeting.description, DBMeeting.created_at, DBMeeting.is_active)
+MESSAGE_COLUMNS = (
+    DBMessage.id, DBMessage.meeting_id, DBMessage.content, DBMessage.sender_type, DBMessage.sender_id,
+    DBMessage.sender_name, DBMessage.timestamp
+)
 
 
 class EmployeeRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, employee_data: AIEmployeeCreate) -> AIEmployee:
+    async def create(self, employee_data: AIEmployeeCreate) -> AIEmployee:
         """Create a new employee."""
         db_employee = DBEmployee(
             name=employee_data.name,
@@ -28,39 +99,94 @@ class EmployeeRepository:
             system_prompt=employee_data.system_prompt
         )
         self.db.add(db_employee)
-        self.db.commit()
-        self.db.refresh(db_employee)
+        await VersionRepository(self.db).bump(EMPLOYEES_VERSION_KEY)
+        await self.db.commit()
+        await self.db.refresh(db_employee)
         return self._to_pydantic(db_employee)
 
-    def get_by_id(self, employee_id: str) -> Optional[AIEmployee]:
-        """Get an employee by ID."""
-        db_employee = self.db.query(DBEmployee).filter(
-            and_(DBEmployee.id == employee_id, DBEmployee.is_active == True)
-        ).first()
-        return self._to_pydantic(db_employee) if db_employee else None
+    async def get_by_id(self, employee_id: str) -> Optional[AIEmployee]:
+        """Get an employee by ID, reading through the cache."""
+        cached = await repository_cache.get(_employee_key(employee_id), AIEmployee)
+        if cached:
+            return cached
+
+        db_employee = await self._get_active(employee_id)
+        if not db_employee:
+            return None
+        employee = self._to_pydantic(db_employee)
+        await repository_cache.set(_employee_key(employee.id), employee)
+        return employee
+    
+    async def get_many_by_ids(self, employee_ids: List[str]) -> Tuple[List[AIEmployee], List[str]]:
+        """
+        Get several active employees with at most one query.
+
+        Cached employees are served from the cache and the rest are loaded in a
+        single IN query. Returns the employees found, in the order requested,
+        and the requested IDs that do not match an active employee.
+        """
+        employee_ids = list(dict.fromkeys(str(emp_id) for emp_id in employee_ids))
+        keys = {emp_id: _employee_key(emp_id) for emp_id in employee_ids}
+        cached = await repository_cache.get_many(keys.values(), AIEmployee)
+
+        found = {emp_id: cached[key] for emp_id, key in keys.items() if key in cached}
+        to_load = {_to_uuid(emp_id): emp_id for emp_id in employee_ids if emp_id not in found and _to_uuid(emp_id)}
+        if to_load:
+            result = await self.db.execute(
+                select(DBEmployee).where(
+                    and_(DBEmployee.id.in_(list(to_load)), DBEmployee.is_active == True)
+                )
+            )
+            for db_employee in result.scalars():
+                employee = self._to_pydantic(db_employee)
+                found[to_load[db_employee.id]] = employee
+                await repository_cache.set(_employee_key(employee.id), employee)
+
+        employees = [found[emp_id] for emp_id in employee_ids if emp_id in found]
+        missing_ids = [emp_id for emp_id in employee_ids if emp_id not in found]
+        return employees, missing_ids
     
-    def get_by_meeting_id(self, meeting_id: str) -> List[AIEmployee]:
-        """Get all employees associated with a meeting."""
-        db_meeting = self.db.query(DBMeeting).filter(
-            and_(DBMeeting.id == meeting_id, DBMeeting.is_active == True)
-        ).first()
-        if not db_meeting or not db_meeting.employee_ids:
-            return []
-        db_employees = self.db.query(DBEmployee).filter(
-            and_(DBEmployee.id.in_(db_meeting.employee_ids), DBEmployee.is_active == True)
-        ).all()
-        return [self._to_pydantic(emp) for emp in db_employees]
-
-    def get_all(self) -> List[AIEmployee]:
-        """Get all active employees."""
-        db_employees = self.db.query(DBEmployee).filter(DBEmployee.is_active == True).all()
-        return [self._to_pydantic(emp) for emp in db_employees]
-
-    def update(self, employee_id: str, employee_data: AIEmployeeCreate) -> Optional[AIEmployee]:
+    async def get_by_meeting_id(self, meeting_id: str) -> List[AIEmployee]:
+        """Get all active employees associated with a meeting, in participant order."""
+        # A cached meeting already knows its roster, so employees may come straight from the cache
+        meeting = await repository_cache.get(_meeting_key(meeting_id), Meeting)
+        if meeting:
+            employees, _ = await self.get_many_by_ids(meeting.employee_ids)
+            return employees
+
+        return (await self.get_by_meeting_ids([meeting_id])).get(str(meeting_id), [])
+
+    async def get_by_meeting_ids(self, meeting_ids: List[str]) -> Dict[str, List[AIEmployee]]:
+        """Bulk-load the active employees of several active meetings in one indexed join."""
+        meeting_uuids = {_to_uuid(meeting_id): str(meeting_id) for meeting_id in meeting_ids if _to_uuid(meeting_id)}
+        if not meeting_uuids:
+            return {}
+
+        result = await self.db.execute(
+            select(DBMeetingParticipant.meeting_id, DBEmployee)
+            .join(DBEmployee, DBEmployee.id == DBMeetingParticipant.employee_id)
+            .join(DBMeeting, DBMeeting.id == DBMeetingParticipant.meeting_id)
+            .where(and_(
+                DBMeetingParticipant.meeting_id.in_(list(meeting_uuids)),
+                DBMeeting.is_active == True,
+                DBEmployee.is_active == True
+            ))
+            .order_by(DBMeetingParticipant.meeting_id, DBMeetingParticipant.position)
+        )
+
+        employees_by_meeting: Dict[str, List[AIEmployee]] = {}
+        for meeting_uuid, db_employee in result:
+            employees_by_meeting.setdefault(meeting_uuids[meeting_uuid], []).append(self._to_pydantic(db_employee))
+        return employees_by_meeting
+
+    async def get_all_rows(self) -> List[dict]:
+        """Get all active employees as plain column dicts, for encoding straight to JSON."""
+        result = await self.db.execute(select(*EMPLOYEE_COLUMNS).where(DBEmployee.is_active == True))
+        return [dict(row) for row in result.mappings()]
+
+    async def update(self, employee_id: str, employee_data: AIEmployeeCreate) -> Optional[AIEmployee]:
         """Update an employee."""
-        db_employee = self.db.query(DBEmployee).filter(
-            and_(DBEmployee.id == employee_id, DBEmployee.is_active == True)
-        ).first()
+        db_employee = await self._get_active(employee_id)
         
         if not db_employee:
             return None
@@ -68,23 +194,35 @@ class EmployeeRepository:
         for field, value in employee_data.dict().items():
             setattr(db_employee, field, value)
         
-        self.db.commit()
-        self.db.refresh(db_employee)
+        await VersionRepository(self.db).bump(EMPLOYEES_VERSION_KEY)
+        await self.db.commit()
+        await self.db.refresh(db_employee)
+        await repository_cache.invalidate(_employee_key(employee_id))
+        _notify_employee_changed(employee_id)
         return self._to_pydantic(db_employee)
 
-    def delete(self, employee_id: str) -> bool:
+    async def delete(self, employee_id: str) -> bool:
         """Soft delete an employee."""
-        db_employee = self.db.query(DBEmployee).filter(
-            and_(DBEmployee.id == employee_id, DBEmployee.is_active == True)
-        ).first()
+        db_employee = await self._get_active(employee_id)
         
         if not db_employee:
             return False
         
         db_employee.is_active = False
-        self.db.commit()
+        await VersionRepository(self.db).bump(EMPLOYEES_VERSION_KEY)
+        await self.db.commit()
+        await repository_cache.invalidate(_employee_key(employee_id))
+        _notify_employee_changed(employee_id)
         return True
 
+    async def _get_active(self, employee_id: str) -> Optional[DBEmployee]:
+        result = await self.db.execute(
+            select(DBEmployee).where(
+                and_(DBEmployee.id == _to_uuid(employee_id), DBEmployee.is_active == True)
+            )
+        )
+        return result.scalars().first()
+
     def _to_pydantic(self, db_employee: DBEmployee) -> AIEmployee:
         """Convert database model to Pydantic model."""
         return AIEmployee(
@@ -102,46 +240,89 @@ class EmployeeRepository:
 
 
 class MeetingRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, meeting_data: MeetingCreate) -> Meeting:
+    async def create(self, meeting_data: MeetingCreate) -> Meeting:
         """Create a new meeting."""
         db_meeting = DBMeeting(
             title=meeting_data.title,
             description=meeting_data.description,
-            employee_ids=meeting_data.employee_ids
+            participants=[
+                DBMeetingParticipant(employee_id=_to_uuid(emp_id), position=position)
+                for position, emp_id in enumerate(dict.fromkeys(meeting_data.employee_ids))
+            ]
         )
         self.db.add(db_meeting)
-        self.db.commit()
-        self.db.refresh(db_meeting)
+        await VersionRepository(self.db).bump(MEETINGS_VERSION_KEY)
+        await self.db.commit()
+        await self.db.refresh(db_meeting)
         return self._to_pydantic(db_meeting)
 
-    def get_by_id(self, meeting_id: str) -> Optional[Meeting]:
-        """Get a meeting by ID."""
-        db_meeting = self.db.query(DBMeeting).filter(
-            and_(DBMeeting.id == meeting_id, DBMeeting.is_active == True)
-        ).first()
-        return self._to_pydantic(db_meeting) if db_meeting else None
+    async def get_by_id(self, meeting_id: str) -> Optional[Meeting]:
+        """Get a meeting by ID, reading through the cache."""
+        cached = await repository_cache.get(_meeting_key(meeting_id), Meeting)
+        if cached:
+            return cached
+
+        db_meeting = await self._get_active(meeting_id)
+        if not db_meeting:
+            return None
+        meeting = self._to_pydantic(db_meeting)
+        await repository_cache.set(_meeting_key(meeting.id), meeting)
+        return meeting
+
+    async def get_by_employee_id(self, employee_id: str) -> List[Meeting]:
+        """Get all active meetings an employee participates in."""
+        result = await self.db.execute(
+            select(DBMeeting)
+            .join(DBMeetingParticipant, DBMeetingParticipant.meeting_id == DBMeeting.id)
+            .where(and_(DBMeetingParticipant.employee_id == _to_uuid(employee_id), DBMeeting.is_active == True))
+            .order_by(DBMeeting.created_at)
+        )
+        return [self._to_pydantic(meeting) for meeting in result.scalars()]
+
+    async def get_all_rows(self) -> List[dict]:
+        """Get all active meetings as plain column dicts with their participant IDs, for encoding straight to JSON."""
+        meetings = [dict(row) for row in (await self.db.execute(
+            select(*MEETING_COLUMNS).where(DBMeeting.is_active == True)
+        )).mappings()]
+
+        participants = await self.db.execute(
+            select(DBMeetingParticipant.meeting_id, DBMeetingParticipant.employee_id)
+            .join(DBMeeting, DBMeeting.id == DBMeetingParticipant.meeting_id)
+            .where(DBMeeting.is_active == True)
+            .order_by(DBMeetingParticipant.meeting_id, DBMeetingParticipant.position)
+        )
+        employee_ids: Dict[uuid.UUID, List[uuid.UUID]] = {}
+        for meeting_uuid, employee_uuid in participants:
+            employee_ids.setdefault(meeting_uuid, []).append(employee_uuid)
 
-    def get_all(self) -> List[Meeting]:
-        """Get all active meetings."""
-        db_meetings = self.db.query(DBMeeting).filter(DBMeeting.is_active == True).all()
-        return [self._to_pydantic(meeting) for meeting in db_meetings]
+        for meeting in meetings:
+            meeting["employee_ids"] = employee_ids.get(meeting["id"], [])
+        return meetings
 
-    def delete(self, meeting_id: str) -> bool:
+    async def delete(self, meeting_id: str) -> bool:
         """Soft delete a meeting."""
-        db_meeting = self.db.query(DBMeeting).filter(
-            and_(DBMeeting.id == meeting_id, DBMeeting.is_active == True)
-        ).first()
+        db_meeting = await self._get_active(meeting_id)
         
         if not db_meeting:
             return False
         
         db_meeting.is_active = False
-        self.db.commit()
+        await VersionRepository(self.db).bump(MEETINGS_VERSION_KEY, messages_version_key(meeting_id))
+        await self.db.commit()
+        await repository_cache.invalidate(_meeting_key(meeting_id))
         return True
 
+    async def _get_active(self, meeting_id: str) -> Optional[DBMeeting]:
+        result = await self.db.execute(
+            select(DBMeeting).where(
+                and_(DBMeeting.id == _to_uuid(meeting_id), DBMeeting.is_active == True)
+            )
+        )
+        return result.scalars().first()
+
     def _to_pydantic(self, db_meeting: DBMeeting) -> Meeting:
         """Convert database model to Pydantic model."""
         return Meeting(
@@ -155,29 +336,174 @@ class MeetingRepository:
 
 
 class MessageRepository:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def create(self, message_data: MessageCreate, sender_name: str) -> Message:
+    async def create(self, message_data: MessageCreate, sender_name: str) -> Message:
         """Create a new message."""
         db_message = DBMessage(
-            meeting_id=message_data.meeting_id,
+            meeting_id=_to_uuid(message_data.meeting_id),
             content=message_data.content,
             sender_type=message_data.sender_type,
-            sender_id=message_data.sender_id,
+            sender_id=_to_uuid(message_data.sender_id),
             sender_name=sender_name
         )
         self.db.add(db_message)
-        self.db.commit()
-        self.db.refresh(db_message)
-        return self._to_pydantic(db_message)
+        await VersionRepository(self.db).bump(messages_version_key(message_data.meeting_id))
+        await self.db.commit()
+        await self.db.refresh(db_message)
+        message = self._to_pydantic(db_message)
+        _notify_messages_created([message])
+        return message
+
+    async def create_many(self, meeting_id: str, messages: List[MessageBatchItem], sender_names: List[str]) -> List[Message]:
+        """
+        Insert a batch of messages in one transaction.
+
+        Rows go in as multi-row INSERT ... RETURNING statements, or through COPY
+        on Postgres once the batch reaches MESSAGE_COPY_THRESHOLD. Messages
+        without a timestamp get the current time from the same clock as
+        create() plus their offset in the batch, and runs of equal timestamps are
+        spread over consecutive microseconds, so the batch keeps its order in
+        the (timestamp, id) history.
+        """
+        meeting_uuid = _to_uuid(meeting_id)
+        now = utcnow()
+        rows = []
+        given = previous = None
+        for offset, (item, sender_name) in enumerate(zip(messages, sender_names)):
+            timestamp = item.timestamp or now + timedelta(microseconds=offset)
+            if not timestamp.tzinfo:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            # A run of equal timestamps becomes consecutive microseconds
+            tied = timestamp == given
+            given = timestamp
+            if tied:
+                timestamp = previous + timedelta(microseconds=1)
+            previous = timestamp
+            rows.append({
+                "id": uuid.uuid4(),
+                "meeting_id": meeting_uuid,
+                "content": item.content,
+                "sender_type": item.sender_type,
+                "sender_id": _to_uuid(item.sender_id) if item.sender_type == "employee" else None,
+                "sender_name": sender_name,
+                "timestamp": timestamp
+            })
+
+        if len(rows) >= settings.MESSAGE_COPY_THRESHOLD and self.db.bind.dialect.driver == "asyncpg":
+            await self._copy_rows(rows)
+            created = rows
+        else:
+            result = await self.db.execute(
+                insert(DBMessage).returning(*DBMessage.__table__.columns, sort_by_parameter_order=True),
+                rows
+            )
+            created = result.mappings().all()
+
+        await VersionRepository(self.db).bump(messages_version_key(meeting_id))
+        await self.db.commit()
+        created_messages = [self._row_to_pydantic(row) for row in created]
+        _notify_messages_created(created_messages)
+        return created_messages
+
+    async def _copy_rows(self, rows: List[dict]) -> None:
+        """Stream rows into the messages table with Postgres COPY."""
+        columns = list(rows[0].keys())
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            DBMessage.__tablename__,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns
+        )
+
+    async def get_by_meeting_id(
+        self,
+        meeting_id: str,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Message]:
+        """
+        Get messages for a meeting in chronological order.
+
+        `before` and `after` are message IDs used as keyset cursors on
+        (timestamp, id), so a page costs the same regardless of how long the
+        meeting is. With no cursor the latest `limit` messages are returned.
+        Raises ValueError if a cursor does not belong to the meeting.
+        """
+        rows = await self._page((DBMessage,), meeting_id, before, after, limit)
+        return [self._to_pydantic(row[0]) for row in rows]
+
+    async def get_page_rows(
+        self,
+        meeting_id: str,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """Like get_by_meeting_id, but return plain column dicts for encoding straight to JSON."""
+        rows = await self._page(MESSAGE_COLUMNS, meeting_id, before, after, limit)
+        return [row._asdict() for row in rows]
+
+    async def _page(self, columns, meeting_id: str, before: Optional[str], after: Optional[str], limit: Optional[int]) -> list:
+        """Select `columns` for one keyset page of a meeting's messages, returning rows in chronological order."""
+        meeting_uuid = _to_uuid(meeting_id)
+        query = select(*columns).where(DBMessage.meeting_id == meeting_uuid)
+
+        if after:
+            query = query.where(tuple_(DBMessage.timestamp, DBMessage.id) > await self._keyset(meeting_uuid, after))
+        if before:
+            query = query.where(tuple_(DBMessage.timestamp, DBMessage.id) < await self._keyset(meeting_uuid, before))
 
-    def get_by_meeting_id(self, meeting_id: str) -> List[Message]:
-        """Get all messages for a meeting."""
-        db_messages = self.db.query(DBMessage).filter(
-            DBMessage.meeting_id == meeting_id
-        ).order_by(DBMessage.timestamp).all()
-        return [self._to_pydantic(msg) for msg in db_messages]
+        if after and not before:
+            # Walk forward from the cursor.
+            query = query.order_by(DBMessage.timestamp, DBMessage.id)
+            if limit:
+                query = query.limit(limit)
+            return (await self.db.execute(query)).all()
+        if limit:
+            # Walk backward from the newest end and flip back to chronological order.
+            query = query.order_by(DBMessage.timestamp.desc(), DBMessage.id.desc()).limit(limit)
+            return list(reversed((await self.db.execute(query)).all()))
+        query = query.order_by(DBMessage.timestamp, DBMessage.id)
+        return (await self.db.execute(query)).all()
+
+    async def get_latest(self, meeting_id: str, limit: int = 1) -> List[Message]:
+        """Get the latest `limit` messages for a meeting in chronological order."""
+        return await self.get_by_meeting_id(meeting_id, limit=limit)
+
+    async def get_between(self, meeting_id: str, after: Optional[str], before: str, limit: int) -> List[Message]:
+        """
+        Get up to `limit` messages strictly between two cursors, oldest first.
+
+        With no `after` cursor the range starts at the beginning of the meeting.
+        """
+        meeting_uuid = _to_uuid(meeting_id)
+        query = select(DBMessage).where(
+            and_(
+                DBMessage.meeting_id == meeting_uuid,
+                tuple_(DBMessage.timestamp, DBMessage.id) < await self._keyset(meeting_uuid, before)
+            )
+        )
+        if after:
+            query = query.where(tuple_(DBMessage.timestamp, DBMessage.id) > await self._keyset(meeting_uuid, after))
+
+        result = await self.db.execute(query.order_by(DBMessage.timestamp, DBMessage.id).limit(limit))
+        return [self._to_pydantic(msg) for msg in result.scalars()]
+
+    async def _keyset(self, meeting_uuid: Optional[uuid.UUID], message_id: str):
+        """Resolve a message ID cursor to its (timestamp, id) sort key."""
+        result = await self.db.execute(
+            select(DBMessage.timestamp, DBMessage.id).where(
+                and_(DBMessage.id == _to_uuid(message_id), DBMessage.meeting_id == meeting_uuid)
+            )
+        )
+        cursor = result.first()
+        if not cursor:
+            raise ValueError(f"Invalid cursor: {message_id}")
+        return (cursor.timestamp, cursor.id)
 
     def _to_pydantic(self, db_message: DBMessage) -> Message:
         """Convert database model to Pydantic model."""
@@ -190,3 +516,244 @@ class MessageRepository:
             sender_name=db_message.sender_name,
             timestamp=db_message.timestamp
         )
+
+    def _row_to_pydantic(self, row) -> Message:
+        """Convert a messages row mapping to Pydantic model."""
+        return Message(
+            id=str(row["id"]),
+            meeting_id=str(row["meeting_id"]),
+            content=row["content"],
+            sender_type=row["sender_type"],
+            sender_id=str(row["sender_id"]) if row["sender_id"] else None,
+            sender_name=row["sender_name"],
+            timestamp=row["timestamp"]
+        )
+
+
+class VersionRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def bump(self, *keys: str) -> None:
+        """
+        Advance the version of each collection key.
+
+        Runs in the caller's transaction without committing, so the new
+        version becomes visible together with the write it describes.
+        """
+        now = datetime.now(timezone.utc)
+        upsert = pg_insert if self.db.bind.dialect.name == "postgresql" else sqlite_insert
+        for key in keys:
+            statement = upsert(DBResourceVersion).values(key=key, version=1, updated_at=now)
+            await self.db.execute(statement.on_conflict_do_update(
+                index_elements=[DBResourceVersion.key],
+                set_={"version": DBResourceVersion.version + 1, "updated_at": now}
+            ))
+
+    async def get_many(self, keys: List[str]) -> List[ResourceVersion]:
+        """Get the current version of each key, in the order given; unwritten keys are at version 0."""
+        result = await self.db.execute(
+            select(DBResourceVersion).where(DBResourceVersion.key.in_(keys)).execution_options(populate_existing=True)
+        )
+        found = {db_version.key: self._to_pydantic(db_version) for db_version in result.scalars()}
+        return [found.get(key) or ResourceVersion(key=key, version=0) for key in keys]
+
+    def _to_pydantic(self, db_version: DBResourceVersion) -> ResourceVersion:
+        """Convert database model to Pydantic model."""
+        return ResourceVersion(key=db_version.key, version=db_version.version, updated_at=db_version.updated_at)
+
+
+class SummaryRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_meeting_id(self, meeting_id: str) -> Optional[MeetingSummary]:
+        """Get a meeting's rolling summary, if one has been written."""
+        result = await self.db.execute(
+            select(DBMeetingSummary).where(DBMeetingSummary.meeting_id == _to_uuid(meeting_id))
+            .execution_options(populate_existing=True)
+        )
+        db_summary = result.scalars().first()
+        return self._to_pydantic(db_summary) if db_summary else None
+
+    async def save(self, summary: MeetingSummary, previous: Optional[MeetingSummary]) -> bool:
+        """
+        Store a meeting's summary if it has not moved on since `previous` was read.
+
+        Concurrent turns may both try to extend the same summary; only the first
+        write wins and the others return False instead of overwriting it.
+        """
+        values = {
+            "content": summary.content,
+            "last_message_id": _to_uuid(summary.last_message_id),
+            "message_count": summary.message_count,
+            "updated_at": datetime.now(timezone.utc)
+        }
+
+        if previous is None:
+            self.db.add(DBMeetingSummary(meeting_id=_to_uuid(summary.meeting_id), **values))
+            try:
+                await self.db.commit()
+            except IntegrityError:
+                await self.db.rollback()
+                return False
+            return True
+
+        result = await self.db.execute(
+            update(DBMeetingSummary).where(
+                and_(
+                    DBMeetingSummary.meeting_id == _to_uuid(summary.meeting_id),
+                    DBMeetingSummary.last_message_id == _to_uuid(previous.last_message_id)
+                )
+            ).values(**values).execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return bool(result.rowcount)
+
+    def _to_pydantic(self, db_summary: DBMeetingSummary) -> MeetingSummary:
+        """Convert database model to Pydantic model."""
+        return MeetingSummary(
+            meeting_id=str(db_summary.meeting_id),
+            content=db_summary.content,
+            last_message_id=str(db_summary.last_message_id),
+            message_count=db_summary.message_count,
+            updated_at=db_summary.updated_at
+        )
+
+
+class JobRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, meeting_id: str, employee_id: str) -> Job:
+        """Enqueue a new crew response job."""
+        db_job = DBCrewJob(
+            meeting_id=_to_uuid(meeting_id),
+            employee_id=_to_uuid(employee_id),
+            status="queued",
+            attempts=0
+        )
+        self.db.add(db_job)
+        await self.db.commit()
+        await self.db.refresh(db_job)
+        return self._to_pydantic(db_job)
+
+    async def get_by_id(self, job_id: str) -> Optional[Job]:
+        """Get a job by ID, always re-reading its current state."""
+        result = await self.db.execute(
+            select(DBCrewJob).where(DBCrewJob.id == _to_uuid(job_id)).execution_options(populate_existing=True)
+        )
+        db_job = result.scalars().first()
+        return self._to_pydantic(db_job) if db_job else None
+
+    async def claim_next(self, worker_id: str, lease_seconds: float, max_attempts: int) -> Optional[Job]:
+        """
+        Claim the oldest runnable job for a worker.
+
+        A job is runnable when it is queued and due, or when it is running but
+        its worker has not renewed the lease (see heartbeat) for `lease_seconds`
+        and it has attempts left. The claim is a conditional UPDATE on the state
+        we read, so concurrent workers on any database backend never claim the
+        same job twice.
+        """
+        now = datetime.now(timezone.utc)
+        stale_before = now - timedelta(seconds=lease_seconds)
+
+        # Give up on jobs whose workers keep dying
+        await self.db.execute(
+            update(DBCrewJob).where(
+                and_(DBCrewJob.status == "running", DBCrewJob.heartbeat_at < stale_before, DBCrewJob.attempts >= max_attempts)
+            ).values(status="failed", error="Job lease expired too many times", finished_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+
+        for _ in range(3):
+            result = await self.db.execute(
+                select(DBCrewJob.id, DBCrewJob.status, DBCrewJob.heartbeat_at).where(
+                    or_(
+                        and_(
+                            DBCrewJob.status == "queued",
+                            or_(DBCrewJob.available_at.is_(None), DBCrewJob.available_at <= now)
+                        ),
+                        and_(DBCrewJob.status == "running", DBCrewJob.heartbeat_at < stale_before)
+                    )
+                ).order_by(DBCrewJob.created_at).limit(1)
+            )
+            candidate = result.first()
+            if not candidate:
+                return None
+
+            claimed = await self.db.execute(
+                update(DBCrewJob).where(
+                    and_(
+                        DBCrewJob.id == candidate.id,
+                        DBCrewJob.status == candidate.status,
+                        DBCrewJob.heartbeat_at == candidate.heartbeat_at if candidate.heartbeat_at else DBCrewJob.heartbeat_at.is_(None)
+                    )
+                ).values(
+                    status="running",
+                    worker_id=worker_id,
+                    started_at=now,
+                    heartbeat_at=now,
+                    attempts=DBCrewJob.attempts + 1
+                ).execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+
+            if claimed.rowcount:
+                return await self.get_by_id(candidate.id)
+
+        return None
+
+    async def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """Renew a running job's lease. Returns False if the worker no longer holds it."""
+        return await self._update_claimed(job_id, worker_id, {"heartbeat_at": datetime.now(timezone.utc)})
+
+    async def release(self, job_id: str, worker_id: str, error: str, delay_seconds: float) -> bool:
+        """Put a claimed job back in the queue, to be claimed again after `delay_seconds`."""
+        return await self._update_claimed(job_id, worker_id, {
+            "status": "queued",
+            "worker_id": None,
+            "heartbeat_at": None,
+            "available_at": datetime.now(timezone.utc) + timedelta(seconds=delay_seconds),
+            "error": error
+        })
+
+    async def complete(self, job_id: str, worker_id: str, message_id: str) -> bool:
+        """Mark a job as succeeded with the message it produced. Returns False if the worker no longer holds it."""
+        return await self._update_claimed(job_id, worker_id, {
+            "status": "succeeded", "message_id": _to_uuid(message_id), "error": None, "finished_at": datetime.now(timezone.utc)
+        })
+
+    async def fail(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Mark a job as failed. Returns False if the worker no longer holds it."""
+        return await self._update_claimed(job_id, worker_id, {
+            "status": "failed", "error": error, "finished_at": datetime.now(timezone.utc)
+        })
+
+    async def _update_claimed(self, job_id: str, worker_id: str, values: dict) -> bool:
+        """Update a running job only while `worker_id` holds its claim, so a worker whose lease expired cannot overwrite the new owner's job."""
+        result = await self.db.execute(
+            update(DBCrewJob).where(
+                and_(DBCrewJob.id == _to_uuid(job_id), DBCrewJob.worker_id == worker_id, DBCrewJob.status == "running")
+            ).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        return bool(result.rowcount)
+
+    def _to_pydantic(self, db_job: DBCrewJob) -> Job:
+        """Convert database model to Pydantic model."""
+        return Job(
+            id=str(db_job.id),
+            meeting_id=str(db_job.meeting_id),
+            employee_id=str(db_job.employee_id),
+            status=db_job.status,
+            attempts=db_job.attempts,
+            message_id=str(db_job.message_id) if db_job.message_id else None,
+            error=db_job.error,
+            created_at=db_job.created_at,
+            started_at=db_job.started_at,
+            finished_at=db_job.finished_at
+        )
@@ -6,35 +6,68 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from app.config import settings
-from app.routers import employees, meetings, messages
+from app.routers import employees, meetings, messages, jobs, system, metrics
 from app.database.init_db import create_tables, init_sample_data
-from app.database.database import SessionLocal
+from app.database.cache import repository_cache
+from app.database.database import SessionLocal, engine
+from app.database.instrumentation import QueryStatsMiddleware
+from app.metrics import MetricsMiddleware
+from app.services.crew_executor import crew_executor
+from app.services.job_worker import JobWorker
+from app.services.llm_clients import llm_clients
+from app.services.message_hub import message_hub
+from app.services.preload import preloader
+from app.services.response_cache import response_cache
+from app.responses import ORJSONResponse
+from app.tracing import TracingMiddleware
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     # Startup
-    print("Initializing database...")
-    create_tables()
-    
-    # Initialize sample data
-    db = SessionLocal()
-    try:
-        init_sample_data(db)
-    finally:
-        db.close()
-    
-    print("Database initialized successfully!")
+    if settings.DB_AUTO_INIT:
+        print("Initializing database...")
+        await create_tables()
+        
+        # Initialize sample data
+        async with SessionLocal() as db:
+            await init_sample_data(db)
+        
+        print("Database initialized successfully!")
+
+    # Load CrewAI and the LLM SDKs and open their pooled connections, by
+    # default in the background so the server takes requests meanwhile
+    await preloader.start()
+
+    # Relay new messages between worker processes when a bridge is configured
+    await message_hub.start()
+
+    # Run queued crew jobs in-process unless dedicated workers handle them
+    job_worker = None
+    if settings.JOB_INLINE_WORKERS > 0:
+        job_worker = JobWorker(concurrency=settings.JOB_INLINE_WORKERS)
+        job_worker.start()
+
     yield
     # Shutdown
     print("Application shutting down...")
+    if job_worker:
+        await job_worker.stop()
+    crew_executor.shutdown()
+    await preloader.stop()
+    await message_hub.stop()
+    await llm_clients.aclose()
+    await response_cache.close()
+    await repository_cache.close()
+    await engine.dispose()
 
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.API_TITLE,
     version=settings.API_VERSION,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -47,10 +80,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Count each request's SQL statements and report them in a Server-Timing header
+if settings.DB_QUERY_INSTRUMENTATION:
+    app.add_middleware(QueryStatsMiddleware)
+
+# Request counts and latency per route for /metrics
+app.add_middleware(MetricsMiddleware)
+
+# Root span for each request (outermost, so it covers the other middlewares)
+app.add_middleware(TracingMiddleware)
+
 # Include routers
 app.include_router(employees.router)
 app.include_router(meetings.router)
 app.include_router(messages.router)
+app.include_router(jobs.router)
+app.include_router(system.router)
+app.include_router(metrics.router)
 
 @app.get("/")
 async def root():
@@ -0,0 +1,160 @@
+"""
+Prometheus metrics for HTTP requests, LLM calls, crew runs and the database pool.
+"""
+import asyncio
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+)
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.multiprocess import MultiProcessCollector
+
+from app.tracing import tracer
+
+# LLM and crew calls take seconds to minutes, far longer than the default buckets
+LLM_BUCKETS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128, 300)
+
+http_requests_total = Counter(
+    "aiboss_http_requests_total", "HTTP requests handled", ["method", "route", "status"]
+)
+http_request_duration_seconds = Histogram(
+    "aiboss_http_request_duration_seconds", "HTTP request latency, including streamed bodies", ["method", "route"]
+)
+http_requests_in_progress = Gauge(
+    "aiboss_http_requests_in_progress", "HTTP requests being handled", multiprocess_mode="livesum"
+)
+
+llm_requests_total = Counter(
+    "aiboss_llm_requests_total", "Upstream LLM calls by outcome", ["provider", "model", "operation", "outcome"]
+)
+llm_request_duration_seconds = Histogram(
+    "aiboss_llm_request_duration_seconds", "Upstream LLM call latency", ["provider", "model", "operation"],
+    buckets=LLM_BUCKETS
+)
+llm_tokens_total = Counter(
+    "aiboss_llm_tokens_total", "LLM tokens reported by the provider (streamed chunks for streams)",
+    ["provider", "model", "kind"]
+)
+
+crew_kickoff_duration_seconds = Histogram(
+    "aiboss_crew_kickoff_duration_seconds", "CrewAI kickoff duration", ["outcome"], buckets=LLM_BUCKETS
+)
+
+db_pool_checkout_wait_seconds = Histogram(
+    "aiboss_db_pool_checkout_wait_seconds", "Time spent waiting for a pooled database connection",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 30)
+)
+
+
+class StatsCollector:
+    """Exposes numeric fields of a stats() snapshot as gauges, read at scrape time."""
+
+    def __init__(self, prefix: str, get_stats: Callable[[], dict], fields: Dict[str, str]):
+        self._prefix = prefix
+        self._get_stats = get_stats
+        self._fields = fields
+
+    def collect(self):
+        stats = self._get_stats()
+        for field, documentation in self._fields.items():
+            if isinstance(stats.get(field), (int, float)):
+                yield GaugeMetricFamily(f"{self._prefix}_{field}", documentation, value=stats[field])
+
+
+_stats_collectors: List[StatsCollector] = []
+
+
+def register_stats(prefix: str, get_stats: Callable[[], dict], fields: Dict[str, str]) -> None:
+    """Publish a component's live stats as gauges."""
+    collector = StatsCollector(prefix, get_stats, fields)
+    _stats_collectors.append(collector)
+    REGISTRY.register(collector)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Render every metric in the Prometheus text format."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # Several worker processes: merge their metric files, plus this process's live gauges
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        for collector in _stats_collectors:
+            registry.register(collector)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+@contextmanager
+def observe_llm_call(provider: str, model: str, operation: str):
+    """Time one upstream LLM call, count its outcome and trace it as a client span."""
+    started = time.perf_counter()
+    outcome = "error"
+    # Not made the current span: streamed calls span many yields of an async generator
+    span = tracer.start_span(f"llm.{operation}", {
+        "gen_ai.system": provider, "gen_ai.request.model": model, "llm.operation": operation
+    }, kind="client")
+    try:
+        yield
+        outcome = "success"
+    except (GeneratorExit, asyncio.CancelledError):
+        outcome = "cancelled"
+        raise
+    except Exception as e:
+        span.record_exception(e)
+        raise
+    finally:
+        llm_request_duration_seconds.labels(provider, model, operation).observe(time.perf_counter() - started)
+        llm_requests_total.labels(provider, model, operation, outcome).inc()
+        span.set_attribute("llm.outcome", outcome)
+        tracer.end_span(span)
+
+
+def record_llm_tokens(provider: str, model: str, prompt_tokens: Optional[int] = None,
+                      completion_tokens: Optional[int] = None) -> None:
+    if prompt_tokens:
+        llm_tokens_total.labels(provider, model, "prompt").inc(prompt_tokens)
+    if completion_tokens:
+        llm_tokens_total.labels(provider, model, "completion").inc(completion_tokens)
+
+
+def route_template(scope: dict) -> str:
+    """Rebuild the matched route's path template, e.g. /meetings/{meeting_id}/messages."""
+    if "endpoint" not in scope:
+        return "(unmatched)"
+    path = scope["path"]
+    for name, value in scope.get("path_params", {}).items():
+        path = path.replace(f"/{value}", f"/{{{name}}}", 1)
+    return path
+
+
+class MetricsMiddleware:
+    """Records request counts and latency per route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_progress.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_progress.dec()
+            route = route_template(scope)
+            http_request_duration_seconds.labels(scope["method"], route).observe(time.perf_counter() - started)
+            http_requests_total.labels(scope["method"], route, str(status)).inc()
@@ -10,7 +10,7 @@ class AIEmployeeCreate(BaseModel):
     role: str = Field(..., min_length=1, max_length=100)
     personality: str = Field(..., min_length=1, max_length=500)
     expertise: List[str] = Field(default_factory=list)
-    llm_provider: str = Field(..., pattern="^(openai|anthropic)$")
+    llm_provider: str = Field(..., pattern="^(openai|anthropic|mock)$")
     llm_model: str
     system_prompt: Optional[str] = None
 
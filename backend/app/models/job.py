@@ -0,0 +1,18 @@
+"""
+Background job Pydantic models.
+"""
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class Job(BaseModel):
+    id: str
+    meeting_id: str
+    employee_id: str
+    status: str  # 'queued', 'running', 'succeeded' or 'failed'
+    attempts: int
+    message_id: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
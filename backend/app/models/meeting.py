@@ -17,3 +17,10 @@ class Meeting(BaseModel):
     employee_ids: List[str]
     created_at: datetime
     is_active: bool = True
+
+class MeetingSummary(BaseModel):
+    meeting_id: str
+    content: str
+    last_message_id: str  # newest message folded into the summary
+    message_count: int
+    updated_at: Optional[datetime] = None
@@ -2,12 +2,15 @@
 Message-related Pydantic models.
 """
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
+# Longest message content accepted, from users and generated replies alike
+MESSAGE_MAX_LENGTH = 1000
+
 class MessageCreate(BaseModel):
     meeting_id: str
-    content: str = Field(..., min_length=1, max_length=1000)
+    content: str = Field(..., min_length=1, max_length=MESSAGE_MAX_LENGTH)
     sender_type: str = Field(..., pattern="^(user|employee)$")
     sender_id: Optional[str] = None  # employee ID if sender_type is 'employee'
 
@@ -19,3 +22,16 @@ class Message(BaseModel):
     sender_id: Optional[str]
     sender_name: str
     timestamp: datetime
+
+class ConversationContext(BaseModel):
+    summary: Optional[str] = None  # rolling summary of the messages before `messages`
+    messages: List[Message]
+
+class MessageBatchItem(BaseModel):
+    content: str = Field(..., min_length=1, max_length=MESSAGE_MAX_LENGTH)
+    sender_type: str = Field(..., pattern="^(user|employee)$")
+    sender_id: Optional[str] = None  # employee ID if sender_type is 'employee'
+    timestamp: Optional[datetime] = None  # original time when importing a transcript
+
+class MessageBatchCreate(BaseModel):
+    messages: List[MessageBatchItem] = Field(..., min_items=1)
@@ -0,0 +1,11 @@
+"""
+Resource version Pydantic models.
+"""
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class ResourceVersion(BaseModel):
+    key: str
+    version: int  # 0 until the collection is first written
+    updated_at: Optional[datetime] = None
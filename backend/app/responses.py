@@ -0,0 +1,20 @@
+"""
+Fast JSON responses.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    orjson encodes UUIDs and datetimes natively, so repository row projections
+    can be sent without building Pydantic models. OPT_UTC_Z writes UTC offsets
+    as 'Z', matching Pydantic's output.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z)
@@ -1,32 +1,43 @@
 """
 Employee API routes.
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from typing import List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.employee import AIEmployee, AIEmployeeCreate
+from app.models.meeting import Meeting
 from app.services.employee_service import employee_service
+from app.services.meeting_service import meeting_service
 from app.database.database import get_db
+from app.database.repositories import EMPLOYEES_VERSION_KEY
+from app.conditional import conditional_json
 
 router = APIRouter(prefix="/employees", tags=["employees"])
 
 @router.post("", response_model=AIEmployee)
-async def create_employee(employee: AIEmployeeCreate, db: Session = Depends(get_db)):
+async def create_employee(employee: AIEmployeeCreate, db: AsyncSession = Depends(get_db)):
     """Create a new AI employee."""
-    return employee_service.create_employee(employee, db)
+    return await employee_service.create_employee(employee, db)
 
 @router.get("", response_model=List[AIEmployee])
-async def get_employees(db: Session = Depends(get_db)):
-    """Get all employees."""
-    return employee_service.get_all_employees(db)
+async def get_employees(request: Request, db: AsyncSession = Depends(get_db)):
+    """Get all employees. Supports If-None-Match / If-Modified-Since."""
+    return await conditional_json(
+        request, [EMPLOYEES_VERSION_KEY], db, lambda: employee_service.get_all_employee_rows(db)
+    )
 
 @router.get("/{employee_id}", response_model=AIEmployee)
-async def get_employee(employee_id: str, db: Session = Depends(get_db)):
+async def get_employee(employee_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific employee by ID."""
-    return employee_service.get_employee(employee_id, db)
+    return await employee_service.get_employee(employee_id, db)
+
+@router.get("/{employee_id}/meetings", response_model=List[Meeting])
+async def get_employee_meetings(employee_id: str, db: AsyncSession = Depends(get_db)):
+    """Get the meetings an employee participates in."""
+    return await meeting_service.get_employee_meetings(employee_id, db)
 
 @router.delete("/{employee_id}")
-async def delete_employee(employee_id: str, db: Session = Depends(get_db)):
+async def delete_employee(employee_id: str, db: AsyncSession = Depends(get_db)):
     """Delete an employee."""
-    return employee_service.delete_employee(employee_id, db)
+    return await employee_service.delete_employee(employee_id, db)
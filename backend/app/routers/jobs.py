@@ -0,0 +1,26 @@
+"""
+Background job API routes.
+"""
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import Job
+from app.services.job_service import job_service
+from app.database.database import get_db
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+@router.get("/{job_id}", response_model=Job)
+async def get_job(job_id: str, db: AsyncSession = Depends(get_db)):
+    """Get the status of a background job."""
+    return await job_service.get_job(job_id, db)
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str, db: AsyncSession = Depends(get_db)):
+    """Subscribe to a job's status changes as server-sent events."""
+    return StreamingResponse(
+        await job_service.stream_job(job_id, db),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,27 +1,31 @@
 """
 Meeting API routes.
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from typing import List
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.meeting import Meeting, MeetingCreate
 from app.services.meeting_service import meeting_service
 from app.database.database import get_db
+from app.database.repositories import MEETINGS_VERSION_KEY
+from app.conditional import conditional_json
 
 router = APIRouter(prefix="/meetings", tags=["meetings"])
 
 @router.post("", response_model=Meeting)
-async def create_meeting(meeting: MeetingCreate, db: Session = Depends(get_db)):
+async def create_meeting(meeting: MeetingCreate, db: AsyncSession = Depends(get_db)):
     """Create a new meeting."""
-    return meeting_service.create_meeting(meeting, db)
+    return await meeting_service.create_meeting(meeting, db)
 
 @router.get("", response_model=List[Meeting])
-async def get_meetings(db: Session = Depends(get_db)):
-    """Get all meetings."""
-    return meeting_service.get_all_meetings(db)
+async def get_meetings(request: Request, db: AsyncSession = Depends(get_db)):
+    """Get all meetings. Supports If-None-Match / If-Modified-Since."""
+    return await conditional_json(
+        request, [MEETINGS_VERSION_KEY], db, lambda: meeting_service.get_all_meeting_rows(db)
+    )
 
 @router.get("/{meeting_id}", response_model=Meeting)
-async def get_meeting(meeting_id: str, db: Session = Depends(get_db)):
+async def get_meeting(meeting_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific meeting by ID."""
-    return meeting_service.get_meeting(meeting_id, db)
+    return await meeting_service.get_meeting(meeting_id, db)
@@ -1,27 +1,135 @@
 """
 Message API routes.
 """
-from fastapi import APIRouter, Depends
-from typing import List
-from sqlalchemy.orm import Session
+import asyncio
 
-from app.models.message import Message, MessageCreate
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, WebSocket
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.job import Job
+from app.models.message import Message, MessageCreate, MessageBatchCreate
 from app.services.message_service import message_service
+from app.services.meeting_service import meeting_service
+from app.services.job_service import job_service
 from app.database.database import get_db
+from app.database.repositories import messages_version_key
+from app.conditional import conditional_json
+from app.config import settings
 
 router = APIRouter(prefix="/meetings", tags=["messages"])
 
 @router.post("/{meeting_id}/messages", response_model=Message)
-async def send_message(meeting_id: str, message: MessageCreate, db: Session = Depends(get_db)):
+async def send_message(meeting_id: str, message: MessageCreate, db: AsyncSession = Depends(get_db)):
     """Send a message to a meeting."""
-    return message_service.send_message(meeting_id, message, db)
+    return await message_service.send_message(meeting_id, message, db)
+
+@router.post("/{meeting_id}/messages:batch", response_model=List[Message])
+async def send_messages(meeting_id: str, batch: MessageBatchCreate, db: AsyncSession = Depends(get_db)):
+    """Import a batch of messages into a meeting."""
+    return await message_service.send_messages(meeting_id, batch, db)
+
+@router.post("/{meeting_id}/messages/round-table", response_model=List[Message])
+async def round_table_response(meeting_id: str, db: AsyncSession = Depends(get_db)):
+    """Have every employee in the meeting reply to the conversation in parallel."""
+    return await message_service.generate_round_table_responses(meeting_id, db)
 
 @router.post("/{meeting_id}/messages/{employee_id}/respond", response_model=Message)
-async def respond_to_message(meeting_id: str, employee_id: str, db: Session = Depends(get_db)):
+async def respond_to_message(meeting_id: str, employee_id: str, db: AsyncSession = Depends(get_db)):
     """Generate an AI employee response to the conversation."""
     return await message_service.generate_employee_response(meeting_id, employee_id, db)
 
+@router.post("/{meeting_id}/messages/{employee_id}/respond/jobs", response_model=Job, status_code=202)
+async def enqueue_response_to_message(meeting_id: str, employee_id: str, db: AsyncSession = Depends(get_db)):
+    """Queue an AI employee response and return the job to poll or subscribe to."""
+    return await job_service.enqueue_response(meeting_id, employee_id, db)
+
+@router.post("/{meeting_id}/messages/{employee_id}/respond/stream")
+async def stream_response_to_message(
+    meeting_id: str,
+    employee_id: str,
+    mode: str = Query("crew", pattern="^(crew|direct)$"),
+    db: AsyncSession = Depends(get_db)
+):
+    """Stream an AI employee response to the conversation as server-sent events."""
+    events = await message_service.stream_employee_response(meeting_id, employee_id, db, mode)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/{meeting_id}/messages/stream")
+async def stream_messages(
+    meeting_id: str,
+    after: Optional[str] = Query(None, description="Replay messages newer than this message ID first"),
+    last_event_id: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Subscribe to a meeting's messages as server-sent events.
+
+    Starts with the latest page (or everything after `after` / Last-Event-ID
+    on reconnect), then pushes each new message as it is created.
+    """
+    return StreamingResponse(
+        await message_service.stream_messages(meeting_id, db, after=last_event_id or after),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.websocket("/{meeting_id}/messages/ws")
+async def message_socket(websocket: WebSocket, meeting_id: str, after: Optional[str] = None, db: AsyncSession = Depends(get_db)):
+    """Subscribe to a meeting's messages over a WebSocket, with the same replay as the event stream."""
+    try:
+        feed = await message_service.follow_messages(meeting_id, db, after=after)
+    except HTTPException as e:
+        await websocket.close(code=4000 + e.status_code, reason=e.detail)
+        return
+
+    await websocket.accept()
+
+    async def send_feed():
+        try:
+            async for message in feed:
+                if message is None:
+                    await websocket.send_json({"event": "ping"})
+                else:
+                    await websocket.send_json({"event": "message", "data": message.model_dump(mode="json")})
+        except ValueError as e:
+            await websocket.close(code=4400, reason=str(e))
+
+    async def wait_for_disconnect():
+        # Clients only listen, but reading is what notices a closed connection right away
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+
+    sender = asyncio.create_task(send_feed())
+    receiver = asyncio.create_task(wait_for_disconnect())
+    try:
+        done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        if sender in done and receiver not in done and sender.exception() is not None:
+            # Sending to a connection that dropped before its close frame arrived
+            print(f"Message socket for meeting {meeting_id} ended: {sender.exception()!r}")
+    finally:
+        for task in (sender, receiver):
+            task.cancel()
+        await asyncio.gather(sender, receiver, return_exceptions=True)
+        await feed.aclose()
+
 @router.get("/{meeting_id}/messages", response_model=List[Message])
-async def get_messages(meeting_id: str, db: Session = Depends(get_db)):
-    """Get all messages for a meeting."""
-    return message_service.get_messages(meeting_id, db)
+async def get_messages(
+    request: Request,
+    meeting_id: str,
+    before: Optional[str] = Query(None, description="Return messages older than this message ID"),
+    after: Optional[str] = Query(None, description="Return messages newer than this message ID"),
+    limit: int = Query(settings.MESSAGES_PAGE_SIZE, ge=1, le=settings.MESSAGES_MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get a page of messages for a meeting, oldest first. Supports If-None-Match / If-Modified-Since."""
+    return await conditional_json(
+        request, [messages_version_key(meeting_id)], db,
+        lambda: message_service.get_message_rows(meeting_id, db, before=before, after=after, limit=limit),
+        check=lambda: meeting_service.get_meeting(meeting_id, db)
+    )
@@ -0,0 +1,14 @@
+"""
+Prometheus scrape endpoint.
+"""
+from fastapi import APIRouter, Response
+
+from app.metrics import render_metrics
+
+router = APIRouter(tags=["metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Get all metrics in the Prometheus text format."""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -0,0 +1,69 @@
+"""
+Operational introspection routes.
+"""
+from fastapi import APIRouter, HTTPException, Query
+
+from app.database.cache import repository_cache
+from app.database.database import get_pool_status
+from app.database.instrumentation import route_query_stats
+from app.services.crew_executor import crew_executor
+from app.services.crew_service import crew_service
+from app.services.message_hub import message_hub
+from app.services.mock_llm import mock_llm
+from app.services.preload import preloader
+from app.services.response_cache import response_cache
+from app.tracing import MemorySpanExporter, tracer
+
+router = APIRouter(prefix="/system", tags=["system"])
+
+@router.get("/crew-pool")
+async def get_crew_pool_stats():
+    """Get crew worker pool occupancy, queue depth and run counters."""
+    return crew_executor.stats()
+
+@router.get("/crew-cache")
+async def get_crew_cache_stats():
+    """Get warm crew cache occupancy and hit rate."""
+    return crew_service.cache_stats()
+
+@router.get("/db-pool")
+async def get_db_pool_stats():
+    """Get database connection pool occupancy and checkout wait times."""
+    return get_pool_status()
+
+@router.get("/db-queries")
+async def get_db_query_stats():
+    """Get SQL statement counts and database time per route, and recent slow queries."""
+    return route_query_stats.snapshot()
+
+@router.get("/cache")
+async def get_cache_stats():
+    """Get employee/meeting cache hit and miss counters."""
+    return repository_cache.stats()
+
+@router.get("/llm-cache")
+async def get_llm_cache_stats():
+    """Get LLM response cache hit, miss and coalescing counters."""
+    return response_cache.stats()
+
+@router.get("/mock-llm")
+async def get_mock_llm_stats():
+    """Get the mock LLM provider's settings and call counters."""
+    return mock_llm.stats()
+
+@router.get("/message-hub")
+async def get_message_hub_stats():
+    """Get live message subscriber counts and fan-out counters."""
+    return message_hub.stats()
+
+@router.get("/preload")
+async def get_preload_stats():
+    """Get whether CrewAI and the LLM SDKs have been preloaded, and how long each import took."""
+    return preloader.stats()
+
+@router.get("/traces")
+async def get_traces(limit: int = Query(20, ge=1, le=200)):
+    """Get the most recent traces, newest first (requires TRACING_EXPORTER=memory)."""
+    if not isinstance(tracer.exporter, MemorySpanExporter):
+        raise HTTPException(status_code=404, detail="In-memory tracing is not enabled")
+    return tracer.exporter.traces(limit)
@@ -0,0 +1,149 @@
+"""
+Context service for fitting meeting history into each model's prompt budget.
+"""
+import math
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.tracing import tracer
+from app.models.employee import AIEmployee
+from app.models.meeting import MeetingSummary
+from app.models.message import ConversationContext, Message
+from app.database.repositories import MessageRepository, SummaryRepository
+from app.services.llm_service import llm_service
+
+# Context window sizes by model name prefix; the longest matching prefix wins
+MODEL_CONTEXT_WINDOWS = {
+    "gpt-3.5-turbo": 16385,
+    "gpt-4": 8192,
+    "gpt-4-32k": 32768,
+    "gpt-4-turbo": 128000,
+    "gpt-4o": 128000,
+    "gpt-4.1": 1047576,
+    "claude-2": 100000,
+    "claude-instant": 100000,
+    "claude-3": 200000,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+
+# Completion tokens requested per reply (max_tokens in LLMService)
+RESPONSE_TOKENS = 300
+
+# Chat framing each message adds on top of its text
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class ContextService:
+
+    @staticmethod
+    def count_tokens(text: str) -> int:
+        """Estimate the token count of text at roughly four characters per token."""
+        return math.ceil(len(text) / 4) if text else 0
+
+    @staticmethod
+    def message_tokens(message: Message) -> int:
+        return ContextService.count_tokens(f"{message.sender_name}: {message.content}") + MESSAGE_OVERHEAD_TOKENS
+
+    @staticmethod
+    def token_budget(employee: AIEmployee) -> int:
+        """Tokens of history, summary included, to send in one prompt for the employee's model."""
+        matches = [prefix for prefix in MODEL_CONTEXT_WINDOWS if employee.llm_model.startswith(prefix)]
+        window = MODEL_CONTEXT_WINDOWS[max(matches, key=len)] if matches else DEFAULT_CONTEXT_WINDOW
+
+        system_tokens = ContextService.count_tokens(llm_service.create_system_prompt(employee))
+        available = window - system_tokens - RESPONSE_TOKENS
+        return max(0, min(settings.CONTEXT_TOKEN_BUDGET, available))
+
+    @staticmethod
+    @tracer.traced()
+    async def build_context(meeting_id: str, employees: List[AIEmployee], db: AsyncSession) -> ConversationContext:
+        """
+        Assemble the conversation to send for a meeting turn.
+
+        The newest messages are kept until the tightest budget among `employees`
+        is spent. Anything older is represented by the meeting's rolling
+        summary, which is extended with the messages that have dropped out of
+        the window since it was last written.
+        """
+        message_repo = MessageRepository(db)
+        summary_repo = SummaryRepository(db)
+
+        recent = await message_repo.get_latest(meeting_id, limit=settings.CONTEXT_MAX_MESSAGES)
+        if not recent:
+            return ConversationContext(messages=[])
+
+        summary = await summary_repo.get_by_meeting_id(meeting_id)
+        if summary:
+            # Messages the summary already covers are not repeated, but the latest one always is
+            covered = next((i for i, msg in enumerate(recent) if msg.id == summary.last_message_id), None)
+            if covered is not None:
+                recent = recent[min(covered + 1, len(recent) - 1):]
+
+        budget = min(ContextService.token_budget(emp) for emp in employees)
+        window = ContextService._fit(recent, budget)
+        has_older = summary is not None or len(recent) >= settings.CONTEXT_MAX_MESSAGES or len(window) < len(recent)
+        if not has_older:
+            return ConversationContext(messages=window)
+
+        window = ContextService._fit(recent, budget - settings.CONTEXT_SUMMARY_TOKENS)
+        summary = await ContextService._refresh_summary(meeting_id, summary, window[0], employees[0], db)
+        return ConversationContext(summary=summary.content if summary else None, messages=window)
+
+    @staticmethod
+    def _fit(messages: List[Message], budget: int) -> List[Message]:
+        """Keep the newest messages that fit in the budget, and always the latest one."""
+        used = 0
+        start = len(messages)
+        while start > 0:
+            cost = ContextService.message_tokens(messages[start - 1])
+            if used + cost > budget and start < len(messages):
+                break
+            used += cost
+            start -= 1
+        return messages[start:]
+
+    @staticmethod
+    @tracer.traced()
+    async def _refresh_summary(
+        meeting_id: str,
+        summary: Optional[MeetingSummary],
+        window_start: Message,
+        employee: AIEmployee,
+        db: AsyncSession
+    ) -> Optional[MeetingSummary]:
+        """Fold messages between the summary and the window into the summary once enough have piled up."""
+        summary_repo = SummaryRepository(db)
+        pending = await MessageRepository(db).get_between(
+            meeting_id,
+            after=summary.last_message_id if summary else None,
+            before=window_start.id,
+            limit=settings.CONTEXT_SUMMARY_BATCH
+        )
+        if len(pending) < settings.CONTEXT_SUMMARY_MIN_MESSAGES:
+            return summary
+
+        # Don't hold a transaction, and its pooled connection, through the LLM call; saving opens a new one
+        await db.rollback()
+        try:
+            content = await llm_service.summarize(employee, summary.content if summary else None, pending)
+        except Exception as e:
+            # A stale summary is better than failing the turn
+            print(f"Failed to update summary for meeting {meeting_id}: {e}")
+            return summary
+
+        updated = MeetingSummary(
+            meeting_id=meeting_id,
+            content=content,
+            last_message_id=pending[-1].id,
+            message_count=(summary.message_count if summary else 0) + len(pending),
+            updated_at=datetime.now(timezone.utc)
+        )
+        if not await summary_repo.save(updated, previous=summary):
+            # Another turn extended the summary first; use theirs
+            return await summary_repo.get_by_meeting_id(meeting_id)
+        return updated
+
+# Global instance
+context_service = ContextService()
@@ -0,0 +1,175 @@
+"""
+Bounded worker pool for running CrewAI crews off the event loop.
+"""
+import asyncio
+import contextvars
+import functools
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+from app.models.employee import AIEmployee
+from app.models.message import ConversationContext, Message
+from app.models.meeting import Meeting
+from app.config import settings
+from app.metrics import register_stats
+from app.services.crew_service import crew_service
+from app.services.llm_clients import provider_for
+from app.services.mock_llm import mock_llm
+from app.tracing import tracer
+
+
+class CrewPoolFullError(Exception):
+    """Raised when the crew run queue is at capacity."""
+
+
+class CrewTimeoutError(Exception):
+    """Raised when a crew run exceeds its time limit."""
+
+
+def run_crew(meeting: Meeting, employees: List[AIEmployee], new_message: Message,
+             step_callback: Optional[Callable[[Any], None]] = None,
+             context: Optional[ConversationContext] = None) -> str:
+    """Kick off a cached or freshly built crew. Module-level so it can be shipped to a process pool."""
+    with tracer.span("crew.run", {"crew.agents": len(employees)}):
+        if any(provider_for(emp.llm_provider) == "mock" for emp in employees):
+            # CrewAI cannot drive the mock provider, so simulate the whole run on this worker instead
+            with tracer.span("crew.agent", {"crew.agent.role": "mock"}):
+                return mock_llm.complete_sync("crew")
+
+        started = time.monotonic()
+        key, crew = crew_service.checkout_crew(meeting.id, employees, step_callback=step_callback)
+        task = crew_service.create_task(meeting, new_message, context)
+        output = crew_service.kickoff_crew(crew, task)
+
+        # A crew whose run raised may be left mid-run, so only reuse crews that finished in time; drop the rest
+        if time.monotonic() - started <= settings.CREW_RUN_TIMEOUT:
+            crew_service.checkin_crew(key, crew)
+        return output
+
+
+class CrewExecutor:
+    """
+    Runs crews on a thread or process pool with a concurrency limit.
+
+    At most `max_workers` crews run at once; up to `max_queue` more wait for a
+    slot and anything beyond that is rejected. A run that exceeds `timeout`
+    seconds is reported as timed out to the caller, but its slot is only
+    released once the worker actually finishes so the limit stays honest.
+    """
+
+    def __init__(self, mode: str, max_workers: int, max_queue: int, timeout: float):
+        if mode not in ("thread", "process"):
+            raise ValueError(f"Unsupported crew executor mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+
+        self._executor: Optional[Executor] = None
+        self._slots = asyncio.Semaphore(max_workers)
+
+        # Counters exposed through stats()
+        self.active = 0
+        self.queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="crew")
+        return self._executor
+
+    @tracer.traced()
+    async def run(self, meeting: Meeting, employees: List[AIEmployee], new_message: Message,
+                  step_callback: Optional[Callable[[Any], None]] = None,
+                  context: Optional[ConversationContext] = None) -> str:
+        """Run a crew on the pool and return its raw output."""
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise CrewPoolFullError("Too many crew runs are queued, try again later")
+
+        # Step callbacks are closures over the event loop and cannot cross a process boundary
+        if self.mode == "process":
+            step_callback = None
+
+        enqueued_at = time.perf_counter()
+        self.queued += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+
+        started_at = time.perf_counter()
+        self._total_wait += started_at - enqueued_at
+        self.active += 1
+
+        # Worker threads start with an empty context; run in a copy so crew spans nest under this request
+        target = run_crew if self.mode == "process" else functools.partial(contextvars.copy_context().run, run_crew)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self._get_executor(), target, meeting, employees, new_message, step_callback, context
+        )
+        future.add_done_callback(lambda f: self._finish(f, started_at))
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise CrewTimeoutError(f"Crew run exceeded {self.timeout:g}s")
+
+    def _finish(self, future: asyncio.Future, started_at: float) -> None:
+        """Release the worker slot once the run has really finished."""
+        self.active -= 1
+        self._total_run += time.perf_counter() - started_at
+        if future.cancelled() or future.exception():
+            self.failed += 1
+        else:
+            self.completed += 1
+        self._slots.release()
+
+    def stats(self) -> dict:
+        """Snapshot of pool occupancy and run counters."""
+        finished = self.completed + self.failed
+        started = finished + self.active
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "timeout_seconds": self.timeout,
+            "active": self.active,
+            "queued": self.queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "rejected": self.rejected,
+            "avg_wait_ms": round(self._total_wait / started * 1000, 2) if started else 0.0,
+            "avg_run_ms": round(self._total_run / finished * 1000, 2) if finished else 0.0
+        }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and drop runs that have not started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# Global instance
+crew_executor = CrewExecutor(
+    mode=settings.CREW_EXECUTOR_MODE,
+    max_workers=settings.CREW_MAX_WORKERS,
+    max_queue=settings.CREW_MAX_QUEUE,
+    timeout=settings.CREW_RUN_TIMEOUT
+)
+register_stats("aiboss_crew_pool", crew_executor.stats, {
+    "max_workers": "Crews allowed to run at once",
+    "active": "Crews running",
+    "queued": "Crew runs waiting for a worker"
+})
@@ -1,16 +1,74 @@
 """
 Crew service for managing employee interactions and meetings.
 """
+import functools
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from app.models.employee import AIEmployee
-from app.models.message import Message
+from app.models.message import ConversationContext, Message
 from app.models.meeting import Meeting
 from app.config import settings
-from crewai import Agent, Crew, Task, Process
+from app.metrics import crew_kickoff_duration_seconds
+from app.database.repositories import employee_change_listeners
+from app.tracing import tracer
+
+# CrewAI takes seconds to import, so it is loaded on first use (or preloaded
+# in the background, see app.services.preload) rather than with this module
+if TYPE_CHECKING:
+    from crewai import Agent, Crew, Task
+
+CrewKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@functools.lru_cache(maxsize=None)
+def traced_agent_class() -> type:
+    """Build the TracedAgent class, importing CrewAI on the first call."""
+    from crewai import Agent
+
+    class TracedAgent(Agent):
+        """Agent that traces each task it works on, including work delegated to it by the manager."""
+
+        def execute_task(self, *args, **kwargs):
+            if not tracer.enabled:
+                return super().execute_task(*args, **kwargs)
+            with tracer.span("crew.agent", {"crew.agent.role": self.role}):
+                return super().execute_task(*args, **kwargs)
+
+    return TracedAgent
+
 
 class CrewService:
-    def __init__(self):
-        pass
+    def __init__(self, cache_size: int = settings.CREW_CACHE_SIZE):
+        # Idle crews per (meeting ID, ((employee ID, persona version), ...)), least recently used first.
+        # A crew is only ever handed to one run at a time; concurrent runs for the
+        # same meeting get a freshly built crew.
+        self.cache_size = cache_size
+        self._idle: "OrderedDict[CrewKey, List[Crew]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _persona_version(self, employee: AIEmployee) -> str:
+        """Hash the employee fields that shape their agent."""
+        persona = [
+            employee.name,
+            employee.role,
+            employee.personality,
+            employee.expertise,
+            employee.llm_provider,
+            employee.llm_model,
+            employee.system_prompt
+        ]
+        return hashlib.sha1(json.dumps(persona).encode()).hexdigest()[:16]
+
+    def _crew_key(self, meeting_id: str, employees: list[AIEmployee]) -> CrewKey:
+        return (str(meeting_id), tuple((emp.id, self._persona_version(emp)) for emp in employees))
 
     def _create_backstory(self, employee: AIEmployee) -> str:
         """Create a backstory for the employee based on their attributes."""
@@ -19,12 +77,13 @@ personality: {employee.personality}
 expertise: {", ".join(employee.expertise) if employee.expertise else "general knowledge"}
 """
 
-    def create_agent(self, employee: AIEmployee) -> Agent:
+    def create_agent(self, employee: AIEmployee) -> "Agent":
         """Create a CrewAI agent for the given employee."""
         if not employee.llm_provider or not employee.llm_model:
             raise ValueError("Employee must have a valid LLM provider and model")
 
-        agent = Agent(
+        TracedAgent = traced_agent_class()
+        agent = TracedAgent(
             role=employee.role,
             goal=f"Assist with tasks related to {employee.role}",
             backstory=self._create_backstory(employee),
@@ -33,8 +92,15 @@ expertise: {", ".join(employee.expertise) if employee.expertise else "general kn
         )
         return agent
 
-    def create_crew(self, employees: list[AIEmployee]) -> Crew:
-        """Create a Crew instance with the given employees."""
+    @tracer.traced()
+    def create_crew(self, employees: list[AIEmployee], step_callback: Optional[Callable[[Any], None]] = None) -> "Crew":
+        """
+        Create a Crew instance with the given employees.
+
+        `step_callback` is invoked by CrewAI after every intermediate agent step.
+        """
+        from crewai import Crew, Process
+
         agents = []
         for emp in employees:
             agent = self.create_agent(emp)
@@ -45,32 +111,123 @@ expertise: {", ".join(employee.expertise) if employee.expertise else "general kn
             tasks=[],
             verbose=True,
             process=Process.hierarchical,
-            manager_llm="openai/gpt-4.1"
+            manager_llm="openai/gpt-4.1",
+            step_callback=step_callback
         )
 
         return crew
+
+    def checkout_crew(self, meeting_id: str, employees: list[AIEmployee],
+                      step_callback: Optional[Callable[[Any], None]] = None) -> Tuple[CrewKey, "Crew"]:
+        """
+        Get an idle cached crew for the meeting's current employees, or build one.
+
+        Return the crew with checkin_crew() once its run has succeeded. A crew
+        whose run raised or timed out is dropped instead of being reused.
+        """
+        key = self._crew_key(meeting_id, employees)
+        with self._lock:
+            idle = self._idle.get(key)
+            crew = idle.pop() if idle else None
+            if crew:
+                self._idle.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if crew is None:
+            crew = self.create_crew(employees, step_callback=step_callback)
+        else:
+            # CrewAI copies the crew callback onto agents at kickoff, so reset both
+            crew.step_callback = step_callback
+            for agent in crew.agents:
+                agent.step_callback = step_callback
+
+        return key, crew
+
+    def checkin_crew(self, key: CrewKey, crew: "Crew") -> None:
+        """Return a crew to the idle cache, evicting the least recently used crews over capacity."""
+        crew.step_callback = None
+        for agent in crew.agents:
+            agent.step_callback = None
+
+        with self._lock:
+            self._idle.setdefault(key, []).append(crew)
+            self._idle.move_to_end(key)
+
+            size = sum(len(crews) for crews in self._idle.values())
+            while size > self.cache_size:
+                oldest_key, oldest = next(iter(self._idle.items()))
+                oldest.pop(0)
+                if not oldest:
+                    del self._idle[oldest_key]
+                size -= 1
+                self.evictions += 1
+
+    def invalidate_employee(self, employee_id: str) -> None:
+        """Drop cached crews that include the given employee."""
+        with self._lock:
+            for key in [key for key in self._idle if any(emp_id == employee_id for emp_id, _ in key[1])]:
+                self.evictions += len(self._idle.pop(key))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Snapshot of crew cache occupancy and hit rate."""
+        with self._lock:
+            return {
+                "capacity": self.cache_size,
+                "size": sum(len(crews) for crews in self._idle.values()),
+                "keys": len(self._idle),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions
+            }
     
-    def create_task(self, meeting: Meeting, new_message: Message) -> Task:
+    def create_task(self, meeting: Meeting, new_message: Message, context: Optional[ConversationContext] = None) -> "Task":
+        """Create the task for a turn, briefing the crew with the meeting summary and recent messages."""
+        from crewai import Task
+
         if not meeting or not new_message:
             raise ValueError("Meeting and message must be provided to create a task")
+
+        description = meeting.description or meeting.title
+        if context:
+            if context.summary:
+                description += f"\n\nSummary of the meeting so far:\n{context.summary}"
+            earlier = [msg for msg in context.messages if msg.id != new_message.id]
+            if earlier:
+                transcript = "\n".join(f"{msg.sender_name}: {msg.content}" for msg in earlier)
+                description += f"\n\nRecent conversation:\n{transcript}"
         
         task = Task(
-            description=meeting.description,
+            description=description,
             expected_output=new_message.content + "\nLimit the result to 900 characters.",
             markdown=True
         )
 
         return task
     
-    def kickoff_crew(self, crew: Crew, task: Task) -> str:
+    @tracer.traced()
+    def kickoff_crew(self, crew: "Crew", task: "Task") -> str:
         """Kick off the crew with the given task."""
         if not crew or not task:
             raise ValueError("Crew and task must be provided to kick off the crew")
         
+        # Cached crews keep the previous run's task, so replace rather than append
+        crew.tasks.clear()
         crew.tasks.append(task)
-        crew_output = crew.kickoff()
+        # CrewAI keeps the manager it built on the last kickoff, delegation tools and all,
+        # and refuses to run a manager that has tools; let it build a fresh one
+        crew.manager_agent = None
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            crew_output = crew.kickoff()
+            outcome = "success"
+        finally:
+            crew_kickoff_duration_seconds.labels(outcome).observe(time.perf_counter() - started)
 
         return crew_output.raw
     
 # Global instance
 crew_service = CrewService()
+employee_change_listeners.append(crew_service.invalidate_employee)
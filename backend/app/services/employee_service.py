@@ -3,25 +3,27 @@ Employee service for business logic related to AI employees.
 """
 from typing import List, Optional
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.employee import AIEmployee, AIEmployeeCreate
 from app.database.repositories import EmployeeRepository
+from app.tracing import tracer
 from app.services.llm_service import llm_service
 
 class EmployeeService:
     
     @staticmethod
-    def create_employee(employee_data: AIEmployeeCreate, db: Session) -> AIEmployee:
+    @tracer.traced()
+    async def create_employee(employee_data: AIEmployeeCreate, db: AsyncSession) -> AIEmployee:
         """Create a new AI employee."""
         employee_repo = EmployeeRepository(db)
         
         # Create the employee first to get an ID
-        new_employee = employee_repo.create(employee_data)
+        new_employee = await employee_repo.create(employee_data)
         
         # Generate system prompt using LLM service if not provided
         if not employee_data.system_prompt:
-            system_prompt = llm_service._create_system_prompt(new_employee)
+            system_prompt = llm_service.create_system_prompt(new_employee)
             # Update the employee with the generated system prompt
             updated_data = AIEmployeeCreate(
                 name=employee_data.name,
@@ -32,30 +34,33 @@ class EmployeeService:
                 llm_model=employee_data.llm_model,
                 system_prompt=system_prompt
             )
-            new_employee = employee_repo.update(new_employee.id, updated_data)
+            new_employee = await employee_repo.update(new_employee.id, updated_data)
         
         return new_employee
     
     @staticmethod
-    def get_all_employees(db: Session) -> List[AIEmployee]:
-        """Get all employees."""
+    @tracer.traced()
+    async def get_all_employee_rows(db: AsyncSession) -> List[dict]:
+        """Get all employees as JSON-ready rows, skipping model validation."""
         employee_repo = EmployeeRepository(db)
-        return employee_repo.get_all()
+        return await employee_repo.get_all_rows()
     
     @staticmethod
-    def get_employee(employee_id: str, db: Session) -> AIEmployee:
+    @tracer.traced()
+    async def get_employee(employee_id: str, db: AsyncSession) -> AIEmployee:
         """Get a specific employee by ID."""
         employee_repo = EmployeeRepository(db)
-        employee = employee_repo.get_by_id(employee_id)
+        employee = await employee_repo.get_by_id(employee_id)
         if not employee:
             raise HTTPException(status_code=404, detail="Employee not found")
         return employee
     
     @staticmethod
-    def delete_employee(employee_id: str, db: Session) -> dict:
+    @tracer.traced()
+    async def delete_employee(employee_id: str, db: AsyncSession) -> dict:
         """Delete an employee."""
         employee_repo = EmployeeRepository(db)
-        if not employee_repo.delete(employee_id):
+        if not await employee_repo.delete(employee_id):
             raise HTTPException(status_code=404, detail="Employee not found")
         
         return {"message": "Employee deleted successfully"}
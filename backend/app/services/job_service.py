@@ -0,0 +1,134 @@
+"""
+Job service for queueing crew responses and tracking their results.
+"""
+import asyncio
+from typing import AsyncIterator
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.tracing import tracer
+from app.database.database import SessionLocal
+from app.models.job import Job
+from app.database.repositories import JobRepository, MeetingRepository, EmployeeRepository, MessageRepository
+from app.services.message_service import message_service
+from app.services.sse import sse_event
+
+TERMINAL_STATUSES = ("succeeded", "failed")
+
+class JobService:
+
+    @staticmethod
+    @tracer.traced()
+    async def enqueue_response(meeting_id: str, employee_id: str, db: AsyncSession) -> Job:
+        """Queue a crew response for a meeting and return the job immediately."""
+        # Fail fast on requests the worker could never complete
+        meeting_repo = MeetingRepository(db)
+        if not await meeting_repo.get_by_id(meeting_id):
+            raise HTTPException(status_code=404, detail="Meeting not found")
+
+        employee_repo = EmployeeRepository(db)
+        if not await employee_repo.get_by_id(employee_id):
+            raise HTTPException(status_code=404, detail="Employee not found")
+
+        message_repo = MessageRepository(db)
+        if not await message_repo.get_latest(meeting_id, limit=1):
+            raise HTTPException(status_code=400, detail="No conversation history found for this meeting")
+
+        job_repo = JobRepository(db)
+        return await job_repo.create(meeting_id, employee_id)
+
+    @staticmethod
+    async def get_job(job_id: str, db: AsyncSession) -> Job:
+        """Get a specific job by ID."""
+        job_repo = JobRepository(db)
+        job = await job_repo.get_by_id(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
+
+    @staticmethod
+    async def stream_job(job_id: str, db: AsyncSession) -> AsyncIterator[str]:
+        """Validate the job and return a server-sent event stream of its status changes."""
+        job = await JobService.get_job(job_id, db)
+        return JobService._stream_job(job, db)
+
+    @staticmethod
+    async def _stream_job(job: Job, db: AsyncSession) -> AsyncIterator[str]:
+        job_repo = JobRepository(db)
+        # End each read transaction before waiting, so the connection goes back to the pool
+        # and the next poll sees the worker's commits
+        await db.rollback()
+        yield sse_event("status", job.model_dump(mode="json"))
+
+        while job.status not in TERMINAL_STATUSES:
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+            current = await job_repo.get_by_id(job.id)
+            await db.rollback()
+            if current.status != job.status:
+                yield sse_event("status", current.model_dump(mode="json"))
+            job = current
+
+    @staticmethod
+    @tracer.traced()
+    async def run_next(worker_id: str, db: AsyncSession) -> bool:
+        """
+        Claim and execute one job. Returns False when the queue is empty.
+
+        The job's lease is renewed while the crew runs; if it is lost anyway
+        (the job was reclaimed by another worker), this run is abandoned.
+        """
+        job_repo = JobRepository(db)
+        job = await job_repo.claim_next(worker_id, settings.JOB_LEASE_SECONDS, settings.JOB_MAX_ATTEMPTS)
+        if not job:
+            return False
+
+        work = asyncio.create_task(message_service.generate_employee_response(job.meeting_id, job.employee_id, db))
+        lease = asyncio.create_task(JobService._hold_lease(job.id, worker_id))
+        try:
+            await asyncio.wait((work, lease), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            lease.cancel()
+            if not work.done():
+                work.cancel()
+                await asyncio.gather(work, return_exceptions=True)
+                await db.rollback()
+
+        if work.cancelled():
+            print(f"Job {job.id} was reclaimed from worker {worker_id}; abandoning this run")
+            return True
+
+        try:
+            message = work.result()
+        except HTTPException as e:
+            await db.rollback()
+            if e.status_code == 503 and job.attempts < settings.JOB_MAX_ATTEMPTS:
+                # The crew pool is full: try again later rather than failing the job for good
+                finished = await job_repo.release(job.id, worker_id, str(e.detail), settings.JOB_RETRY_DELAY * job.attempts)
+            else:
+                finished = await job_repo.fail(job.id, worker_id, str(e.detail))
+        except Exception as e:
+            await db.rollback()
+            finished = await job_repo.fail(job.id, worker_id, f"Error generating response: {str(e)}")
+        else:
+            finished = await job_repo.complete(job.id, worker_id, message.id)
+
+        if not finished:
+            print(f"Job {job.id} was reclaimed from worker {worker_id} before it finished")
+        return True
+
+    @staticmethod
+    async def _hold_lease(job_id: str, worker_id: str) -> None:
+        """Renew a job's lease every JOB_HEARTBEAT_INTERVAL seconds. Returns once the lease has been lost."""
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_INTERVAL)
+            try:
+                # The job's own session is busy with the run, so renew on a separate one
+                async with SessionLocal() as db:
+                    if not await JobRepository(db).heartbeat(job_id, worker_id):
+                        return
+            except Exception as e:
+                print(f"Heartbeat for job {job_id} failed: {e}")
+
+# Global instance
+job_service = JobService()
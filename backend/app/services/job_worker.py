@@ -0,0 +1,57 @@
+"""
+Worker loop that executes queued crew jobs.
+"""
+import asyncio
+import os
+import socket
+from typing import List
+
+from app.config import settings
+from app.database.database import SessionLocal
+from app.services.job_service import job_service
+
+
+class JobWorker:
+    """
+    Polls the job table and runs claimed jobs.
+
+    Runs inside the API process (JOB_INLINE_WORKERS) or standalone through
+    worker.py, so crew execution can be scaled separately from the API tier.
+    """
+
+    def __init__(self, concurrency: int = 1, poll_interval: float = settings.JOB_POLL_INTERVAL):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._stopping = asyncio.Event()
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Start the polling loops on the running event loop."""
+        self._tasks = [asyncio.create_task(self._loop(n)) for n in range(self.concurrency)]
+
+    async def run(self) -> None:
+        """Start the polling loops and wait until stopped."""
+        self.start()
+        await asyncio.gather(*self._tasks)
+
+    async def stop(self) -> None:
+        """Finish in-flight jobs and stop polling."""
+        self._stopping.set()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _loop(self, slot: int) -> None:
+        worker_id = f"{self.worker_id}/{slot}"
+        while not self._stopping.is_set():
+            try:
+                async with SessionLocal() as db:
+                    ran = await job_service.run_next(worker_id, db)
+            except Exception as e:
+                print(f"Job worker {worker_id} error: {e}")
+                ran = False
+
+            if not ran:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
@@ -0,0 +1,94 @@
+"""
+Long-lived LLM provider clients shared across requests.
+"""
+from typing import TYPE_CHECKING, List
+
+from app.config import settings
+
+# Imported with the first client, like the SDKs themselves (see app.services.preload)
+if TYPE_CHECKING:
+    import httpx
+
+
+def provider_for(llm_provider: str) -> str:
+    """The provider to actually call; LLM_PROVIDER_OVERRIDE reroutes every employee."""
+    return settings.LLM_PROVIDER_OVERRIDE or llm_provider
+
+
+class LLMClients:
+    """
+    Holds one AsyncOpenAI and one AsyncAnthropic client per process.
+
+    Each client owns a pooled httpx connection so TLS handshakes and
+    connection setup are paid once rather than on every call. Clients are
+    created in the app lifespan and closed on shutdown, or lazily on first
+    use in processes without a lifespan (e.g. job workers).
+    """
+
+    def __init__(self):
+        self._openai = None
+        self._anthropic = None
+        self._http_clients: List["httpx.AsyncClient"] = []
+
+    def startup(self) -> None:
+        """Create clients for every provider with a configured API key."""
+        if settings.OPENAI_API_KEY:
+            self.openai()
+        if settings.ANTHROPIC_API_KEY:
+            self.anthropic()
+
+    def openai(self):
+        """Get the shared AsyncOpenAI client."""
+        if self._openai is None:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                raise ValueError("OpenAI library not installed. Please install with: pip install openai")
+            self._openai = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, http_client=self._create_http_client())
+        return self._openai
+
+    def anthropic(self):
+        """Get the shared AsyncAnthropic client."""
+        if self._anthropic is None:
+            try:
+                from anthropic import AsyncAnthropic
+            except ImportError:
+                raise ValueError("Anthropic library not installed. Please install with: pip install anthropic")
+            self._anthropic = AsyncAnthropic(api_key=settings.ANTHROPIC_API_KEY, http_client=self._create_http_client())
+        return self._anthropic
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        for http_client in self._http_clients:
+            await http_client.aclose()
+        self._http_clients = []
+        self._openai = None
+        self._anthropic = None
+
+    def _create_http_client(self) -> "httpx.AsyncClient":
+        import httpx
+
+        http_client = httpx.AsyncClient(
+            http2=self._http2_available(),
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY
+            ),
+            timeout=httpx.Timeout(settings.LLM_REQUEST_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT)
+        )
+        self._http_clients.append(http_client)
+        return http_client
+
+    def _http2_available(self) -> bool:
+        if not settings.LLM_HTTP2:
+            return False
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            print("LLM_HTTP2 is enabled but the h2 package is not installed; falling back to HTTP/1.1")
+            return False
+        return True
+
+# Global instance
+llm_clients = LLMClients()
@@ -1,96 +1,290 @@
 """
 LLM service for handling AI model interactions.
 """
-from typing import List
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
 from app.models.employee import AIEmployee
-from app.models.message import Message
+from app.models.message import ConversationContext, Message
 from app.models.meeting import Meeting
 from app.config import settings
-from app.services.crew_service import crew_service
+from app.metrics import observe_llm_call, record_llm_tokens
+from app.services.crew_executor import crew_executor
+from app.services.llm_clients import llm_clients, provider_for
+from app.services.mock_llm import mock_llm
+from app.services.response_cache import response_cache
 
 class LLMService:
     def __init__(self):
         self.openai_key = settings.OPENAI_API_KEY
         self.anthropic_key = settings.ANTHROPIC_API_KEY
     
-    async def generate_crew_response(self, meeting: Meeting, employees: List[AIEmployee], new_message: Message) -> str:
-        """Generate a response from the crew based on the new message."""
+    async def generate_crew_response(self, meeting: Meeting, employees: List[AIEmployee], new_message: Message,
+                                     context: Optional[ConversationContext] = None) -> str:
+        """Generate a response from the crew based on the new message and the conversation so far."""
         if not employees or not new_message:
             raise ValueError("Employees and new message must be provided to generate a response")
         
-        # Create a crew with the given employees
-        crew = crew_service.create_crew(employees)
-        
-        # Create a task for the crew based on the new message
-        task = crew_service.create_task(meeting, new_message)
-        
-        # Kick off the crew with the task
-        crew_output = crew_service.kickoff_crew(crew, task)
-        
-        return crew_output
+        # Build and kick off the crew on the worker pool so the event loop stays free
+        return await crew_executor.run(meeting, employees, new_message, context=context)
+
+    async def stream_crew_response(self, meeting: Meeting, employees: List[AIEmployee], new_message: Message,
+                                   context: Optional[ConversationContext] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the crew on the worker pool and yield its intermediate agent steps as they happen.
+
+        Yields {"type": "step", "data": {...}} events followed by a single
+        {"type": "result", "content": str} event with the final crew output.
+        """
+        if not employees or not new_message:
+            raise ValueError("Employees and new message must be provided to generate a response")
+
+        loop = asyncio.get_running_loop()
+        steps: asyncio.Queue = asyncio.Queue()
+
+        def on_step(step: Any) -> None:
+            # Called from the crew's worker thread
+            loop.call_soon_threadsafe(steps.put_nowait, self._describe_step(step))
+
+        run = asyncio.ensure_future(
+            crew_executor.run(meeting, employees, new_message, step_callback=on_step, context=context)
+        )
+        run.add_done_callback(lambda _: steps.put_nowait(None))
+
+        while True:
+            step = await steps.get()
+            if step is None:
+                break
+            yield {"type": "step", "data": step}
+
+        yield {"type": "result", "content": await run}
 
-    async def generate_response(self, employee: AIEmployee, conversation_history: List[Message]) -> str:
-        """Generate a response using the specified LLM provider based on the conversation history and new message."""
+    def _describe_step(self, step: Any) -> Dict[str, Any]:
+        """Reduce a CrewAI AgentAction/AgentFinish to a JSON-friendly dict."""
+        return {
+            "kind": type(step).__name__,
+            "thought": getattr(step, "thought", None),
+            "tool": getattr(step, "tool", None),
+            "output": getattr(step, "output", None) or getattr(step, "result", None)
+        }
+
+    async def generate_response(self, employee: AIEmployee, conversation_history: List[Message],
+                                raise_errors: bool = False, summary: Optional[str] = None) -> str:
+        """
+        Generate a response using the specified LLM provider based on the conversation history and new message.
+
+        `summary` covers the meeting before `conversation_history`. Errors are
+        returned as the response text unless `raise_errors` is set.
+        """
         try:
-            if employee.llm_provider == "openai":
-                return await self._generate_openai_response(employee, conversation_history)
-            elif employee.llm_provider == "anthropic":
-                return await self._generate_anthropic_response(employee, conversation_history)
+            provider = provider_for(employee.llm_provider)
+            if provider == "openai":
+                return await self._generate_openai_response(employee, conversation_history, summary)
+            elif provider == "anthropic":
+                return await self._generate_anthropic_response(employee, conversation_history, summary)
+            elif provider == "mock":
+                return await self._generate_mock_response(employee, conversation_history, summary)
             else:
                 raise ValueError("Unsupported LLM provider")
         except Exception as e:
+            if raise_errors:
+                raise
             return f"Error generating response: {str(e)}"
 
-    async def _generate_openai_response(self, employee: AIEmployee, conversation_history: List[Message]) -> str:
+    async def _generate_openai_response(self, employee: AIEmployee, conversation_history: List[Message],
+                                        summary: Optional[str] = None) -> str:
         if not self.openai_key:
             raise ValueError("OpenAI API key is not set")
         
+        client = llm_clients.openai()
+        messages = self._build_openai_messages(employee, conversation_history, summary)
+        params = {"max_tokens": 300, "temperature": 0.7}
+
+        async def create() -> str:
+            try:
+                with observe_llm_call("openai", employee.llm_model, "generate"):
+                    response = await client.chat.completions.create(
+                        model=employee.llm_model,
+                        messages=messages,
+                        **params
+                    )
+                self._record_openai_usage(employee.llm_model, response)
+                return response.choices[0].message.content.strip()
+            except Exception as e:
+                raise ValueError(f"OpenAI API error: {str(e)}")
+
+        key = response_cache.key("openai", employee.llm_model, params, messages)
+        return await response_cache.get_or_create(key, create)
+
+    async def _generate_anthropic_response(self, employee: AIEmployee, conversation_history: List[Message],
+                                           summary: Optional[str] = None) -> str:
+        if not self.anthropic_key:
+            raise ValueError("Anthropic API key is not set")
+        
+        client = llm_clients.anthropic()
+        prompt = self._build_anthropic_prompt(employee, conversation_history, summary)
+        params = {"max_tokens_to_sample": 300, "temperature": 0.7}
+
+        async def create() -> str:
+            with observe_llm_call("anthropic", employee.llm_model, "generate"):
+                response = await client.completions.create(
+                    model=employee.llm_model,
+                    prompt=prompt,
+                    **params
+                )
+            return response.completion.strip()
+
+        key = response_cache.key("anthropic", employee.llm_model, params, prompt)
+        return await response_cache.get_or_create(key, create)
+
+    async def _generate_mock_response(self, employee: AIEmployee, conversation_history: List[Message],
+                                      summary: Optional[str] = None) -> str:
+        # Rendered like a real request so the response cache behaves the same
+        messages = self._build_openai_messages(employee, conversation_history, summary)
+
+        async def create() -> str:
+            with observe_llm_call("mock", employee.llm_model, "generate"):
+                content = await mock_llm.complete(employee.llm_model)
+            record_llm_tokens("mock", employee.llm_model, completion_tokens=mock_llm.tokens)
+            return content
+
+        key = response_cache.key("mock", employee.llm_model, {}, messages)
+        return await response_cache.get_or_create(key, create)
+
+    async def stream_response(self, employee: AIEmployee, conversation_history: List[Message],
+                              summary: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream a response token by token using the employee's LLM provider."""
+        provider = provider_for(employee.llm_provider)
+        if provider == "openai":
+            stream = self._stream_openai_response(employee, conversation_history, summary)
+        elif provider == "anthropic":
+            stream = self._stream_anthropic_response(employee, conversation_history, summary)
+        elif provider == "mock":
+            stream = mock_llm.stream(employee.llm_model)
+        else:
+            raise ValueError("Unsupported LLM provider")
+
+        chunks = 0
         try:
-            from openai import AsyncOpenAI
-            client = AsyncOpenAI(api_key=self.openai_key)
-        except ImportError:
-            raise ValueError("OpenAI library not installed. Please install with: pip install openai")
+            with observe_llm_call(provider, employee.llm_model, "stream"):
+                async for token in stream:
+                    chunks += 1
+                    yield token
+        finally:
+            # Providers do not report usage on streams; each chunk is roughly one token
+            record_llm_tokens(provider, employee.llm_model, completion_tokens=chunks)
 
-        messages = [{"role": "system", "content": employee.system_prompt or self._create_system_prompt(employee)}]
+    async def _stream_openai_response(self, employee: AIEmployee, conversation_history: List[Message],
+                                      summary: Optional[str] = None) -> AsyncIterator[str]:
+        if not self.openai_key:
+            raise ValueError("OpenAI API key is not set")
 
-        for msg in conversation_history[-10:]:
-            role = "assistant" if msg.sender_type == "employee" else "user"
-            messages.append({"role": role, "content": f"{msg.sender_name}: {msg.content}"})
+        client = llm_clients.openai()
 
         try:
-            response = await client.chat.completions.create(
+            stream = await client.chat.completions.create(
                 model=employee.llm_model,
-                messages=messages,
+                messages=self._build_openai_messages(employee, conversation_history, summary),
                 max_tokens=300,
-                temperature=0.7
+                temperature=0.7,
+                stream=True
             )
-            return response.choices[0].message.content.strip()
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
         except Exception as e:
             raise ValueError(f"OpenAI API error: {str(e)}")
 
-    async def _generate_anthropic_response(self, employee: AIEmployee, conversation_history: List[Message]) -> str:
+    async def _stream_anthropic_response(self, employee: AIEmployee, conversation_history: List[Message],
+                                         summary: Optional[str] = None) -> AsyncIterator[str]:
         if not self.anthropic_key:
             raise ValueError("Anthropic API key is not set")
-        
-        import anthropic
-        client = anthropic.AsyncAnthropic(api_key=self.anthropic_key)
-
-        conversation = ""
-        for msg in conversation_history[-10:]:
-            conversation += f"{msg.sender_name}: {msg.content}\n"
 
-        prompt = f"{employee.system_prompt or self._create_system_prompt(employee)}\n\nConversation:\n{conversation}\n{employee.name}:"
+        client = llm_clients.anthropic()
 
-        response = await client.completions.create(
+        stream = await client.completions.create(
             model=employee.llm_model,
-            prompt=prompt,
+            prompt=self._build_anthropic_prompt(employee, conversation_history, summary),
             max_tokens_to_sample=300,
-            temperature=0.7
+            temperature=0.7,
+            stream=True
         )
+        async for completion in stream:
+            if completion.completion:
+                yield completion.completion
+
+    async def summarize(self, employee: AIEmployee, previous_summary: Optional[str], new_messages: List[Message]) -> str:
+        """Fold new messages into a meeting's running summary using the employee's model."""
+        transcript = "\n".join(f"{msg.sender_name}: {msg.content}" for msg in new_messages)
+        prompt = f"""Update the running summary of a meeting with the new messages below.
+Keep decisions, open questions, action items and who said what. Reply with the updated summary only, in under {settings.CONTEXT_SUMMARY_TOKENS // 2} words.
+
+Current summary:
+{previous_summary or "(none yet)"}
+
+New messages:
+{transcript}"""
+
+        provider = provider_for(employee.llm_provider)
+        if provider == "openai":
+            if not self.openai_key:
+                raise ValueError("OpenAI API key is not set")
+            with observe_llm_call(provider, employee.llm_model, "summarize"):
+                response = await llm_clients.openai().chat.completions.create(
+                    model=employee.llm_model,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=settings.CONTEXT_SUMMARY_TOKENS,
+                    temperature=0.2
+                )
+            self._record_openai_usage(employee.llm_model, response)
+            return response.choices[0].message.content.strip()
+        elif provider == "anthropic":
+            if not self.anthropic_key:
+                raise ValueError("Anthropic API key is not set")
+            with observe_llm_call(provider, employee.llm_model, "summarize"):
+                response = await llm_clients.anthropic().completions.create(
+                    model=employee.llm_model,
+                    prompt=f"{prompt}\n\nUpdated summary:",
+                    max_tokens_to_sample=settings.CONTEXT_SUMMARY_TOKENS,
+                    temperature=0.2
+                )
+            return response.completion.strip()
+        elif provider == "mock":
+            with observe_llm_call(provider, employee.llm_model, "summarize"):
+                content = await mock_llm.complete(employee.llm_model)
+            record_llm_tokens(provider, employee.llm_model, completion_tokens=mock_llm.tokens)
+            return content
+        else:
+            raise ValueError("Unsupported LLM provider")
+
+    def _record_openai_usage(self, model: str, response: Any) -> None:
+        usage = getattr(response, "usage", None)
+        if usage:
+            record_llm_tokens("openai", model, usage.prompt_tokens, usage.completion_tokens)
+
+    def _build_openai_messages(self, employee: AIEmployee, conversation_history: List[Message],
+                               summary: Optional[str] = None) -> List[Dict[str, str]]:
+        """Render the system prompt, earlier-meeting summary and history as chat completion messages."""
+        messages = [{"role": "system", "content": employee.system_prompt or self.create_system_prompt(employee)}]
+        if summary:
+            messages.append({"role": "system", "content": f"Summary of the meeting so far:\n{summary}"})
+
+        for msg in conversation_history:
+            role = "assistant" if msg.sender_type == "employee" else "user"
+            messages.append({"role": role, "content": f"{msg.sender_name}: {msg.content}"})
+
+        return messages
+
+    def _build_anthropic_prompt(self, employee: AIEmployee, conversation_history: List[Message],
+                                summary: Optional[str] = None) -> str:
+        """Render the system prompt, earlier-meeting summary and history as a text completion prompt."""
+        conversation = ""
+        for msg in conversation_history:
+            conversation += f"{msg.sender_name}: {msg.content}\n"
 
-        return response.completion.strip()
+        earlier = f"\n\nSummary of the meeting so far:\n{summary}" if summary else ""
+        return f"{employee.system_prompt or self.create_system_prompt(employee)}{earlier}\n\nConversation:\n{conversation}\n{employee.name}:"
 
-    def _create_system_prompt(self, employee: AIEmployee) -> str:
+    def create_system_prompt(self, employee: AIEmployee) -> str:
         """Create a system prompt based on the employee's personality and expertise."""
         expertise_str = ", ".join(employee.expertise) if employee.expertise else "general knowledge"
         prompt = f"""You are {employee.name}, a {employee.role} AI Employee.
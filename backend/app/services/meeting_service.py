@@ -3,39 +3,56 @@ Meeting service for business logic related to meetings.
 """
 from typing import List
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.meeting import Meeting, MeetingCreate
 from app.database.repositories import MeetingRepository, EmployeeRepository
+from app.tracing import tracer
 
 class MeetingService:
     
     @staticmethod
-    def create_meeting(meeting_data: MeetingCreate, db: Session) -> Meeting:
+    @tracer.traced()
+    async def create_meeting(meeting_data: MeetingCreate, db: AsyncSession) -> Meeting:
         """Create a new meeting."""
         # Validate that all employees exist
         employee_repo = EmployeeRepository(db)
-        for emp_id in meeting_data.employee_ids:
-            if not employee_repo.get_by_id(emp_id):
-                raise HTTPException(status_code=400, detail=f"Employee {emp_id} not found")
+        _, missing_ids = await employee_repo.get_many_by_ids(meeting_data.employee_ids)
+        if len(missing_ids) == 1:
+            raise HTTPException(status_code=400, detail=f"Employee {missing_ids[0]} not found")
+        if missing_ids:
+            raise HTTPException(status_code=400, detail=f"Employees {', '.join(missing_ids)} not found")
         
         meeting_repo = MeetingRepository(db)
-        return meeting_repo.create(meeting_data)
+        return await meeting_repo.create(meeting_data)
     
     @staticmethod
-    def get_all_meetings(db: Session) -> List[Meeting]:
-        """Get all meetings."""
+    @tracer.traced()
+    async def get_all_meeting_rows(db: AsyncSession) -> List[dict]:
+        """Get all meetings as JSON-ready rows, skipping model validation."""
         meeting_repo = MeetingRepository(db)
-        return meeting_repo.get_all()
+        return await meeting_repo.get_all_rows()
     
     @staticmethod
-    def get_meeting(meeting_id: str, db: Session) -> Meeting:
+    @tracer.traced()
+    async def get_meeting(meeting_id: str, db: AsyncSession) -> Meeting:
         """Get a specific meeting by ID."""
         meeting_repo = MeetingRepository(db)
-        meeting = meeting_repo.get_by_id(meeting_id)
+        meeting = await meeting_repo.get_by_id(meeting_id)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
         return meeting
 
+    @staticmethod
+    @tracer.traced()
+    async def get_employee_meetings(employee_id: str, db: AsyncSession) -> List[Meeting]:
+        """Get the meetings a specific employee participates in."""
+        employee_repo = EmployeeRepository(db)
+        if not await employee_repo.get_by_id(employee_id):
+            raise HTTPException(status_code=404, detail="Employee not found")
+
+        meeting_repo = MeetingRepository(db)
+        return await meeting_repo.get_by_employee_id(employee_id)
+
 # Global instance
 meeting_service = MeetingService()
@@ -0,0 +1,248 @@
+"""
+Fan-out of newly created meeting messages to live subscribers.
+"""
+import asyncio
+import contextlib
+import json
+import os
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.models.message import Message
+from app.database.repositories import message_created_listeners
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_MAX_BYTES = 7900
+
+
+class Subscription:
+    """One client's feed of a meeting's new messages."""
+
+    def __init__(self, meeting_id: str, queue_size: int):
+        self.meeting_id = meeting_id
+        self._queue: "asyncio.Queue[Optional[Message]]" = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def _put(self, message: Message) -> bool:
+        """Queue a message; returns False if the subscriber has fallen too far behind."""
+        try:
+            self._queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def _close(self) -> None:
+        """End the feed. Queued messages are dropped; the client catches up from its last message ID."""
+        self.overflowed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Message]:
+        """
+        Wait for the next message.
+
+        Returns None when `timeout` passes first; raises EOFError once the
+        subscription has been closed for falling behind.
+        """
+        try:
+            message = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if message is None:
+            raise EOFError("Subscriber fell behind")
+        return message
+
+
+class MessageHub:
+    """
+    Per-process fan-out of new messages to the meeting's subscribers.
+
+    Repositories report every committed message through publish(). With a
+    bridge attached, messages are also forwarded to the other processes, and
+    theirs are delivered here.
+    """
+
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[Subscription]] = {}
+        self.bridge: Optional["PostgresMessageBridge"] = None
+
+        # Counters exposed through stats()
+        self.published = 0
+        self.delivered = 0
+        self.dropped_subscribers = 0
+
+    def subscribe(self, meeting_id: str) -> Subscription:
+        subscription = Subscription(str(meeting_id), self.queue_size)
+        self._subscribers.setdefault(subscription.meeting_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.meeting_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.meeting_id]
+
+    def publish(self, message: Message) -> None:
+        """Deliver a message created in this process locally and to the other processes."""
+        self.published += 1
+        self.deliver(message)
+        if self.bridge is not None:
+            self.bridge.send(message)
+
+    def deliver(self, message: Message) -> None:
+        """Hand a message to this process's subscribers, closing any that have fallen behind."""
+        for subscription in list(self._subscribers.get(message.meeting_id, ())):
+            if subscription._put(message):
+                self.delivered += 1
+            else:
+                subscription._close()
+                self.unsubscribe(subscription)
+                self.dropped_subscribers += 1
+
+    async def start(self) -> None:
+        """Connect the cross-process bridge, if configured."""
+        if settings.MESSAGE_HUB_BRIDGE == "postgres":
+            self.bridge = PostgresMessageBridge(self, settings.ASYNC_DATABASE_URL, settings.MESSAGE_HUB_CHANNEL)
+            await self.bridge.start()
+        elif settings.MESSAGE_HUB_BRIDGE != "none":
+            raise ValueError(f"Unsupported message hub bridge: {settings.MESSAGE_HUB_BRIDGE}")
+
+    async def stop(self) -> None:
+        if self.bridge is not None:
+            await self.bridge.stop()
+            self.bridge = None
+
+    def stats(self) -> dict:
+        return {
+            "bridge": settings.MESSAGE_HUB_BRIDGE,
+            "meetings": len(self._subscribers),
+            "subscribers": sum(len(subscribers) for subscribers in self._subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped_subscribers": self.dropped_subscribers,
+            "bridge_sent": self.bridge.sent if self.bridge else 0,
+            "bridge_received": self.bridge.received if self.bridge else 0
+        }
+
+
+class PostgresMessageBridge:
+    """
+    Relays messages between processes over Postgres LISTEN/NOTIFY.
+
+    Outgoing messages are packed into as few NOTIFY payloads as fit. Each
+    payload carries this process's origin ID so it skips its own
+    notifications, which it has already delivered locally.
+    """
+
+    def __init__(self, hub: MessageHub, database_url: str, channel: str):
+        self.hub = hub
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self.origin = f"{os.getpid()}-{os.urandom(4).hex()}"
+        self._outgoing: "asyncio.Queue[Message]" = asyncio.Queue()
+        self._connection = None
+        self._task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.received = 0
+
+    def send(self, message: Message) -> None:
+        self._outgoing.put_nowait(message)
+
+    async def start(self) -> None:
+        await self._connect()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        await self._disconnect()
+
+    async def _connect(self) -> None:
+        import asyncpg
+
+        self._connection = await asyncpg.connect(self.dsn)
+        await self._connection.add_listener(self.channel, self._on_notify)
+
+    async def _disconnect(self) -> None:
+        """Close the connection, however broken, before dropping it so its LISTEN session doesn't leak."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            with contextlib.suppress(Exception):
+                await connection.close(timeout=5)
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        data = json.loads(payload)
+        if data["origin"] == self.origin:
+            return
+        for message in data["messages"]:
+            self.received += 1
+            self.hub.deliver(Message(**message))
+
+    def _pack(self, messages: List[Message]) -> List[str]:
+        """Split messages into NOTIFY payloads under the size limit."""
+        head = '{"origin": %s, "messages": [' % json.dumps(self.origin)
+        overhead = len(head) + 2
+        payloads, batch, size = [], [], overhead
+        for message in messages:
+            item = json.dumps(message.model_dump(mode="json"))
+            item_size = len(item.encode()) + 2
+            if overhead + item_size > NOTIFY_MAX_BYTES:
+                print(f"Message {message.id} is too large to relay to other processes")
+                continue
+            if size + item_size > NOTIFY_MAX_BYTES:
+                payloads.append(head + ", ".join(batch) + "]}")
+                batch, size = [], overhead
+            batch.append(item)
+            size += item_size
+        if batch:
+            payloads.append(head + ", ".join(batch) + "]}")
+        return payloads
+
+    async def _ensure_connected(self) -> None:
+        while self._connection is None or self._connection.is_closed():
+            try:
+                await self._connect()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Message bridge could not connect, retrying: {e}")
+                await self._disconnect()
+                await asyncio.sleep(1)
+
+    async def _run(self) -> None:
+        """Send queued messages, reconnecting (and so listening again) whenever the connection drops."""
+        while True:
+            try:
+                messages = [await asyncio.wait_for(self._outgoing.get(), settings.MESSAGE_HUB_HEALTH_INTERVAL)]
+            except asyncio.TimeoutError:
+                await self._ensure_connected()
+                continue
+            while not self._outgoing.empty():
+                messages.append(self._outgoing.get_nowait())
+
+            for payload in self._pack(messages):
+                while True:
+                    await self._ensure_connected()
+                    try:
+                        await self._connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+                        self.sent += 1
+                        break
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        print(f"Message bridge error, retrying: {e}")
+                        await self._disconnect()
+                        await asyncio.sleep(1)
+
+# Global instance
+message_hub = MessageHub(queue_size=settings.MESSAGE_STREAM_QUEUE_SIZE)
+message_created_listeners.append(message_hub.publish)
@@ -1,45 +1,95 @@
 """
 Message service for business logic related to messages.
 """
-from typing import List
+import asyncio
+from typing import AsyncIterator, List, Optional
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.message import Message, MessageCreate
+from app.models.employee import AIEmployee
+from app.models.meeting import Meeting
+from app.models.message import (
+    MESSAGE_MAX_LENGTH, ConversationContext, Message, MessageCreate, MessageBatchCreate, MessageBatchItem
+)
 from app.database.repositories import MessageRepository, MeetingRepository, EmployeeRepository
+from app.config import settings
+from app.tracing import tracer
 from app.services.llm_service import llm_service
+from app.services.context_service import context_service
+from app.services.message_hub import message_hub
+from app.services.sse import SSE_KEEPALIVE, sse_event
+from app.services.crew_executor import CrewPoolFullError, CrewTimeoutError
+
+
+def fit_reply(content: str) -> str:
+    """Trim a generated reply to the message length limit, rather than losing the whole turn to validation."""
+    return content.strip()[:MESSAGE_MAX_LENGTH].rstrip()
+
 
 class MessageService:
     
     @staticmethod
-    def send_message(meeting_id: str, message_data: MessageCreate, db: Session) -> Message:
+    @tracer.traced()
+    async def send_message(meeting_id: str, message_data: MessageCreate, db: AsyncSession) -> Message:
         """Send a message to a meeting."""
         # Validate meeting exists
         meeting_repo = MeetingRepository(db)
-        if not meeting_repo.get_by_id(meeting_id):
+        if not await meeting_repo.get_by_id(meeting_id):
             raise HTTPException(status_code=404, detail="Meeting not found")
         
         if message_data.sender_type == "user":
             sender_name = "User"
         else:
             employee_repo = EmployeeRepository(db)
-            employee = employee_repo.get_by_id(message_data.sender_id)
+            employee = await employee_repo.get_by_id(message_data.sender_id)
             if not employee:
                 raise HTTPException(status_code=400, detail="Employee not found")
             sender_name = employee.name
         
         message_repo = MessageRepository(db)
-        return message_repo.create(message_data, sender_name)
+        return await message_repo.create(message_data, sender_name)
     
     @staticmethod
-    async def generate_employee_response(meeting_id: str, employee_id: str, db: Session) -> Message:
+    @tracer.traced()
+    async def send_messages(meeting_id: str, batch: MessageBatchCreate, db: AsyncSession) -> List[Message]:
+        """Import a batch of messages into a meeting in one transaction."""
+        if len(batch.messages) > settings.MESSAGE_BATCH_MAX_SIZE:
+            raise HTTPException(status_code=413, detail=f"Batches are limited to {settings.MESSAGE_BATCH_MAX_SIZE} messages")
+
+        meeting_repo = MeetingRepository(db)
+        if not await meeting_repo.get_by_id(meeting_id):
+            raise HTTPException(status_code=404, detail="Meeting not found")
+
+        # Resolve every employee sender with a single query
+        sender_ids = [msg.sender_id for msg in batch.messages if msg.sender_type == "employee"]
+        if any(not sender_id for sender_id in sender_ids):
+            raise HTTPException(status_code=400, detail="Employee messages require a sender_id")
+
+        employee_repo = EmployeeRepository(db)
+        employees, missing_ids = await employee_repo.get_many_by_ids(sender_ids)
+        if missing_ids:
+            raise HTTPException(status_code=400, detail=f"Employees {', '.join(missing_ids)} not found")
+
+        # With nothing missing, employees line up with the de-duplicated sender IDs
+        names = dict(zip(dict.fromkeys(sender_ids), (emp.name for emp in employees)))
+        sender_names = [
+            names[msg.sender_id] if msg.sender_type == "employee" else "User"
+            for msg in batch.messages
+        ]
+
+        message_repo = MessageRepository(db)
+        return await message_repo.create_many(meeting_id, batch.messages, sender_names)
+    
+    @staticmethod
+    @tracer.traced()
+    async def generate_employee_response(meeting_id: str, employee_id: str, db: AsyncSession) -> Message:
         """Generate an AI employee response to the conversation."""
         # Validate meeting and employee exist
         meeting_repo = MeetingRepository(db)
         employee_repo = EmployeeRepository(db)
         message_repo = MessageRepository(db)
         
-        meeting = meeting_repo.get_by_id(meeting_id)
+        meeting = await meeting_repo.get_by_id(meeting_id)
         if not meeting:
             raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -47,16 +97,29 @@ class MessageService:
         # if not employee:
         #     raise HTTPException(status_code=404, detail="Employee not found")
         # get list of employees in the meeting
-        employees = employee_repo.get_by_meeting_id(meeting_id)
+        employees = await employee_repo.get_by_meeting_id(meeting_id)
         if not employees:
             raise HTTPException(status_code=404, detail="No employees found for this meeting")
 
-        conversation_history = message_repo.get_by_meeting_id(meeting_id)[-1]
+        context = await context_service.build_context(meeting_id, employees, db)
 
-        if not conversation_history:
+        if not context.messages:
             raise HTTPException(status_code=400, detail="No conversation history found for this meeting")
+        # End the read transaction so the connection goes back to the pool while the LLM works; the insert opens a new one
+        await db.rollback()
+
+        try:
+            response_content = await llm_service.generate_crew_response(
+                meeting=meeting, employees=employees, new_message=context.messages[-1], context=context
+            )
+        except CrewPoolFullError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        except CrewTimeoutError as e:
+            raise HTTPException(status_code=504, detail=str(e))
 
-        response_content = await llm_service.generate_crew_response(meeting=meeting, employees=employees, new_message=conversation_history)
+        response_content = fit_reply(response_content or "")
+        if not response_content:
+            raise HTTPException(status_code=502, detail="The crew returned an empty response")
 
         # Create the response message
         message_data = MessageCreate(
@@ -66,17 +129,249 @@ class MessageService:
             sender_id=employee_id
         )
 
-        return message_repo.create(message_data, "Crew Response")
+        return await message_repo.create(message_data, "Crew Response")
+    
+    @staticmethod
+    @tracer.traced()
+    async def generate_round_table_responses(meeting_id: str, db: AsyncSession) -> List[Message]:
+        """
+        Ask every employee in the meeting to reply to the conversation at once.
+
+        Replies are generated concurrently (capped by ROUND_TABLE_CONCURRENCY),
+        so a turn takes as long as the slowest employee rather than the sum of
+        all of them. Each reply is stored as its own message from that employee.
+        """
+        meeting_repo = MeetingRepository(db)
+        employee_repo = EmployeeRepository(db)
+        message_repo = MessageRepository(db)
+
+        if not await meeting_repo.get_by_id(meeting_id):
+            raise HTTPException(status_code=404, detail="Meeting not found")
+
+        employees = await employee_repo.get_by_meeting_id(meeting_id)
+        if not employees:
+            raise HTTPException(status_code=404, detail="No employees found for this meeting")
+
+        context = await context_service.build_context(meeting_id, employees, db)
+        if not context.messages:
+            raise HTTPException(status_code=400, detail="No conversation history found for this meeting")
+        # End the read transaction so the connection goes back to the pool while the LLM works; the insert opens a new one
+        await db.rollback()
+
+        slots = asyncio.Semaphore(settings.ROUND_TABLE_CONCURRENCY)
+
+        async def reply(employee: AIEmployee) -> str:
+            async with slots:
+                return await llm_service.generate_response(
+                    employee, context.messages, raise_errors=True, summary=context.summary
+                )
+
+        results = await asyncio.gather(*(reply(emp) for emp in employees), return_exceptions=True)
+
+        replies, speakers = [], []
+        for employee, result in zip(employees, results):
+            if isinstance(result, Exception):
+                print(f"Round-table reply from {employee.name} failed: {result}")
+                continue
+            content = fit_reply(result or "")
+            if not content:
+                continue
+            replies.append(MessageBatchItem(content=content, sender_type="employee", sender_id=employee.id))
+            speakers.append(employee.name)
+
+        if not replies:
+            raise HTTPException(status_code=502, detail="No employee was able to respond")
+
+        return await message_repo.create_many(meeting_id, replies, speakers)
+
+    @staticmethod
+    @tracer.traced()
+    async def stream_employee_response(meeting_id: str, employee_id: str, db: AsyncSession, mode: str = "crew") -> AsyncIterator[str]:
+        """
+        Validate the request and return a server-sent event stream for the response.
+
+        In "crew" mode the stream carries the crew's intermediate agent steps; in
+        "direct" mode it carries the employee's reply token by token. Either way
+        the final message is persisted and sent as the last event.
+        """
+        meeting_repo = MeetingRepository(db)
+        employee_repo = EmployeeRepository(db)
+        message_repo = MessageRepository(db)
+
+        meeting = await meeting_repo.get_by_id(meeting_id)
+        if not meeting:
+            raise HTTPException(status_code=404, detail="Meeting not found")
+
+        employees = await employee_repo.get_by_meeting_id(meeting_id)
+        if not employees:
+            raise HTTPException(status_code=404, detail="No employees found for this meeting")
+
+        employee = next((emp for emp in employees if emp.id == employee_id), None)
+        if mode == "direct" and not employee:
+            raise HTTPException(status_code=404, detail="Employee not found in this meeting")
+
+        # Direct replies only need to fit the one employee's model
+        context = await context_service.build_context(meeting_id, [employee] if mode == "direct" else employees, db)
+        if not context.messages:
+            raise HTTPException(status_code=400, detail="No conversation history found for this meeting")
+        # End the read transaction so the connection goes back to the pool while the LLM works; the insert opens a new one
+        await db.rollback()
+
+        return MessageService._stream_response(
+            meeting, employees, employee, employee_id, context, mode, message_repo
+        )
+
+    @staticmethod
+    async def _stream_response(
+        meeting: Meeting,
+        employees: List[AIEmployee],
+        employee: Optional[AIEmployee],
+        employee_id: str,
+        context: ConversationContext,
+        mode: str,
+        message_repo: MessageRepository
+    ) -> AsyncIterator[str]:
+        """Yield SSE frames for a response and persist it once complete."""
+        # Flush headers and a first frame right away so clients see progress immediately
+        yield sse_event("start", {"meeting_id": meeting.id, "mode": mode})
+
+        try:
+            if mode == "direct":
+                tokens = []
+                async for token in llm_service.stream_response(employee, context.messages, summary=context.summary):
+                    tokens.append(token)
+                    yield sse_event("token", {"content": token})
+                response_content = "".join(tokens)
+                sender_name = employee.name
+            else:
+                response_content = ""
+                async for event in llm_service.stream_crew_response(meeting, employees, context.messages[-1], context=context):
+                    if event["type"] == "step":
+                        yield sse_event("step", event["data"])
+                    else:
+                        response_content = event["content"]
+                sender_name = "Crew Response"
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Error generating response: {str(e)}"})
+            return
+
+        # Headers and tokens have already gone out, so failures from here on must be reported in-stream too
+        response_content = fit_reply(response_content or "")
+        if not response_content:
+            yield sse_event("error", {"detail": "Error generating response: the reply was empty"})
+            return
+        try:
+            message_data = MessageCreate(
+                meeting_id=meeting.id,
+                content=response_content,
+                sender_type="employee",
+                sender_id=employee_id
+            )
+            message = await message_repo.create(message_data, sender_name)
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Error saving response: {str(e)}"})
+            return
+        yield sse_event("message", message.model_dump(mode="json"))
     
     @staticmethod
-    def get_messages(meeting_id: str, db: Session) -> List[Message]:
-        """Get all messages for a meeting."""
+    @tracer.traced()
+    async def get_messages(
+        meeting_id: str,
+        db: AsyncSession,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Message]:
+        """Get a page of messages for a meeting."""
         meeting_repo = MeetingRepository(db)
-        if not meeting_repo.get_by_id(meeting_id):
+        if not await meeting_repo.get_by_id(meeting_id):
             raise HTTPException(status_code=404, detail="Meeting not found")
         
         message_repo = MessageRepository(db)
-        return message_repo.get_by_meeting_id(meeting_id)
+        try:
+            return await message_repo.get_by_meeting_id(meeting_id, before=before, after=after, limit=limit)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    @tracer.traced()
+    async def get_message_rows(
+        meeting_id: str,
+        db: AsyncSession,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[dict]:
+        """Get a page of messages for a meeting as JSON-ready rows, skipping model validation."""
+        meeting_repo = MeetingRepository(db)
+        if not await meeting_repo.get_by_id(meeting_id):
+            raise HTTPException(status_code=404, detail="Meeting not found")
+
+        message_repo = MessageRepository(db)
+        try:
+            return await message_repo.get_page_rows(meeting_id, before=before, after=after, limit=limit)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @staticmethod
+    async def follow_messages(meeting_id: str, db: AsyncSession, after: Optional[str] = None) -> AsyncIterator[Optional[Message]]:
+        """
+        Validate the meeting and return a live feed of its messages.
+
+        The feed starts with the messages after `after` (or the latest page when
+        no cursor is given), then yields each new message as it is created, and
+        None whenever MESSAGE_STREAM_HEARTBEAT seconds pass without one.
+        """
+        meeting_repo = MeetingRepository(db)
+        if not await meeting_repo.get_by_id(meeting_id):
+            raise HTTPException(status_code=404, detail="Meeting not found")
+        return MessageService._follow(meeting_id, db, after)
+
+    @staticmethod
+    async def _follow(meeting_id: str, db: AsyncSession, after: Optional[str]) -> AsyncIterator[Optional[Message]]:
+        # Subscribe before reading the backlog so nothing created in between is missed
+        subscription = message_hub.subscribe(meeting_id)
+        try:
+            message_repo = MessageRepository(db)
+            backlog = await message_repo.get_by_meeting_id(
+                meeting_id, after=after, limit=None if after else settings.MESSAGES_PAGE_SIZE
+            )
+            # End the read transaction so the connection goes back to the pool while the feed idles
+            await db.rollback()
+
+            for message in backlog:
+                yield message
+
+            seen = {message.id for message in backlog}
+            while True:
+                message = await subscription.get(settings.MESSAGE_STREAM_HEARTBEAT)
+                if message is None or message.id not in seen:
+                    yield message
+        except EOFError:
+            # Fell behind; the client reconnects and catches up from its last message
+            return
+        finally:
+            message_hub.unsubscribe(subscription)
+
+    @staticmethod
+    async def stream_messages(meeting_id: str, db: AsyncSession, after: Optional[str] = None) -> AsyncIterator[str]:
+        """Validate the meeting and return its live message feed as server-sent events."""
+        feed = await MessageService.follow_messages(meeting_id, db, after)
+        return MessageService._stream_messages(feed)
+
+    @staticmethod
+    async def _stream_messages(feed: AsyncIterator[Optional[Message]]) -> AsyncIterator[str]:
+        try:
+            async for message in feed:
+                if message is None:
+                    yield SSE_KEEPALIVE
+                else:
+                    yield sse_event("message", message.model_dump(mode="json"), event_id=message.id)
+        except ValueError as e:
+            # Unknown cursor
+            yield sse_event("error", {"detail": str(e)})
+        finally:
+            await feed.aclose()
 
 # Global instance
 message_service = MessageService()
@@ -0,0 +1,145 @@
+"""
+In-process stand-in for the LLM providers, for load testing without keys or network.
+"""
+import asyncio
+import math
+import random
+import threading
+import time
+from typing import AsyncIterator, List, Optional
+
+from app.config import settings
+
+LATENCY_DISTRIBUTIONS = ("fixed", "uniform", "normal", "lognormal", "exponential")
+
+_WORDS = (
+    "we", "should", "align", "on", "the", "roadmap", "before", "next", "sprint", "I", "think",
+    "customers", "need", "a", "simpler", "onboarding", "flow", "and", "clearer", "pricing",
+    "let's", "review", "metrics", "with", "engineering", "marketing", "budget", "risk", "plan",
+    "timeline", "launch", "feedback", "priority", "quality", "support", "data", "goal", "team"
+)
+
+
+class MockLLMError(Exception):
+    """Simulated provider failure."""
+
+
+class MockLLM:
+    """
+    Fake completions with configurable timing and failure behaviour.
+
+    Each call waits a latency drawn from `distribution` (mean `latency_ms`,
+    spread `stddev_ms`) before its first token, then emits `tokens` words one
+    chunk every `chunk_ms` when streaming. A fraction `error_rate` of calls
+    fail with MockLLMError. Passing `seed` makes runs reproducible.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float,
+        stddev_ms: float = 0,
+        distribution: str = "fixed",
+        chunk_ms: float = 0,
+        tokens: int = 50,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unsupported mock latency distribution: {distribution}")
+
+        self.latency_ms = latency_ms
+        self.stddev_ms = stddev_ms
+        self.distribution = distribution
+        self.chunk_ms = chunk_ms
+        self.tokens = tokens
+        self.error_rate = error_rate
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # Counters exposed through stats()
+        self.calls = 0
+        self.errors = 0
+        self.tokens_generated = 0
+
+    def _latency(self) -> float:
+        """Draw a time-to-first-token in seconds."""
+        mean, spread = self.latency_ms, self.stddev_ms
+        with self._lock:
+            if self.distribution == "uniform":
+                value = self._random.uniform(mean - spread, mean + spread)
+            elif self.distribution == "normal":
+                value = self._random.gauss(mean, spread)
+            elif self.distribution == "lognormal":
+                # Parameterised so the samples have the configured mean and standard deviation
+                sigma = math.sqrt(math.log(1 + (spread / mean) ** 2)) if mean > 0 else 0.0
+                value = self._random.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma) if mean > 0 else 0.0
+            elif self.distribution == "exponential":
+                value = self._random.expovariate(1 / mean) if mean > 0 else 0.0
+            else:
+                value = mean
+        return max(0.0, value) / 1000
+
+    def _start_call(self, model: str) -> List[str]:
+        """Count the call, decide whether it fails and pick its reply words."""
+        with self._lock:
+            self.calls += 1
+            failed = self._random.random() < self.error_rate
+            if failed:
+                self.errors += 1
+            words = [self._random.choice(_WORDS) for _ in range(self.tokens)]
+        if failed:
+            raise MockLLMError(f"Simulated {model} provider error")
+        return words
+
+    def _finish_call(self, words: List[str]) -> str:
+        with self._lock:
+            self.tokens_generated += len(words)
+        return " ".join(words)
+
+    async def complete(self, model: str) -> str:
+        """Return a whole reply after the simulated latency."""
+        await asyncio.sleep(self._latency())
+        words = self._start_call(model)
+        await asyncio.sleep(self.chunk_ms * len(words) / 1000)
+        return self._finish_call(words)
+
+    async def stream(self, model: str) -> AsyncIterator[str]:
+        """Yield a reply word by word, pausing `chunk_ms` between chunks."""
+        await asyncio.sleep(self._latency())
+        words = self._start_call(model)
+        for i, word in enumerate(words):
+            if i:
+                await asyncio.sleep(self.chunk_ms / 1000)
+            yield word if i == 0 else " " + word
+        self._finish_call(words)
+
+    def complete_sync(self, model: str) -> str:
+        """Blocking variant for crew runs on the worker pool."""
+        time.sleep(self._latency())
+        words = self._start_call(model)
+        time.sleep(self.chunk_ms * len(words) / 1000)
+        return self._finish_call(words)
+
+    def stats(self) -> dict:
+        return {
+            "distribution": self.distribution,
+            "latency_ms": self.latency_ms,
+            "stddev_ms": self.stddev_ms,
+            "chunk_ms": self.chunk_ms,
+            "tokens": self.tokens,
+            "error_rate": self.error_rate,
+            "calls": self.calls,
+            "errors": self.errors,
+            "tokens_generated": self.tokens_generated
+        }
+
+# Global instance
+mock_llm = MockLLM(
+    latency_ms=settings.MOCK_LLM_LATENCY_MS,
+    stddev_ms=settings.MOCK_LLM_LATENCY_STDDEV_MS,
+    distribution=settings.MOCK_LLM_LATENCY_DISTRIBUTION,
+    chunk_ms=settings.MOCK_LLM_CHUNK_MS,
+    tokens=settings.MOCK_LLM_TOKENS,
+    error_rate=settings.MOCK_LLM_ERROR_RATE,
+    seed=settings.MOCK_LLM_SEED
+)
@@ -0,0 +1,83 @@
+"""
+Off-the-request-path loading of the LLM SDKs and CrewAI.
+
+None of these are imported when the app is: CrewAI alone takes seconds,
+which used to delay every process start (and every worker restart) before
+it could answer a request. They are loaded on first use, or ahead of it by
+preload_modules() once the server is up.
+"""
+import asyncio
+import importlib
+import time
+from typing import Dict, Optional
+
+from app.config import settings
+from app.services.llm_clients import llm_clients
+
+# Slow imports kept out of `import app.main`; benchmarks/import_time.py fails if one creeps back in
+HEAVY_MODULES = ("httpx", "openai", "anthropic", "crewai")
+
+
+class Preloader:
+    """Imports the heavy modules on a worker thread and records how long each took."""
+
+    def __init__(self):
+        self.status = "idle"  # 'idle', 'running', 'done' or 'failed'
+        self.timings: Dict[str, float] = {}
+        self.skipped: Dict[str, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def import_modules(self) -> None:
+        """Import each heavy module. Missing or broken ones are skipped; their first use reports the error."""
+        for name in HEAVY_MODULES:
+            started = time.perf_counter()
+            try:
+                importlib.import_module(name)
+            except Exception as e:
+                self.skipped[name] = f"{type(e).__name__}: {e}"
+                continue
+            self.timings[name] = time.perf_counter() - started
+
+    async def preload(self) -> None:
+        """Import the heavy modules off the event loop, then open the LLM provider clients."""
+        self.status = "running"
+        try:
+            await asyncio.to_thread(self.import_modules)
+            llm_clients.startup()
+        except Exception as e:
+            self.status = "failed"
+            print(f"Preloading LLM modules failed: {e}")
+            return
+        self.status = "done"
+        loaded = ", ".join(f"{name} in {seconds:.2f}s" for name, seconds in self.timings.items())
+        print(f"Preloaded {loaded or 'nothing'}" + (f" (skipped {', '.join(self.skipped)})" if self.skipped else ""))
+
+    async def start(self) -> None:
+        """Preload according to PRELOAD_MODULES: in the background, before startup completes, or not at all."""
+        if settings.PRELOAD_MODULES == "background":
+            self._task = asyncio.create_task(self.preload())
+        elif settings.PRELOAD_MODULES == "startup":
+            await self.preload()
+        elif settings.PRELOAD_MODULES != "none":
+            raise ValueError(f"Unsupported preload mode: {settings.PRELOAD_MODULES}")
+
+    async def stop(self) -> None:
+        """Stop waiting for a background preload. An import already under way finishes on its thread."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "mode": settings.PRELOAD_MODULES,
+            "status": self.status,
+            "import_seconds": {name: round(seconds, 3) for name, seconds in self.timings.items()},
+            "skipped": self.skipped
+        }
+
+# Global instance
+preloader = Preloader()
@@ -0,0 +1,191 @@
+"""
+Content-addressed cache for LLM completions.
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.config import settings
+from app.database.cache import MemoryCacheBackend
+
+
+class SQLiteResponseStore:
+    """
+    On-disk store so cached responses survive restarts and are shared by the
+    worker processes on one host.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_responses_accessed_at ON llm_responses (accessed_at)")
+            self._conn = conn
+        return self._conn
+
+    def _get_many(self, keys: List[str]) -> List[Optional[str]]:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            rows = dict(conn.execute(
+                f"SELECT key, value FROM llm_responses WHERE expires_at > ? AND key IN ({','.join('?' * len(keys))})",
+                [now, *keys]
+            ).fetchall())
+            if rows:
+                conn.execute(
+                    f"UPDATE llm_responses SET accessed_at = ? WHERE key IN ({','.join('?' * len(rows))})",
+                    [now, *rows]
+                )
+        return [rows.get(key) for key in keys]
+
+    def _set(self, key: str, value: str, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now)
+            )
+            # Drop expired entries, then the least recently used ones over capacity
+            conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM llm_responses WHERE key IN "
+                "(SELECT key FROM llm_responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def _delete(self, keys: List[str]) -> None:
+        with self._lock:
+            self._connect().execute(
+                f"DELETE FROM llm_responses WHERE key IN ({','.join('?' * len(keys))})", keys
+            )
+
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        return await asyncio.to_thread(self._get_many, keys)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+    async def delete(self, keys: List[str]) -> None:
+        await asyncio.to_thread(self._delete, keys)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class ResponseCache:
+    """
+    Serves repeated LLM requests from a store instead of the provider.
+
+    Requests are keyed by a hash of the provider, model, sampling parameters
+    and the fully rendered prompt, so any change to the persona, history or
+    settings is a different entry. Concurrent identical requests share one
+    upstream call. Failed calls are never cached.
+    """
+
+    def __init__(self, store=None, ttl: float = 3600):
+        self.store = store
+        self.ttl = ttl
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    @staticmethod
+    def key(provider: str, model: str, params: Dict[str, Any], prompt: Any) -> str:
+        """Hash everything that determines a completion."""
+        payload = json.dumps([provider, model, params, prompt], sort_keys=True, separators=(",", ":"))
+        return "llm:" + hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get_or_create(self, key: str, create: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached completion for `key`, or call `create` once and cache its result."""
+        if self.store is None:
+            return await create()
+
+        cached = (await self.store.get_many([key]))[0]
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            # Wait without inheriting the leader's cancellation
+            await asyncio.wait([inflight])
+            if inflight.cancelled():
+                return await self.get_or_create(key, create)
+            return inflight.result()
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await create()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self.errors += 1
+            future.set_exception(e)
+            future.exception()  # waiters re-raise it; don't warn when there are none
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(value)
+        try:
+            await self.store.set(key, value, self.ttl)
+        except Exception as e:
+            print(f"Failed to cache LLM response: {e}")
+        return value
+
+    async def close(self) -> None:
+        if self.store is not None:
+            await self.store.close()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "backend": type(self.store).__name__ if self.store else None,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "in_flight": len(self._inflight),
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 4) if lookups else 0.0
+        }
+
+
+def create_response_cache() -> ResponseCache:
+    """Build the cache selected by LLM_CACHE_BACKEND ('none', 'memory' or 'sqlite')."""
+    if settings.LLM_CACHE_BACKEND == "memory":
+        store = MemoryCacheBackend(settings.LLM_CACHE_MAX_ENTRIES)
+    elif settings.LLM_CACHE_BACKEND == "sqlite":
+        store = SQLiteResponseStore(settings.LLM_CACHE_PATH, settings.LLM_CACHE_MAX_ENTRIES)
+    elif settings.LLM_CACHE_BACKEND == "none":
+        store = None
+    else:
+        raise ValueError(f"Unsupported LLM cache backend: {settings.LLM_CACHE_BACKEND}")
+    return ResponseCache(store, ttl=settings.LLM_CACHE_TTL)
+
+# Global instance
+response_cache = create_response_cache()
@@ -0,0 +1,14 @@
+"""
+Server-sent event helpers.
+"""
+import json
+from typing import Optional
+
+# Comment frame that keeps idle connections open through proxies
+SSE_KEEPALIVE = ": keepalive\n\n"
+
+
+def sse_event(event: str, data: dict, event_id: Optional[str] = None) -> str:
+    """Format a server-sent event frame. `event_id` is echoed back as Last-Event-ID when the client reconnects."""
+    frame = f"id: {event_id}\n" if event_id else ""
+    return frame + f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -0,0 +1,244 @@
+"""
+Lightweight span tracing across routers, services, repositories, crews and LLM calls.
+
+Spans follow OpenTelemetry conventions (128-bit trace IDs, 64-bit span IDs,
+parent links, semantic attribute names such as http.route, db.statement and
+gen_ai.request.model), so exported spans can be loaded by OTel tooling.
+"""
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+
+
+class Span:
+    """One timed operation in a trace."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "kind", "attributes", "status", "start_ns", "end_ns")
+
+    def __init__(self, name: str, parent: Optional["Span"], kind: str, attributes: Optional[Dict[str, Any]]):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.kind = kind
+        self.attributes = dict(attributes) if attributes else {}
+        self.status = "OK"
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status = "ERROR"
+        self.attributes["exception.type"] = type(exc).__name__
+        self.attributes["exception.message"] = str(exc)[:500]
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3) if self.end_ns else None,
+            "status": self.status,
+            "attributes": self.attributes
+        }
+
+
+class _NoopSpan:
+    """Stands in for a span when tracing is off."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class MemorySpanExporter:
+    """Keeps the most recent spans in memory for /system/traces."""
+
+    def __init__(self, max_spans: int):
+        self._spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span.to_dict())
+
+    def traces(self, limit: int) -> List[dict]:
+        """Group the buffered spans into the `limit` most recent traces, newest first."""
+        with self._lock:
+            spans = list(self._spans)
+
+        traces: "OrderedDict[str, List[dict]]" = OrderedDict()
+        for span in reversed(spans):
+            if span["trace_id"] not in traces:
+                if len(traces) == limit:
+                    continue
+                traces[span["trace_id"]] = []
+            traces[span["trace_id"]].append(span)
+
+        result = []
+        for trace_id, trace_spans in traces.items():
+            trace_spans.sort(key=lambda span: span["start_time_unix_nano"])
+            root = next((span for span in trace_spans if span["parent_span_id"] is None), trace_spans[0])
+            result.append({
+                "trace_id": trace_id,
+                "root": root["name"],
+                "duration_ms": root["duration_ms"],
+                "spans": trace_spans
+            })
+        return result
+
+
+class FileSpanExporter:
+    """Appends finished spans to a file as JSON lines."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+
+
+# Innermost open span for the current task or thread
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to an exporter.
+
+    With no exporter every call is a cheap no-op. The current span is kept in
+    a context variable, so spans nest across awaits and into SQLAlchemy's
+    greenlets; work handed to threads must run in a copied context.
+    """
+
+    def __init__(self, exporter=None):
+        self.exporter = exporter
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = "internal"):
+        """Trace the enclosed block as a child of the current span."""
+        if self.exporter is None:
+            yield NOOP_SPAN
+            return
+
+        span = Span(name, _current_span.get(), kind, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span)
+
+    def start_span(self, name: str, attributes: Optional[Dict[str, Any]] = None, kind: str = "internal"):
+        """Start a child of the current span without making it current, for leaf work tracked by hooks."""
+        if self.exporter is None:
+            return NOOP_SPAN
+        return Span(name, _current_span.get(), kind, attributes)
+
+    def end_span(self, span) -> None:
+        if isinstance(span, Span):
+            span.end_ns = time.time_ns()
+            self.exporter.export(span)
+
+    def traced(self, name: Optional[str] = None):
+        """Decorator that traces every call to a function or coroutine function."""
+        def decorator(func):
+            span_name = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    if self.exporter is None:
+                        return await func(*args, **kwargs)
+                    with self.span(span_name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if self.exporter is None:
+                    return func(*args, **kwargs)
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+def create_tracer() -> Tracer:
+    """Build the tracer selected by TRACING_EXPORTER ('none', 'memory' or 'file')."""
+    if settings.TRACING_EXPORTER == "memory":
+        exporter = MemorySpanExporter(settings.TRACING_MAX_SPANS)
+    elif settings.TRACING_EXPORTER == "file":
+        exporter = FileSpanExporter(settings.TRACING_FILE)
+    elif settings.TRACING_EXPORTER == "none":
+        exporter = None
+    else:
+        raise ValueError(f"Unsupported tracing exporter: {settings.TRACING_EXPORTER}")
+    return Tracer(exporter)
+
+# Global instance
+tracer = create_tracer()
+
+
+class TracingMiddleware:
+    """Opens a server span for every HTTP request, named after the matched route."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        # Imported here to avoid a cycle: app.metrics traces LLM calls
+        from app.metrics import route_template
+
+        with tracer.span(f"{scope['method']} {scope['path']}", {"http.method": scope["method"]}, kind="server") as span:
+            async def send_with_status(message):
+                if message["type"] == "http.response.start":
+                    span.set_attribute("http.status_code", message["status"])
+                    if message["status"] >= 500:
+                        span.status = "ERROR"
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = route_template(scope)
+                span.name = f"{scope['method']} {route}"
+                span.set_attribute("http.route", route)
+                endpoint = scope.get("endpoint")
+                if endpoint is not None:
+                    span.set_attribute("code.function", f"{endpoint.__module__}.{endpoint.__qualname__}")
@@ -0,0 +1,183 @@
+"""
+Import-time profile of the app, to keep process start fast.
+
+Runs `python -X importtime -c "import app.main"` in fresh interpreters (after
+one unmeasured run that writes the bytecode caches), reports the median time
+to import the app, the packages and modules that take longest, and fails if
+any of the heavy modules that are meant to load lazily (app.services.preload
+HEAVY_MODULES: CrewAI and the LLM SDKs) is imported with the app, naming the
+app module that pulled it in.
+
+    python benchmarks/import_time.py --output before.json
+    python benchmarks/import_time.py --output after.json --compare before.json --max-ms 2000
+
+Import times depend heavily on the machine and its disk cache; compare runs
+made on the same machine.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from app.services.preload import HEAVY_MODULES  # noqa: E402
+
+TARGET = "app.main"
+
+
+class ImportEntry(NamedTuple):
+    name: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+def profile_once(target: str) -> List[ImportEntry]:
+    """Import `target` in a fresh interpreter and parse its -X importtime report."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        sys.exit(f"Importing {target} failed:\n{result.stderr[-2000:]}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # column header
+        # Each nesting level indents the module name by two more spaces
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append(ImportEntry(name.strip(), depth, int(self_us), int(cumulative_us)))
+    return entries
+
+
+def importer(entries: List[ImportEntry], index: int) -> Optional[str]:
+    """The app module that imported entries[index], directly or through other packages. Children are listed first."""
+    depth = entries[index].depth
+    for entry in entries[index + 1:]:
+        if entry.depth < depth:
+            depth = entry.depth
+            if entry.name.startswith("app."):
+                return entry.name
+    return None
+
+
+def heavy_imports(entries: List[ImportEntry]) -> Dict[str, Optional[str]]:
+    """Heavy modules that were imported, mapped to the app module responsible."""
+    loaded = {}
+    for index, entry in enumerate(entries):
+        root = entry.name.split(".")[0]
+        if root in HEAVY_MODULES and root not in loaded:
+            loaded[root] = importer(entries, index)
+    return loaded
+
+
+def summarize(entries: List[ImportEntry], top: int) -> dict:
+    packages: Dict[str, int] = defaultdict(int)
+    for entry in entries:
+        packages[entry.name.split(".")[0]] += entry.self_us
+    target = next(entry for entry in entries if entry.name == TARGET)
+    return {
+        "import_ms": round(target.cumulative_us / 1000, 1),
+        "modules_imported": len(entries),
+        "packages_ms": {
+            name: round(us / 1000, 1) for name, us in sorted(packages.items(), key=lambda item: -item[1])
+        },
+        "slowest_modules_ms": {
+            entry.name: round(entry.self_us / 1000, 1) for entry in sorted(entries, key=lambda e: -e.self_us)[:top]
+        }
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Print the change against a baseline. Returns False if import time grew past `threshold` percent."""
+    before = baseline["import_ms"]
+    delta = (results["import_ms"] - before) / before * 100 if before else 0.0
+    regressed = delta > threshold
+    print(f"\nCompared with {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')}): "
+          f"{before:.1f} ms -> {results['import_ms']:.1f} ms ({delta:+.1f}%){'  REGRESSION' if regressed else ''}")
+
+    for name in sorted(set(results["packages_ms"]) | set(baseline["packages_ms"])):
+        now, then = results["packages_ms"].get(name), baseline["packages_ms"].get(name)
+        if abs((now or 0) - (then or 0)) >= 5:
+            print(f"  {name:<24}{then or 0:>8.1f} ms -> {now or 0:.1f} ms{'  (new)' if then is None else ''}")
+    return not regressed
+
+
+def main(args: argparse.Namespace) -> int:
+    profile_once(TARGET)  # warm up: compile bytecode, fill the disk cache
+
+    runs = [profile_once(TARGET) for _ in range(args.repeat)]
+    totals = [next(entry.cumulative_us for entry in run if entry.name == TARGET) for run in runs]
+    median_run = runs[totals.index(sorted(totals)[len(totals) // 2])]
+
+    results = summarize(median_run, args.top)
+    results["import_ms"] = round(statistics.median(totals) / 1000, 1)
+    results["runs_ms"] = [round(total / 1000, 1) for total in totals]
+    results["heavy_modules"] = heavy_imports(median_run)
+
+    print(f"import {TARGET}: {results['import_ms']:.1f} ms median of {args.repeat} runs "
+          f"({min(results['runs_ms']):.1f}-{max(results['runs_ms']):.1f} ms), {results['modules_imported']} modules")
+    print("\nSlowest packages (self time of all their modules):")
+    for name, ms in list(results["packages_ms"].items())[:args.top]:
+        print(f"  {name:<40}{ms:>9.1f} ms")
+    print("\nSlowest modules (self time):")
+    for name, ms in results["slowest_modules_ms"].items():
+        print(f"  {name:<40}{ms:>9.1f} ms")
+
+    ok = True
+    for name, culprit in results["heavy_modules"].items():
+        ok = False
+        print(f"\n{name} is imported with the app (via {culprit or 'an unknown module'}); it should load lazily")
+    if args.max_ms and results["import_ms"] > args.max_ms:
+        ok = False
+        print(f"\nImport time {results['import_ms']:.1f} ms is over the {args.max_ms:g} ms budget")
+
+    output = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "repeat": args.repeat
+        },
+        **results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        ok = compare(output, baseline, args.threshold) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile the time it takes to import the AI Boss app.")
+    parser.add_argument("--repeat", type=int, default=5, help="Measured interpreter runs")
+    parser.add_argument("--top", type=int, default=15, help="Packages and modules to list")
+    parser.add_argument("--max-ms", type=float, help="Fail if the median import takes longer")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=20.0, help="Percent increase in import time counted as a regression")
+    sys.exit(main(parser.parse_args()))
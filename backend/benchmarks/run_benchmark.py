@@ -0,0 +1,328 @@
+"""
+End-to-end load benchmark for the AI Boss backend.
+
+Boots app.main:app with uvicorn in a background thread against a fresh SQLite
+file (or the database given with --database-url), seeds employees, meetings and
+messages through the API, then drives each scenario at a fixed concurrency.
+Every LLM call goes to the in-process mock provider, so no keys or network are
+needed.
+
+Results are printed and written as JSON; pass --compare with an earlier result
+file to see the deltas and fail on regressions:
+
+    python benchmarks/run_benchmark.py --output before.json
+    python benchmarks/run_benchmark.py --output after.json --compare before.json
+
+The client and server share one process, so absolute numbers are lower than
+a dedicated deployment; compare runs made on the same machine.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = ("list_employees", "list_meetings", "get_messages", "post_message", "respond", "round_table")
+
+
+def configure_environment(args: argparse.Namespace) -> str:
+    """Point the app at the benchmark database and the mock LLM. Must run before importing app."""
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='aiboss-bench-'), 'bench.db')}"
+    os.environ.update({
+        "DATABASE_URL": database_url,
+        "LLM_PROVIDER_OVERRIDE": "mock",
+        "MOCK_LLM_LATENCY_MS": str(args.mock_latency_ms),
+        "MOCK_LLM_LATENCY_STDDEV_MS": str(args.mock_latency_ms / 4),
+        "MOCK_LLM_CHUNK_MS": "0",
+        "MOCK_LLM_SEED": str(args.seed),
+        "JOB_INLINE_WORKERS": "0",
+    })
+    os.environ.pop("ASYNC_DATABASE_URL", None)
+    sys.path.insert(0, BACKEND_DIR)
+    return database_url
+
+
+class QueryCounter:
+    """Counts statements sent to the database by the app's engine."""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+
+def start_server(port: int):
+    """Run the app with uvicorn on a background thread and wait until it accepts requests."""
+    import uvicorn
+    from app.main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 60
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError("Server failed to start")
+        time.sleep(0.05)
+    return server, thread
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def seed(client, employees: int, meetings: int, messages: int, rng: random.Random) -> dict:
+    """Create the dataset through the API and return the IDs scenarios pick from."""
+    employee_ids = []
+    for i in range(employees):
+        response = await client.post("/employees", json={
+            "name": f"Bench Employee {i}",
+            "role": rng.choice(["Engineer", "Designer", "Marketer", "Project Manager"]),
+            "personality": "Focused and concise",
+            "expertise": ["Benchmarks"],
+            "llm_provider": "mock",
+            "llm_model": "mock-1"
+        })
+        response.raise_for_status()
+        employee_ids.append(response.json()["id"])
+
+    meeting_rosters = {}
+    for i in range(meetings):
+        roster = rng.sample(employee_ids, min(len(employee_ids), rng.randint(2, 4)))
+        response = await client.post("/meetings", json={
+            "title": f"Bench Meeting {i}",
+            "description": "Benchmark meeting",
+            "employee_ids": roster
+        })
+        response.raise_for_status()
+        meeting_id = response.json()["id"]
+        meeting_rosters[meeting_id] = roster
+
+        for start in range(0, messages, 1000):
+            batch = [
+                {"content": f"Seed message {n}", "sender_type": "user"} if n % 2 == 0 else
+                {"content": f"Seed reply {n}", "sender_type": "employee", "sender_id": rng.choice(roster)}
+                for n in range(start, min(messages, start + 1000))
+            ]
+            response = await client.post(f"/meetings/{meeting_id}/messages:batch", json={"messages": batch})
+            response.raise_for_status()
+
+    return {"employee_ids": employee_ids, "meetings": meeting_rosters}
+
+
+def build_scenarios(data: dict, rng: random.Random) -> Dict[str, Callable]:
+    """Map scenario names to functions that issue one request each."""
+    meeting_ids = list(data["meetings"])
+
+    async def list_employees(client):
+        return await client.get("/employees")
+
+    async def list_meetings(client):
+        return await client.get("/meetings")
+
+    async def get_messages(client):
+        return await client.get(f"/meetings/{rng.choice(meeting_ids)}/messages", params={"limit": 50})
+
+    async def post_message(client):
+        meeting_id = rng.choice(meeting_ids)
+        return await client.post(f"/meetings/{meeting_id}/messages", json={
+            "meeting_id": meeting_id, "content": "Benchmark message", "sender_type": "user"
+        })
+
+    async def respond(client):
+        meeting_id = rng.choice(meeting_ids)
+        employee_id = rng.choice(data["meetings"][meeting_id])
+        return await client.post(f"/meetings/{meeting_id}/messages/{employee_id}/respond")
+
+    async def round_table(client):
+        return await client.post(f"/meetings/{rng.choice(meeting_ids)}/messages/round-table")
+
+    return {
+        "list_employees": list_employees,
+        "list_meetings": list_meetings,
+        "get_messages": get_messages,
+        "post_message": post_message,
+        "respond": respond,
+        "round_table": round_table
+    }
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, min(len(sorted_values), math.ceil(pct / 100 * len(sorted_values))))
+    return sorted_values[rank - 1]
+
+
+async def run_scenario(client, send: Callable, requests: int, concurrency: int, warmup: int, counter: QueryCounter) -> dict:
+    """Issue `requests` requests from `concurrency` workers and summarise them."""
+    for _ in range(warmup):
+        await send(client)
+
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await send(client)
+                failed = response.status_code >= 400
+            except Exception:
+                failed = True
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors += failed
+
+    queries_before = counter.count
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    queries = counter.count - queries_before
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50), 2),
+            "p95": round(percentile(latencies, 95), 2),
+            "p99": round(percentile(latencies, 99), 2),
+            "max": round(latencies[-1], 2) if latencies else 0.0
+        },
+        "db_queries_per_request": round(queries / len(latencies), 2) if latencies else 0.0
+    }
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """Print per-scenario deltas against a baseline. Returns False if any scenario regressed past `threshold` percent."""
+    ok = True
+    print(f"\nCompared with {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')}):")
+    print(f"{'scenario':<16}{'rps':>10}{'p95 ms':>10}{'queries/req':>14}")
+    for name, current in results["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if not before:
+            continue
+
+        rps_delta = _delta(current["throughput_rps"], before["throughput_rps"])
+        p95_delta = _delta(current["latency_ms"]["p95"], before["latency_ms"]["p95"])
+        queries_delta = current["db_queries_per_request"] - before["db_queries_per_request"]
+        regressed = rps_delta < -threshold or p95_delta > threshold or queries_delta > 0
+        ok = ok and not regressed
+        print(f"{name:<16}{rps_delta:>+9.1f}%{p95_delta:>+9.1f}%{queries_delta:>+14.2f}{'  REGRESSION' if regressed else ''}")
+    return ok
+
+
+def _delta(current: float, before: float) -> float:
+    return (current - before) / before * 100 if before else 0.0
+
+
+async def main(args: argparse.Namespace) -> int:
+    database_url = configure_environment(args)
+
+    import httpx
+    from app.database.database import engine
+
+    counter = QueryCounter(engine)
+    port = free_port()
+    server, thread = start_server(port)
+    rng = random.Random(args.seed)
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=120) as client:
+        print(f"Seeding {args.employees} employees, {args.meetings} meetings, {args.messages} messages per meeting...")
+        data = await seed(client, args.employees, args.meetings, args.messages, rng)
+
+        scenarios = build_scenarios(data, rng)
+        results = {}
+        for name in args.scenarios:
+            requests = args.llm_requests if name in ("respond", "round_table") else args.requests
+            results[name] = await run_scenario(client, scenarios[name], requests, args.concurrency, args.warmup, counter)
+            stats = results[name]
+            print(
+                f"{name:<16}{stats['throughput_rps']:>9.1f} rps  p50 {stats['latency_ms']['p50']:>8.1f} ms  "
+                f"p95 {stats['latency_ms']['p95']:>8.1f} ms  p99 {stats['latency_ms']['p99']:>8.1f} ms  "
+                f"{stats['db_queries_per_request']:>6.2f} queries/req  {stats['errors']} errors"
+            )
+
+    server.should_exit = True
+    thread.join(timeout=30)
+
+    output = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "database": database_url.split("://")[0],
+            "employees": args.employees,
+            "meetings": args.meetings,
+            "messages_per_meeting": args.messages,
+            "concurrency": args.concurrency,
+            "mock_latency_ms": args.mock_latency_ms,
+            "seed": args.seed
+        },
+        "scenarios": results
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(output, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the AI Boss API end to end with a mock LLM.")
+    parser.add_argument("--database-url", help="Sync database URL (default: a fresh SQLite file). Use a scratch database.")
+    parser.add_argument("--employees", type=int, default=20, help="Employees to seed")
+    parser.add_argument("--meetings", type=int, default=10, help="Meetings to seed")
+    parser.add_argument("--messages", type=int, default=500, help="Messages to seed per meeting")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight at once")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario")
+    parser.add_argument("--llm-requests", type=int, default=100, help="Requests per scenario that calls the LLM")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured requests before each scenario")
+    parser.add_argument("--mock-latency-ms", type=float, default=200, help="Mean mock LLM latency")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Percent change in rps or p95 counted as a regression")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,125 @@
+"""
+CPU cost of serializing a page of messages, before and after the row fast path.
+
+"pydantic" is the path list routes took before: each row becomes a Message
+model (the repository's _to_pydantic), FastAPI dumps the models, validates the
+result against response_model=List[Message] again, serializes it in JSON mode
+and renders it with json.dumps.
+
+"orjson" is the current path: the repository's column projection rows go
+straight to orjson.
+
+Both outputs are decoded and compared before timing, so the fast path is
+checked to send the same JSON. Nothing touches a database; this isolates the
+per-message CPU that the end-to-end benchmark (run_benchmark.py) folds into
+request latency.
+
+    python benchmarks/serialization_benchmark.py --messages 500 --repeat 200
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+import orjson
+from pydantic import TypeAdapter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.message import Message  # noqa: E402
+
+
+def make_rows(count: int) -> List[dict]:
+    """Rows shaped like MessageRepository.get_page_rows output (UUIDs and aware datetimes from the driver)."""
+    meeting_id = uuid.uuid4()
+    employee_id = uuid.uuid4()
+    started = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+    rows = []
+    for i in range(count):
+        from_employee = i % 2 == 1
+        rows.append({
+            "id": uuid.uuid4(),
+            "meeting_id": meeting_id,
+            "content": f"Message {i}: " + "let's review the roadmap and agree on priorities " * 4,
+            "sender_type": "employee" if from_employee else "user",
+            "sender_id": employee_id if from_employee else None,
+            "sender_name": "Boss McBossface" if from_employee else "User",
+            "timestamp": started + timedelta(seconds=i, microseconds=i * 37)
+        })
+    return rows
+
+
+def pydantic_path(rows: List[dict], adapter: TypeAdapter) -> bytes:
+    models = [
+        Message(
+            id=str(row["id"]),
+            meeting_id=str(row["meeting_id"]),
+            content=row["content"],
+            sender_type=row["sender_type"],
+            sender_id=str(row["sender_id"]) if row["sender_id"] else None,
+            sender_name=row["sender_name"],
+            timestamp=row["timestamp"]
+        )
+        for row in rows
+    ]
+    # What FastAPI does with a response_model: dump, validate again, serialize, render
+    content = [model.model_dump(by_alias=True) for model in models]
+    value = adapter.validate_python(content)
+    serialized = adapter.dump_python(value, mode="json", by_alias=True)
+    return json.dumps(serialized, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def orjson_path(rows: List[dict]) -> bytes:
+    return orjson.dumps(rows, option=orjson.OPT_UTC_Z)
+
+
+def measure(fn: Callable[[], bytes], repeat: int) -> List[float]:
+    fn()  # warm up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare message list serialization paths.")
+    parser.add_argument("--messages", type=int, default=500, help="Messages per page")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed runs per path")
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    rows = make_rows(args.messages)
+    adapter = TypeAdapter(List[Message])
+
+    if json.loads(pydantic_path(rows, adapter)) != json.loads(orjson_path(rows)):
+        sys.exit("The two paths produce different JSON")
+
+    results = {}
+    for name, fn in (("pydantic", lambda: pydantic_path(rows, adapter)), ("orjson", lambda: orjson_path(rows))):
+        timings = measure(fn, args.repeat)
+        median = statistics.median(timings)
+        results[name] = {
+            "median_ms": round(median * 1000, 3),
+            "per_message_us": round(median / args.messages * 1e6, 3)
+        }
+        print(f"{name:>8}: {median * 1000:8.3f} ms per {args.messages} messages, "
+              f"{median / args.messages * 1e6:7.3f} us per message")
+
+    speedup = results["pydantic"]["median_ms"] / results["orjson"]["median_ms"]
+    results["speedup"] = round(speedup, 2)
+    print(f" speedup: {speedup:.1f}x")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"messages": args.messages, "repeat": args.repeat, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,89 @@
 """
 Entry point for the AI Boss backend application.
+
+    python run.py            # development: one process, auto-reload
+    python run.py --prod     # production: SERVER_WORKERS processes, no reload
+
+Production mode does not create tables or seed data in the workers; run
+`python setup_db.py` (or `alembic upgrade head`) once before starting. With
+more than one worker it also needs state shared between the workers: the
+Postgres message bridge (the default) and a shared cache or none.
 """
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
 import uvicorn
 from app.config import settings
 
+
+def prepare_metrics_dir() -> None:
+    """Give the worker processes an empty shared directory for their Prometheus metrics."""
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        # Files left by a previous run would be merged into this run's metrics
+        shutil.rmtree(directory, ignore_errors=True)
+    else:
+        directory = tempfile.mkdtemp(prefix="aiboss-metrics-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = directory
+    os.makedirs(directory, exist_ok=True)
+
+
+def check_multiworker_settings() -> None:
+    """Default or require the settings that keep several workers consistent, exiting if they cannot be met."""
+    # Workers inherit the environment; also patch this process's settings to match
+    os.environ.setdefault("MESSAGE_HUB_BRIDGE", "postgres")
+    settings.MESSAGE_HUB_BRIDGE = os.environ["MESSAGE_HUB_BRIDGE"]
+
+    problems = []
+    if settings.MESSAGE_HUB_BRIDGE != "postgres":
+        problems.append(
+            f"MESSAGE_HUB_BRIDGE={settings.MESSAGE_HUB_BRIDGE}: live subscribers would only see messages "
+            "created by their own worker. Use MESSAGE_HUB_BRIDGE=postgres."
+        )
+    elif not settings.ASYNC_DATABASE_URL.startswith("postgresql"):
+        problems.append("MESSAGE_HUB_BRIDGE=postgres needs a Postgres DATABASE_URL.")
+    if settings.CACHE_BACKEND == "memory":
+        problems.append(
+            "CACHE_BACKEND=memory: each worker would keep serving changed or deleted employees and meetings "
+            "until CACHE_TTL. Use CACHE_BACKEND=redis (with CACHE_REDIS_URL) or CACHE_BACKEND=none."
+        )
+    if problems:
+        sys.exit("Cannot run several workers with these settings (or use --workers 1):\n- " + "\n- ".join(problems))
+
+
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=settings.HOST,
-        port=settings.PORT,
-        reload=True
-    )
+    parser = argparse.ArgumentParser(description="Run the AI Boss API server.")
+    parser.add_argument("--prod", action="store_true", help="Run several worker processes without reload")
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="Worker processes in --prod mode")
+    args = parser.parse_args()
+
+    if not args.prod:
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            reload=True
+        )
+    else:
+        # Workers inherit the environment: skip per-worker DDL and seeding unless asked for explicitly
+        os.environ.setdefault("DB_AUTO_INIT", "false")
+        # ...and this process, which serves requests itself when there is a single worker
+        settings.DB_AUTO_INIT = os.environ["DB_AUTO_INIT"].lower() == "true"
+        if args.workers > 1:
+            check_multiworker_settings()
+            prepare_metrics_dir()
+
+        uvicorn.run(
+            "app.main:app",
+            host=settings.HOST,
+            port=settings.PORT,
+            workers=args.workers,
+            loop="uvloop",
+            http="httptools",
+            timeout_keep_alive=settings.SERVER_KEEPALIVE,
+            proxy_headers=True,
+            access_log=settings.SERVER_ACCESS_LOG
+        )
@@ -2,24 +2,23 @@
 """
 Database setup script for the AI Boss application.
 """
+import asyncio
 import sys
 import os
 
 # Add the project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
-from sqlalchemy import create_engine, text
-from app.config import settings
+from sqlalchemy import text
 from app.database.init_db import create_tables, init_sample_data
-from app.database.database import SessionLocal
+from app.database.database import SessionLocal, engine
 
 
-def check_database_connection():
+async def check_database_connection():
     """Check if we can connect to the database."""
     try:
-        engine = create_engine(settings.DATABASE_URL)
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
         print("✅ Database connection successful!")
         return True
     except Exception as e:
@@ -27,34 +26,33 @@ def check_database_connection():
         return False
 
 
-def setup_database():
+async def setup_database():
     """Set up the database with tables and sample data."""
-    if not check_database_connection():
+    if not await check_database_connection():
         return False
     
     try:
         print("Creating database tables...")
-        create_tables()
+        await create_tables()
         print("✅ Tables created successfully!")
         
         print("Initializing sample data...")
-        db = SessionLocal()
-        try:
-            init_sample_data(db)
-        finally:
-            db.close()
+        async with SessionLocal() as db:
+            await init_sample_data(db)
         print("✅ Sample data initialized successfully!")
         
         return True
     except Exception as e:
         print(f"❌ Database setup failed: {e}")
         return False
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
     print("🚀 Setting up AI Boss database...")
     
-    if setup_database():
+    if asyncio.run(setup_database()):
         print("🎉 Database setup completed successfully!")
     else:
         print("💥 Database setup failed!")
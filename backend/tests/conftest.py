@@ -0,0 +1,76 @@
+"""
+Shared fixtures.
+
+Settings are read when app modules are imported, so the environment is set up
+first: a throwaway SQLite database, no caching, background workers or module
+preloading, and the mock LLM with no latency.
+"""
+import asyncio
+import os
+import tempfile
+
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='aiboss-test-'), 'test.db')}",
+    "DB_AUTO_INIT": "false",
+    "CACHE_BACKEND": "none",
+    "JOB_INLINE_WORKERS": "0",
+    "PRELOAD_MODULES": "none",
+    "LLM_PROVIDER_OVERRIDE": "mock",
+    "MOCK_LLM_LATENCY_MS": "0",
+    "MOCK_LLM_LATENCY_STDDEV_MS": "0",
+    "MOCK_LLM_CHUNK_MS": "0",
+})
+os.environ.pop("ASYNC_DATABASE_URL", None)
+
+import pytest  # noqa: E402
+
+from app.database.database import Base, SessionLocal, engine  # noqa: E402
+from app.database.repositories import EmployeeRepository, MeetingRepository  # noqa: E402
+from app.models.employee import AIEmployeeCreate  # noqa: E402
+from app.models.meeting import Meeting, MeetingCreate  # noqa: E402
+
+
+async def _create_tables() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+async def _drop_tables() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    # Pooled aiosqlite connections belong to the event loop that opened them
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db():
+    """A session on freshly created tables, which are dropped afterwards."""
+    await _create_tables()
+    async with SessionLocal() as session:
+        yield session
+    await _drop_tables()
+
+
+@pytest.fixture
+def client():
+    """A TestClient for the app (lifespan included) on freshly created tables."""
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    asyncio.run(_create_tables())
+    asyncio.run(engine.dispose())
+    with TestClient(app) as test_client:
+        yield test_client
+    asyncio.run(_drop_tables())
+
+
+async def create_meeting(db, employees: int = 2) -> Meeting:
+    """Create `employees` mock-provider employees and a meeting with all of them."""
+    employee_repo = EmployeeRepository(db)
+    employee_ids = []
+    for i in range(employees):
+        employee = await employee_repo.create(AIEmployeeCreate(
+            name=f"Employee {i}", role="Tester", personality="Thorough", llm_provider="mock", llm_model="mock"
+        ))
+        employee_ids.append(employee.id)
+    return await MeetingRepository(db).create(MeetingCreate(title="Standup", description="Daily sync", employee_ids=employee_ids))
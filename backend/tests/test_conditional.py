@@ -0,0 +1,36 @@
+"""
+Conditional GETs on message history: ETags, 304s and missing meetings.
+"""
+import uuid
+
+
+def create_meeting(client) -> str:
+    employee_ids = [
+        client.post("/employees", json={
+            "name": f"Employee {i}", "role": "Tester", "personality": "Thorough", "llm_provider": "mock", "llm_model": "mock"
+        }).json()["id"]
+        for i in range(2)
+    ]
+    return client.post("/meetings", json={"title": "Standup", "employee_ids": employee_ids}).json()["id"]
+
+
+def test_unchanged_history_is_not_modified(client):
+    meeting_id = create_meeting(client)
+    url = f"/meetings/{meeting_id}/messages"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    client.post(url, json={"meeting_id": meeting_id, "content": "Hello", "sender_type": "user"})
+    changed = client.get(url, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [m["content"] for m in changed.json()] == ["Hello"]
+
+
+def test_an_unknown_meeting_is_not_found_whatever_the_preconditions(client):
+    url = f"/meetings/{uuid.uuid4()}/messages"
+    assert client.get(url, headers={"If-None-Match": "*"}).status_code == 404
+    assert client.get(url, headers={"If-None-Match": 'W/"0123456789abcdef0123"'}).status_code == 404
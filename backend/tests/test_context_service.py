@@ -0,0 +1,32 @@
+"""
+Conversation context: the history window and the rolling summary.
+"""
+from app.config import settings
+from app.database.repositories import EmployeeRepository, MessageRepository
+from app.models.message import MessageCreate
+from app.services.context_service import context_service
+from app.services.llm_service import llm_service
+from tests.conftest import create_meeting
+
+
+async def test_older_messages_are_summarized_outside_a_transaction(db, monkeypatch):
+    monkeypatch.setattr(settings, "CONTEXT_MAX_MESSAGES", 5)
+    monkeypatch.setattr(settings, "CONTEXT_SUMMARY_MIN_MESSAGES", 2)
+    meeting = await create_meeting(db)
+    repo = MessageRepository(db)
+    for i in range(10):
+        await repo.create(MessageCreate(meeting_id=meeting.id, content=f"point {i}", sender_type="user"), "User")
+
+    summarized = []
+
+    async def summarize(employee, previous_summary, new_messages):
+        summarized.append((db.in_transaction(), [m.content for m in new_messages]))
+        return "Points 0-4 were raised."
+
+    monkeypatch.setattr(llm_service, "summarize", summarize)
+    employees = await EmployeeRepository(db).get_by_meeting_id(meeting.id)
+    context = await context_service.build_context(meeting.id, employees, db)
+
+    assert summarized == [(False, [f"point {i}" for i in range(5)])]
+    assert context.summary == "Points 0-4 were raised."
+    assert [m.content for m in context.messages] == [f"point {i}" for i in range(5, 10)]
@@ -0,0 +1,57 @@
+"""
+Crew pool limits: concurrency, queue capacity and timeouts.
+"""
+import asyncio
+import threading
+
+import pytest
+
+from app.services import crew_executor as crew_executor_module
+from app.services.crew_executor import CrewExecutor, CrewPoolFullError, CrewTimeoutError
+
+
+@pytest.fixture
+def blocked_runs(monkeypatch):
+    """Make crew runs block on their worker thread until the returned event is set."""
+    release = threading.Event()
+
+    def run_crew(meeting, employees, new_message, step_callback=None, context=None):
+        release.wait(5)
+        return "Done."
+
+    monkeypatch.setattr(crew_executor_module, "run_crew", run_crew)
+    yield release
+    release.set()
+
+
+async def test_runs_beyond_the_queue_are_rejected(blocked_runs):
+    executor = CrewExecutor("thread", max_workers=1, max_queue=1, timeout=5)
+    try:
+        running = asyncio.create_task(executor.run(None, [], None))
+        waiting = asyncio.create_task(executor.run(None, [], None))
+        await asyncio.sleep(0.01)
+        assert (executor.active, executor.queued) == (1, 1)
+
+        with pytest.raises(CrewPoolFullError):
+            await executor.run(None, [], None)
+
+        blocked_runs.set()
+        assert await asyncio.gather(running, waiting) == ["Done.", "Done."]
+        stats = executor.stats()
+        assert (stats["completed"], stats["rejected"], stats["active"], stats["queued"]) == (2, 1, 0, 0)
+    finally:
+        executor.shutdown()
+
+
+async def test_a_timed_out_run_keeps_its_slot_until_it_finishes(blocked_runs):
+    executor = CrewExecutor("thread", max_workers=1, max_queue=1, timeout=0.05)
+    try:
+        with pytest.raises(CrewTimeoutError):
+            await executor.run(None, [], None)
+        assert (executor.timed_out, executor.active) == (1, 1)
+
+        blocked_runs.set()
+        await asyncio.sleep(0.05)
+        assert (executor.active, executor.completed) == (0, 1)
+    finally:
+        executor.shutdown()
@@ -0,0 +1,86 @@
+"""
+Crew cache tests. Kickoffs stop short of the LLM: CrewAI builds the manager
+agent as it would for a real run, then task execution returns a canned output.
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+crewai = pytest.importorskip("crewai")
+from crewai.crews.crew_output import CrewOutput  # noqa: E402
+
+from app.models.employee import AIEmployee  # noqa: E402
+from app.models.meeting import Meeting  # noqa: E402
+from app.config import settings  # noqa: E402
+from app.models.message import Message  # noqa: E402
+from app.services.crew_executor import run_crew  # noqa: E402
+from app.services.crew_service import CrewService, crew_service  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def no_llm_calls(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(
+        crewai.Crew, "_execute_tasks",
+        lambda self, tasks, *args, **kwargs: CrewOutput(raw="Agreed.", tasks_output=[])
+    )
+
+
+def make_employee(employee_id: str, role: str) -> AIEmployee:
+    return AIEmployee(
+        id=employee_id,
+        name=f"{role} bot",
+        role=role,
+        personality="Direct",
+        expertise=["planning"],
+        llm_provider="openai",
+        llm_model="gpt-4.1-mini",
+        created_at=datetime.now(timezone.utc)
+    )
+
+
+def make_turn(meeting_id: str, content: str):
+    now = datetime.now(timezone.utc)
+    meeting = Meeting(id=meeting_id, title="Roadmap", description="Plan the quarter", employee_ids=[], created_at=now)
+    message = Message(id=content, meeting_id=meeting_id, content=content, sender_type="user", sender_id=None, sender_name="User", timestamp=now)
+    return meeting, message
+
+
+def test_cached_crew_runs_twice():
+    service = CrewService(cache_size=4)
+    employees = [make_employee("e1", "Engineer"), make_employee("e2", "Designer")]
+
+    outputs = []
+    crews = []
+    for content in ("First question?", "Second question?"):
+        meeting, message = make_turn("m1", content)
+        key, crew = service.checkout_crew(meeting.id, employees)
+        outputs.append(service.kickoff_crew(crew, service.create_task(meeting, message)))
+        service.checkin_crew(key, crew)
+        crews.append(crew)
+
+    assert outputs == ["Agreed.", "Agreed."]
+    assert crews[0] is crews[1]
+    assert service.cache_stats()["hits"] == 1
+    assert len(crews[1].tasks) == 1
+
+
+def test_crew_whose_run_failed_is_not_reused(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_PROVIDER_OVERRIDE", "")
+    employees = [make_employee("e3", "Engineer"), make_employee("e4", "Designer")]
+    meeting, message = make_turn("m2", "Ship it?")
+
+    def fail(self, tasks, *args, **kwargs):
+        raise RuntimeError("LLM went away")
+
+    monkeypatch.setattr(crewai.Crew, "_execute_tasks", fail)
+    with pytest.raises(RuntimeError):
+        run_crew(meeting, employees, message)
+    before = crew_service.cache_stats()
+
+    monkeypatch.setattr(crewai.Crew, "_execute_tasks", lambda self, tasks, *args, **kwargs: CrewOutput(raw="Shipped.", tasks_output=[]))
+    assert run_crew(meeting, employees, message) == "Shipped."
+    assert run_crew(meeting, employees, message) == "Shipped."
+    # The failed crew was dropped, so the second run built a new one and the third reused it
+    stats = crew_service.cache_stats()
+    assert (stats["misses"], stats["hits"]) == (before["misses"] + 1, before["hits"] + 1)
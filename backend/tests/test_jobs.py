@@ -0,0 +1,101 @@
+"""
+Crew job claims, leases and retries.
+"""
+import asyncio
+
+from fastapi import HTTPException
+from sqlalchemy import update
+
+from app.config import settings
+from app.database.database import SessionLocal
+from app.database.models import CrewJob
+from app.database.repositories import JobRepository
+from app.services.job_service import JobService
+from app.services.message_service import message_service
+from tests.conftest import create_meeting
+
+
+async def queue_job(db):
+    meeting = await create_meeting(db)
+    return await JobRepository(db).create(meeting.id, meeting.employee_ids[0])
+
+
+async def test_a_job_is_claimed_once(db):
+    job = await queue_job(db)
+    repo = JobRepository(db)
+
+    claimed = await repo.claim_next("w1", lease_seconds=60, max_attempts=3)
+    assert (claimed.id, claimed.status, claimed.attempts) == (job.id, "running", 1)
+    assert await repo.claim_next("w2", lease_seconds=60, max_attempts=3) is None
+
+
+async def test_an_expired_lease_is_reclaimed_and_the_old_worker_fenced_off(db):
+    job = await queue_job(db)
+    repo = JobRepository(db)
+    await repo.claim_next("w1", lease_seconds=60, max_attempts=3)
+
+    # With a zero lease, w1's claim has already expired
+    reclaimed = await repo.claim_next("w2", lease_seconds=0, max_attempts=3)
+    assert (reclaimed.id, reclaimed.attempts) == (job.id, 2)
+
+    assert not await repo.heartbeat(job.id, "w1")
+    assert not await repo.fail(job.id, "w1", "too late")
+    assert await repo.complete(job.id, "w2", job.id)
+    assert (await repo.get_by_id(job.id)).status == "succeeded"
+
+
+async def test_heartbeat_keeps_the_lease(db):
+    job = await queue_job(db)
+    repo = JobRepository(db)
+    await repo.claim_next("w1", lease_seconds=60, max_attempts=3)
+
+    assert await repo.heartbeat(job.id, "w1")
+    assert await repo.claim_next("w2", lease_seconds=60, max_attempts=3) is None
+
+
+async def test_a_job_turned_away_by_a_full_pool_is_retried_later(db, monkeypatch):
+    job = await queue_job(db)
+    repo = JobRepository(db)
+
+    async def pool_full(meeting_id, employee_id, db):
+        raise HTTPException(status_code=503, detail="Crew pool is full")
+
+    monkeypatch.setattr(message_service, "generate_employee_response", pool_full)
+    monkeypatch.setattr(settings, "JOB_MAX_ATTEMPTS", 2)
+
+    assert await JobService.run_next("w1", db)
+    released = await repo.get_by_id(job.id)
+    assert (released.status, released.attempts, released.error) == ("queued", 1, "Crew pool is full")
+    # Not due again until JOB_RETRY_DELAY has passed
+    assert await repo.claim_next("w1", settings.JOB_LEASE_SECONDS, settings.JOB_MAX_ATTEMPTS) is None
+
+    # Once it is due, the last attempt fails the job for good
+    await db.execute(update(CrewJob).values(available_at=None))
+    await db.commit()
+    assert await JobService.run_next("w1", db)
+    failed = await repo.get_by_id(job.id)
+    assert (failed.status, failed.attempts) == ("failed", 2)
+
+
+async def test_a_run_whose_lease_is_lost_is_abandoned(db, monkeypatch):
+    job = await queue_job(db)
+    abandoned = asyncio.Event()
+
+    async def slow_reply(meeting_id, employee_id, db):
+        try:
+            # Another worker takes the job over mid-run (retrying if a heartbeat lands just before its claim)
+            async with SessionLocal() as other:
+                while not await JobRepository(other).claim_next("w2", lease_seconds=0, max_attempts=3):
+                    await asyncio.sleep(0)
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            abandoned.set()
+            raise
+
+    monkeypatch.setattr(message_service, "generate_employee_response", slow_reply)
+    monkeypatch.setattr(settings, "JOB_HEARTBEAT_INTERVAL", 0.01)
+
+    assert await JobService.run_next("w1", db)
+    assert abandoned.is_set()
+    current = await JobRepository(db).get_by_id(job.id)
+    assert (current.status, current.attempts) == ("running", 2)
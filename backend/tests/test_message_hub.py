@@ -0,0 +1,42 @@
+"""
+Cross-process message bridge connection handling.
+"""
+import asyncio
+
+from app.services.message_hub import MessageHub, PostgresMessageBridge
+
+
+class FakeConnection:
+    def __init__(self, fail_listen: bool):
+        self.fail_listen = fail_listen
+        self.closed = False
+
+    async def add_listener(self, channel, callback):
+        if self.fail_listen:
+            raise ConnectionError("connection reset")
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self, timeout=None):
+        self.closed = True
+
+
+async def test_a_half_open_connection_is_closed_before_retrying(monkeypatch):
+    bridge = PostgresMessageBridge(MessageHub(queue_size=10), "postgresql://localhost/test", "test")
+    connections = [FakeConnection(fail_listen=True), FakeConnection(fail_listen=False)]
+    opened = iter(connections)
+
+    async def connect():
+        bridge._connection = next(opened)
+        await bridge._connection.add_listener(bridge.channel, bridge._on_notify)
+
+    async def no_wait(seconds):
+        pass
+
+    monkeypatch.setattr(bridge, "_connect", connect)
+    monkeypatch.setattr(asyncio, "sleep", no_wait)
+    await bridge._ensure_connected()
+
+    assert connections[0].closed
+    assert bridge._connection is connections[1] and not connections[1].closed
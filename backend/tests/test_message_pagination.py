@@ -0,0 +1,90 @@
+"""
+Keyset pagination over a meeting's (timestamp, id) history.
+"""
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+
+from app.database.models import Message as DBMessage
+from app.database.repositories import MessageRepository
+from app.models.message import MessageBatchItem, MessageCreate
+from tests.conftest import create_meeting
+
+
+async def test_rapid_posts_keep_their_order(db):
+    meeting = await create_meeting(db)
+    repo = MessageRepository(db)
+    for i in range(20):
+        await repo.create(MessageCreate(meeting_id=meeting.id, content=f"post {i}", sender_type="user"), "User")
+
+    messages = await repo.get_by_meeting_id(meeting.id)
+    assert [m.content for m in messages] == [f"post {i}" for i in range(20)]
+
+
+async def test_paging_across_tied_timestamps(db):
+    meeting = await create_meeting(db)
+    tied = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    db.add_all([
+        DBMessage(meeting_id=uuid.UUID(meeting.id), content=f"tied {i}", sender_type="user", sender_name="User", timestamp=tied)
+        for i in range(7)
+    ])
+    await db.commit()
+    repo = MessageRepository(db)
+    everything = await repo.get_by_meeting_id(meeting.id)
+    assert len(everything) == 7
+    assert [m.id for m in everything] == [
+        str(row_id) for row_id in await db.scalars(select(DBMessage.id).order_by(DBMessage.timestamp, DBMessage.id))
+    ]
+
+    # Backward from the newest end, as the client scrolls up
+    backward = await repo.get_by_meeting_id(meeting.id, limit=3)
+    while len(backward) < len(everything):
+        page = await repo.get_by_meeting_id(meeting.id, before=backward[0].id, limit=3)
+        assert page
+        backward = page + backward
+    assert [m.id for m in backward] == [m.id for m in everything]
+
+    # Forward from the oldest message, as a catch-up after reconnecting
+    forward = everything[:1]
+    while len(forward) < len(everything):
+        page = await repo.get_by_meeting_id(meeting.id, after=forward[-1].id, limit=2)
+        assert page
+        forward += page
+    assert [m.id for m in forward] == [m.id for m in everything]
+
+    middle = await repo.get_by_meeting_id(meeting.id, after=everything[1].id, before=everything[5].id)
+    assert [m.id for m in middle] == [m.id for m in everything[2:5]]
+
+
+async def test_batches_and_live_posts_share_one_timeline(db):
+    meeting = await create_meeting(db)
+    repo = MessageRepository(db)
+
+    async def post(content):
+        await repo.create(MessageCreate(meeting_id=meeting.id, content=content, sender_type="user"), "User")
+
+    for i in range(3):
+        await post(f"live {i}")
+    await repo.create_many(meeting.id, [MessageBatchItem(content=f"batch {i}", sender_type="user") for i in range(3)], ["User"] * 3)
+    for i in range(3, 6):
+        await post(f"live {i}")
+
+    messages = await repo.get_by_meeting_id(meeting.id)
+    assert [m.content for m in messages] == (
+        [f"live {i}" for i in range(3)] + [f"batch {i}" for i in range(3)] + [f"live {i}" for i in range(3, 6)]
+    )
+
+
+async def test_imported_messages_with_equal_timestamps_keep_batch_order(db):
+    meeting = await create_meeting(db)
+    repo = MessageRepository(db)
+    tied = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    await repo.create_many(
+        meeting.id,
+        [MessageBatchItem(content=f"imported {i}", sender_type="user", timestamp=tied) for i in range(10)],
+        ["User"] * 10
+    )
+
+    messages = await repo.get_by_meeting_id(meeting.id)
+    assert [m.content for m in messages] == [f"imported {i}" for i in range(10)]
@@ -0,0 +1,24 @@
+"""
+Response generation around the database session.
+"""
+from app.models.message import MessageCreate
+from app.services.llm_service import llm_service
+from app.services.message_service import MessageService
+from tests.conftest import create_meeting
+
+
+async def test_round_table_holds_no_transaction_while_llm_runs(db, monkeypatch):
+    meeting = await create_meeting(db, employees=3)
+    await MessageService.send_message(meeting.id, MessageCreate(meeting_id=meeting.id, content="Status?", sender_type="user"), db)
+
+    in_transaction = []
+
+    async def reply(employee, history, raise_errors=False, summary=None):
+        in_transaction.append(db.in_transaction())
+        return f"{employee.name} is on track."
+
+    monkeypatch.setattr(llm_service, "generate_response", reply)
+    messages = await MessageService.generate_round_table_responses(meeting.id, db)
+
+    assert in_transaction == [False, False, False]
+    assert sorted(m.content for m in messages) == [f"Employee {i} is on track." for i in range(3)]
@@ -0,0 +1,70 @@
+"""
+LLM response cache: hits and coalescing of concurrent identical requests.
+"""
+import asyncio
+
+import pytest
+
+from app.database.cache import MemoryCacheBackend
+from app.services.response_cache import ResponseCache
+
+
+def make_create(calls: list, result="Sounds good.", release: asyncio.Event = None):
+    async def create() -> str:
+        calls.append(1)
+        if release is not None:
+            await release.wait()
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return create
+
+
+async def test_concurrent_identical_requests_share_one_call():
+    cache = ResponseCache(MemoryCacheBackend(100))
+    calls, release = [], asyncio.Event()
+    create = make_create(calls, release=release)
+
+    requests = [asyncio.create_task(cache.get_or_create("k", create)) for _ in range(5)]
+    await asyncio.sleep(0.01)
+    release.set()
+
+    assert await asyncio.gather(*requests) == ["Sounds good."] * 5
+    assert len(calls) == 1
+    assert (cache.misses, cache.coalesced) == (1, 4)
+
+    assert await cache.get_or_create("k", create) == "Sounds good."
+    assert (len(calls), cache.hits) == (1, 1)
+
+
+async def test_a_failed_call_reaches_every_waiter_and_is_not_cached():
+    cache = ResponseCache(MemoryCacheBackend(100))
+    calls, release = [], asyncio.Event()
+    failing = make_create(calls, result=RuntimeError("rate limited"), release=release)
+
+    requests = [asyncio.create_task(cache.get_or_create("k", failing)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*requests, return_exceptions=True)
+
+    assert [str(result) for result in results] == ["rate limited"] * 3
+    assert (len(calls), cache.errors) == (1, 1)
+    assert await cache.get_or_create("k", make_create(calls)) == "Sounds good."
+
+
+async def test_waiters_take_over_when_the_leader_is_cancelled():
+    cache = ResponseCache(MemoryCacheBackend(100))
+    calls, release = [], asyncio.Event()
+    create = make_create(calls, release=release)
+
+    leader = asyncio.create_task(cache.get_or_create("k", create))
+    await asyncio.sleep(0.01)
+    waiter = asyncio.create_task(cache.get_or_create("k", create))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    release.set()
+
+    assert await waiter == "Sounds good."
+    assert len(calls) == 2
@@ -0,0 +1,39 @@
+"""
+Entry point for standalone crew job workers.
+"""
+import argparse
+import asyncio
+import signal
+
+from app.services.job_worker import JobWorker
+from app.services.message_hub import message_hub
+from app.services.preload import preloader
+
+
+async def main(concurrency: int) -> None:
+    worker = JobWorker(concurrency=concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: asyncio.ensure_future(worker.stop()))
+
+    # Forward the replies this worker creates to the API processes' subscribers
+    await message_hub.start()
+
+    # Load CrewAI while the first jobs are claimed rather than inside the first crew run
+    await preloader.start()
+
+    print(f"Job worker {worker.worker_id} started with {concurrency} slot(s)")
+    try:
+        await worker.run()
+    finally:
+        await preloader.stop()
+        await message_hub.stop()
+    print(f"Job worker {worker.worker_id} stopped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run crew response job workers.")
+    parser.add_argument("--concurrency", type=int, default=1, help="Jobs to run at once in this process")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.concurrency))
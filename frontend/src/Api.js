@@ -13,7 +13,48 @@ const api = {
     delete: (endpoint) => 
         fetch(`${API_BASE}${endpoint}`, {
             method: 'DELETE',
-        }).then(res => res.json())
+        }).then(res => res.json()),
+    // POST and read a server-sent event stream, calling onEvent(event, data) per frame
+    stream: async (endpoint, onEvent) => {
+        const res = await fetch(`${API_BASE}${endpoint}`, { method: 'POST' });
+        if (!res.ok) {
+            const error = await res.json().catch(() => ({}));
+            throw new Error(error.detail || res.statusText);
+        }
+
+        const reader = res.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const frame = buffer.slice(0, boundary);
+                buffer = buffer.slice(boundary + 2);
+
+                let event = 'message';
+                let data = '';
+                frame.split('\n').forEach(line => {
+                    if (line.startsWith('event: ')) event = line.slice(7);
+                    else if (line.startsWith('data: ')) data += line.slice(6);
+                });
+                onEvent(event, data ? JSON.parse(data) : null);
+            }
+        }
+    },
+    // Open a server-sent event subscription, calling onEvent(event, data) per event; returns a close function.
+    // The browser reconnects on its own and resumes from the last event ID.
+    subscribe: (endpoint, events, onEvent) => {
+        const source = new EventSource(`${API_BASE}${endpoint}`);
+        events.forEach(event => {
+            source.addEventListener(event, (e) => onEvent(event, e.data ? JSON.parse(e.data) : null));
+        });
+        return () => source.close();
+    }
 };
 
 export default api;
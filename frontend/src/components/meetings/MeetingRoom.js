@@ -1,28 +1,49 @@
-import React, { useState, useEffect, useCallback } from "react";
+import React, { useState, useEffect } from "react";
 import api from "../../Api";
 
+// Messages per history page, matching the backend's default MESSAGES_PAGE_SIZE
+const PAGE_SIZE = 100;
+
 function MeetingRoom({ meeting, employees, onExit }) {
     const [messages, setMessages] = useState([]);
     const [newMessage, setNewMessage] = useState('');
     const [loading, setLoading] = useState(false);
+    const [pending, setPending] = useState(null);
+    const [loadingOlder, setLoadingOlder] = useState(false);
+    const [olderExhausted, setOlderExhausted] = useState(false);
 
     const meetingEmployees = employees.filter(emp => meeting.employee_ids.includes(emp.id));
 
-    const loadMessages = useCallback(async () => {
+    useEffect(() => {
+        setMessages([]);
+        setOlderExhausted(false);
+        // The stream sends the latest page of history, then every new message as it is created
+        return api.subscribe(`/meetings/${meeting.id}/messages/stream`, ['message', 'error'], (event, data) => {
+            if (event === 'message') {
+                setMessages(prev => prev.some(msg => msg.id === data.id) ? prev : [...prev, data]);
+            } else if (event === 'error' && data) {
+                console.error("Error loading messages:", data.detail);
+            }
+        });
+    }, [meeting.id]);
+
+    // Page backwards through the history the stream's first page does not cover
+    const loadOlder = async () => {
+        if (!messages.length || loadingOlder) return;
+
         try {
-            const response = await api.get(`/meetings/${meeting.id}/messages`);
-            // Handle different response structures
-            const messagesData = response.data || response || [];
-            setMessages(Array.isArray(messagesData) ? messagesData : []);
+            setLoadingOlder(true);
+            const older = await api.get(`/meetings/${meeting.id}/messages?before=${messages[0].id}&limit=${PAGE_SIZE}`);
+            if (!Array.isArray(older)) throw new Error(older.detail || 'Unexpected response');
+
+            setMessages(prev => [...older.filter(msg => !prev.some(p => p.id === msg.id)), ...prev]);
+            if (older.length < PAGE_SIZE) setOlderExhausted(true);
         } catch (error) {
-            console.error("Error loading messages:", error);
-            setMessages([]); // Set empty array on error
+            alert("Error loading older messages: " + error.message);
+        } finally {
+            setLoadingOlder(false);
         }
-    }, [meeting.id]);
-
-    useEffect(() => {
-        loadMessages();
-    }, [loadMessages]);
+    };
 
     const sendMessage = async (e) => {
         e.preventDefault();
@@ -37,7 +58,6 @@ function MeetingRoom({ meeting, employees, onExit }) {
             });
 
             setNewMessage('');
-            await loadMessages();
         } catch (error) {
             alert("Error sending message: " + error.message);
         } finally {
@@ -48,11 +68,20 @@ function MeetingRoom({ meeting, employees, onExit }) {
     const requestResponse = async (employeeId) => {
         try {
             setLoading(true);
-            await api.post(`/meetings/${meeting.id}/messages/${employeeId}/respond`);
-            await loadMessages();
+            setPending({ status: 'Thinking...', content: '' });
+            await api.stream(`/meetings/${meeting.id}/messages/${employeeId}/respond/stream`, (event, data) => {
+                if (event === 'step') {
+                    setPending(prev => ({ ...prev, status: data.thought || data.tool || 'Working...' }));
+                } else if (event === 'token') {
+                    setPending(prev => ({ ...prev, content: prev.content + data.content }));
+                } else if (event === 'error') {
+                    throw new Error(data.detail);
+                }
+            });
         } catch (error) {
             alert("Error responding to message: " + error.message);
         } finally {
+            setPending(null);
             setLoading(false);
         }
     };
@@ -92,6 +121,11 @@ function MeetingRoom({ meeting, employees, onExit }) {
             )}
 
             <div className="messages-container">
+                {!olderExhausted && messages.length >= PAGE_SIZE && (
+                    <button onClick={loadOlder} className="load-older-btn" disabled={loadingOlder}>
+                        {loadingOlder ? 'Loading...' : 'Load older messages'}
+                    </button>
+                )}
                 {messages && messages.length > 0 ? (
                     messages.map(msg => (
                         <div key={msg.id} className={`message ${msg.sender_type}`}>
@@ -111,11 +145,19 @@ function MeetingRoom({ meeting, employees, onExit }) {
                             </div>
                         </div>
                     ))
-                ) : (
+                ) : !pending && (
                     <div className="empty-messages">
                         <p>No messages yet. Start the conversation!</p>
                     </div>
                 )}
+                {pending && (
+                    <div className="message employee">
+                        <div className="message-header">
+                            <strong>{pending.status}</strong>
+                        </div>
+                        <div className="message-content">{pending.content}</div>
+                    </div>
+                )}
             </div>
 
             <div className="meeting-controls">